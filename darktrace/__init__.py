@@ -6,31 +6,31 @@ from .auth import DarktraceAuth
 from .client import DarktraceClient
 from .dt_advanced_search import AdvancedSearch
 from .dt_analyst import Analyst
-from .dt_antigena import Antigena
-from .dt_breaches import ModelBreaches
+from .dt_antigena import ActionEvent, ActionKeeper, ActionWatcher, Antigena
+from .dt_breaches import Breach, ModelBreaches
 from .dt_components import Components
 from .dt_cves import CVEs
 from .dt_details import Details
 from .dt_deviceinfo import DeviceInfo
-from .dt_devices import Devices
+from .dt_devices import DeviceChange, DeviceHydrator, DeviceIndex, DeviceMirror, DeviceRecord, Devices
 from .dt_devicesearch import DeviceSearch
 from .dt_devicesummary import DeviceSummary
-from .dt_email import DarktraceEmail
+from .dt_email import AuditEventFollower, DarktraceEmail
 from .dt_endpointdetails import EndpointDetails
-from .dt_enums import Enums
+from .dt_enums import EnumDecoder, Enums
 from .dt_filtertypes import FilterTypes
-from .dt_intelfeed import IntelFeed
+from .dt_intelfeed import IntelFeed, IntelMatcher
 from .dt_mbcomments import MBComments
 from .dt_metricdata import MetricData
 from .dt_metrics import Metrics
-from .dt_models import Models
+from .dt_models import ModelCatalog, Models
 from .dt_network import Network
 from .dt_pcaps import PCAPs
 from .dt_similardevices import SimilarDevices
 from .dt_status import Status
-from .dt_subnets import Subnets
+from .dt_subnets import SubnetResolver, Subnets
 from .dt_summarystatistics import SummaryStatistics
-from .dt_tags import Tags
+from .dt_tags import DeviceSet, TagIndex, Tags
 from .dt_utils import TimeoutType, debug_print
 from .exceptions import (
     AuthenticationError,
@@ -44,11 +44,16 @@ from .exceptions import (
 )
 
 __all__ = [
+    "ActionEvent",
+    "ActionKeeper",
+    "ActionWatcher",
     "AdvancedSearch",
     "Analyst",
     "Antigena",
+    "AuditEventFollower",
     "AuthenticationError",
     "BadRequestError",
+    "Breach",
     "CVEs",
     "Components",
     "ConnectionError",
@@ -57,19 +62,28 @@ __all__ = [
     "DarktraceError",
     "DarktraceEmail",
     "Details",
+    "DeviceChange",
+    "DeviceHydrator",
+    "DeviceIndex",
     "DeviceInfo",
+    "DeviceMirror",
+    "DeviceRecord",
     "DeviceSearch",
+    "DeviceSet",
     "DeviceSummary",
     "Devices",
     "EndpointDetails",
+    "EnumDecoder",
     "Enums",
     "FilterTypes",
     "ForbiddenError",
     "IntelFeed",
+    "IntelMatcher",
     "MBComments",
     "MetricData",
     "Metrics",
     "ModelBreaches",
+    "ModelCatalog",
     "Models",
     "Network",
     "NotFoundError",
@@ -78,8 +92,10 @@ __all__ = [
     "ServerError",
     "SimilarDevices",
     "Status",
+    "SubnetResolver",
     "Subnets",
     "SummaryStatistics",
+    "TagIndex",
     "Tags",
     "TimeoutType",
     "debug_print",
@@ -63,6 +63,7 @@ class DarktraceClient:
     debug: bool
     verify_ssl: bool
     timeout: TimeoutType
+    compact_json: bool
     advanced_search: AdvancedSearch
     antigena: Antigena
     analyst: Analyst
@@ -99,6 +100,7 @@ class DarktraceClient:
         debug: bool = False,
         verify_ssl: bool = True,
         timeout: TimeoutType = None,
+        compact_json: bool = False,
     ) -> None:
         """
         Initialize the Darktrace API client.
@@ -112,6 +114,9 @@ class DarktraceClient:
                 Set to False only for development/testing with self-signed certificates.
             timeout (float|tuple, optional): Request timeout in seconds. Can be a single float
                 or a tuple of (connect_timeout, read_timeout). None means no timeout (default).
+            compact_json (bool, optional): Decode GET responses with repeated strings and identical
+                sub-objects (e.g. device blocks) shared rather than duplicated. Cuts memory on large
+                responses; shared objects are aliased, so treat results as read-only. Defaults to False.
 
         Example:
             >>> client = DarktraceClient(
@@ -136,6 +141,7 @@ class DarktraceClient:
         self.debug = debug
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        self.compact_json = compact_json
         self._session: requests.Session = requests.Session()
         # Endpoint groups
         self.advanced_search = AdvancedSearch(self)
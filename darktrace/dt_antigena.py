@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import threading
+import time
 import warnings
-from typing import Any
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
 
-from .dt_utils import _UNSET, BaseEndpoint
+from .dt_utils import _UNSET, BaseEndpoint, _epoch_seconds, _run_bulk
+
+__all__ = ["ActionEvent", "ActionKeeper", "ActionWatcher", "Antigena"]
 
 
 class Antigena(BaseEndpoint):
@@ -387,3 +394,592 @@ class Antigena(BaseEndpoint):
         endpoint = "/antigena/summary"
 
         return self._get(endpoint, params=params, timeout=timeout)
+
+    def bulk_create_actions(
+        self,
+        dids: Iterable[int],
+        action: str,
+        duration: int,
+        reason: str = "",
+        connections: list[dict[str, str | int]] | None = None,
+        rollback: bool = False,
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Create the same manual RESPOND action against many devices concurrently.
+
+        Args:
+            dids (iterable of int): Devices to act on.
+            action (str): Action type, as for :meth:`create_manual_action` (e.g. 'quarantine').
+            duration (int): Duration of each action in seconds.
+            reason (str, optional): Reason recorded on every action.
+            connections (list, optional): Connection pairs for the 'connection' action type.
+            rollback (bool, optional): If any device fails, clear every action created by this
+                call so the batch is all-or-nothing. Defaults to False.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            rate_limit (float, optional): Maximum requests started per second.
+            progress (callable, optional): Called as ``progress(done, total)`` after each device.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+
+        Returns:
+            dict: ``{"created": {did: codeid}, "failed": [{"did", "error"}], "rolled_back": [codeid],
+            "rollback_failed": [{"codeid", "error"}]}``. After a rollback, ``created`` still lists
+            the codeids that were created (and then cleared).
+        """
+
+        def create(did: int) -> int:
+            response = self.create_manual_action(
+                did, action, duration, reason=reason, connections=connections, timeout=timeout
+            )
+            codeid = response.get("codeid") if isinstance(response, dict) else response
+            if not codeid or isinstance(codeid, bool):
+                raise ValueError(f"No codeid returned for did {did}: {response!r}")
+            return codeid
+
+        report: dict[str, Any] = {"created": {}, "failed": [], "rolled_back": [], "rollback_failed": []}
+        for did, codeid, error in _run_bulk(
+            create, dict.fromkeys(dids), max_workers=max_workers, progress=progress, rate_limit=rate_limit
+        ):
+            if error is None:
+                report["created"][did] = codeid
+            else:
+                report["failed"].append({"did": did, "error": error})
+
+        if rollback and report["failed"] and report["created"]:
+            undo = self.bulk_clear_actions(
+                report["created"].values(),
+                reason=f"Rollback: {reason}" if reason else "Rollback",
+                max_workers=max_workers,
+                rate_limit=rate_limit,
+                timeout=timeout,
+            )
+            report["rolled_back"] = undo["succeeded"]
+            report["rollback_failed"] = undo["failed"]
+        return report
+
+    def bulk_extend_actions(
+        self,
+        codeids: Iterable[int],
+        duration: int,
+        reason: str = "",
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Extend many RESPOND actions concurrently (see :meth:`extend_action` for ``duration``).
+
+        Returns:
+            dict: ``{"succeeded": [codeid], "failed": [{"codeid", "error"}]}``.
+        """
+        return self._bulk_update(
+            lambda codeid: self.extend_action(codeid, duration, reason=reason, timeout=timeout),
+            codeids,
+            max_workers,
+            rate_limit,
+            progress,
+        )
+
+    def bulk_clear_actions(
+        self,
+        codeids: Iterable[int],
+        reason: str = "",
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Clear many RESPOND actions concurrently.
+
+        Returns:
+            dict: ``{"succeeded": [codeid], "failed": [{"codeid", "error"}]}``.
+        """
+        return self._bulk_update(
+            lambda codeid: self.clear_action(codeid, reason=reason, timeout=timeout),
+            codeids,
+            max_workers,
+            rate_limit,
+            progress,
+        )
+
+    def _bulk_update(
+        self,
+        func: Callable[[int], Any],
+        codeids: Iterable[int],
+        max_workers: int,
+        rate_limit: float | None,
+        progress: Callable[[int, int], None] | None,
+    ) -> dict:
+        report: dict[str, list] = {"succeeded": [], "failed": []}
+        for codeid, _, error in _run_bulk(
+            func, dict.fromkeys(codeids), max_workers=max_workers, progress=progress, rate_limit=rate_limit
+        ):
+            if error is None:
+                report["succeeded"].append(codeid)
+            else:
+                report["failed"].append({"codeid": codeid, "error": error})
+        return report
+
+
+def _action_list(response: dict | list) -> list[dict]:
+    """Normalize a ``/antigena`` response into a list of action dicts."""
+    if isinstance(response, dict):
+        response = response.get("actions") or []
+    return [action for action in response if isinstance(action, dict)] if isinstance(response, list) else []
+
+
+def _action_codeid(action: dict) -> int | None:
+    codeid = action.get("codeid", action.get("code"))
+    return codeid if isinstance(codeid, int) and not isinstance(codeid, bool) else None
+
+
+class ActionKeeper:
+    """Keep selected RESPOND actions alive by extending them just before they expire.
+
+    Action expiries are held in a timer wheel: each action sits in the slot of
+    ``resolution`` seconds in which it falls due (``lead`` seconds before expiry),
+    and only slots that have come due are touched. Everything due in the same
+    slot is extended together through :meth:`Antigena.bulk_extend_actions`, and
+    the new expiry is scheduled locally without re-reading it. ``/antigena`` is
+    only polled every ``refresh_interval`` seconds to pick up actions that were
+    cleared, extended elsewhere or newly selected, so polling load does not grow
+    with the number of kept actions.
+
+    Example::
+
+        keeper = ActionKeeper(client.antigena, duration=3600, lead=300)
+        keeper.keep(codeid)
+        keeper.run(stop_event)  # or call keeper.run_pending() from your own scheduler
+    """
+
+    def __init__(
+        self,
+        antigena: Antigena,
+        duration: int = 3600,
+        lead: int = 300,
+        resolution: int = 10,
+        refresh_interval: int = 300,
+        select: Callable[[dict], bool] | None = None,
+        reason: str = "",
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+    ) -> None:
+        """
+        Args:
+            antigena (Antigena): Antigena endpoint used for requests (e.g. ``client.antigena``).
+            duration (int, optional): Seconds each extension should cover from the moment it is
+                sent (the ``duration`` of :meth:`Antigena.extend_action`). Defaults to 3600.
+            lead (int, optional): Extend actions this many seconds before they expire. Defaults to 300.
+            resolution (int, optional): Width of a timer wheel slot in seconds; actions falling
+                due within the same slot are extended in one batch. Defaults to 10.
+            refresh_interval (int, optional): Seconds between ``/antigena`` refreshes. Defaults to 300.
+            select (callable, optional): Predicate over action dicts from ``/antigena``; matching
+                active actions are adopted automatically on refresh. By default only actions
+                passed to :meth:`keep` are extended.
+            reason (str, optional): Reason recorded on every extension.
+            max_workers (int, optional): Maximum concurrent extension requests. Defaults to 4.
+            rate_limit (float, optional): Maximum extension requests started per second.
+        """
+        if resolution <= 0:
+            raise ValueError("resolution must be positive.")
+        if not 0 <= lead < duration:
+            raise ValueError("lead must be non-negative and shorter than duration.")
+        self.antigena = antigena
+        self.duration = duration
+        self.lead = lead
+        self.resolution = resolution
+        self.refresh_interval = refresh_interval
+        self.select = select
+        self.reason = reason
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self._kept: dict[int, float | None] = {}  # codeid -> keep-until (epoch seconds) or None
+        self._expires: dict[int, float] = {}
+        self._due_slot: dict[int, int] = {}
+        self._wheel: dict[int, set[int]] = {}
+        self._slots: list[int] = []  # heap of occupied wheel slots
+        self._last_refresh: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._kept)
+
+    def __contains__(self, codeid: object) -> bool:
+        return codeid in self._kept
+
+    def expires(self, codeid: int) -> float | None:
+        """Return the last known expiry of ``codeid`` in epoch seconds, or ``None``."""
+        return self._expires.get(codeid)
+
+    def keep(self, codeid: int, until: float | None = None, expires: Any = None) -> None:
+        """
+        Start keeping an action alive.
+
+        Args:
+            codeid (int): RESPOND action to keep.
+            until (float, optional): Epoch seconds after which the action is left to expire.
+            expires (optional): Current expiry (epoch seconds/ms or ISO 8601) if already known;
+                otherwise it is read on the next refresh.
+        """
+        self._kept[codeid] = until
+        expiry = _epoch_seconds(expires)
+        if expiry is not None:
+            self._schedule(codeid, expiry)
+        elif codeid not in self._expires:
+            self._last_refresh = None
+
+    def release(self, codeid: int) -> None:
+        """Stop keeping an action alive; it expires normally. Unknown codeids are ignored."""
+        self._kept.pop(codeid, None)
+        self._expires.pop(codeid, None)
+        self._due_slot.pop(codeid, None)
+
+    def refresh(self, timeout: float | tuple[float, float] | None = _UNSET) -> int:
+        """
+        Reconcile kept actions with ``/antigena``.
+
+        Cleared, inactive or vanished actions are released, changed expiries are
+        rescheduled and actions matching ``select`` are adopted.
+
+        Returns:
+            int: Number of actions kept after the refresh.
+        """
+        actions = _action_list(self.antigena.get_actions(timeout=timeout))
+        seen: set[int] = set()
+        for action in actions:
+            codeid = _action_codeid(action)
+            if codeid is None:
+                continue
+            if codeid not in self._kept:
+                if self.select is None or not action.get("active") or not self.select(action):
+                    continue
+                self._kept[codeid] = None
+            if action.get("cleared") or action.get("active") is False:
+                self.release(codeid)
+                continue
+            seen.add(codeid)
+            expiry = _epoch_seconds(action.get("expires"))
+            if expiry is not None and expiry != self._expires.get(codeid):
+                self._schedule(codeid, expiry)
+        for codeid in [codeid for codeid in self._kept if codeid not in seen]:
+            self.release(codeid)
+        self._last_refresh = time.time()
+        return len(self._kept)
+
+    def next_due(self, now: float | None = None) -> float | None:
+        """Seconds until the next extension or refresh is due (0 if overdue), or ``None`` if idle."""
+        now = time.time() if now is None else now
+        while self._slots and not self._wheel.get(self._slots[0]):
+            self._wheel.pop(heapq.heappop(self._slots), None)
+        candidates = []
+        if self._slots:
+            candidates.append(self._slots[0] * self.resolution)
+        if self._kept or self.select is not None:
+            candidates.append(now if self._last_refresh is None else self._last_refresh + self.refresh_interval)
+        return max(0.0, min(candidates) - now) if candidates else None
+
+    def run_pending(
+        self,
+        now: float | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Refresh if due, then extend every action whose slot has come due.
+
+        Actions past their ``until`` are released instead of extended. A failed
+        extension is retried in the next slot while the action is still live.
+
+        Returns:
+            dict: ``{"extended": [codeid], "failed": [{"codeid", "error"}], "released": [codeid]}``.
+        """
+        now = time.time() if now is None else now
+        if (self._kept or self.select is not None) and (
+            self._last_refresh is None or now - self._last_refresh >= self.refresh_interval
+        ):
+            self.refresh(timeout=timeout)
+            self._last_refresh = now
+
+        report: dict[str, list] = {"extended": [], "failed": [], "released": []}
+        batches: dict[int, list[int]] = {}
+        for codeid in self._pop_due(now):
+            until = self._kept[codeid]
+            duration = self.duration if until is None else min(self.duration, int(until - now))
+            if duration <= self._expires[codeid] - now:
+                self.release(codeid)
+                report["released"].append(codeid)
+            else:
+                batches.setdefault(duration, []).append(codeid)
+
+        for duration, codeids in batches.items():
+            result = self.antigena.bulk_extend_actions(
+                codeids,
+                duration,
+                reason=self.reason,
+                max_workers=self.max_workers,
+                rate_limit=self.rate_limit,
+                timeout=timeout,
+            )
+            for codeid in result["succeeded"]:
+                if codeid in self._kept:
+                    self._schedule(codeid, now + duration)
+                    report["extended"].append(codeid)
+            for failure in result["failed"]:
+                codeid = failure["codeid"]
+                report["failed"].append(failure)
+                if codeid in self._expires and now + self.resolution < self._expires[codeid]:
+                    self._enqueue(codeid, int(now // self.resolution) + 1)
+                else:
+                    self.release(codeid)
+                    report["released"].append(codeid)
+        return report
+
+    def run(
+        self,
+        stop: threading.Event | None = None,
+        on_report: Callable[[dict], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> None:
+        """
+        Call :meth:`run_pending` whenever something is due, until ``stop`` is set.
+
+        Args:
+            stop (threading.Event, optional): Set to end the loop. Runs forever if omitted.
+            on_report (callable, optional): Called with each non-empty :meth:`run_pending` report.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            report = self.run_pending(timeout=timeout)
+            if on_report is not None and any(report.values()):
+                on_report(report)
+            wait = self.next_due()
+            stop.wait(self.refresh_interval if wait is None else max(wait, 0.1))
+
+    def _schedule(self, codeid: int, expires: float) -> None:
+        self._expires[codeid] = expires
+        self._enqueue(codeid, int((expires - self.lead) // self.resolution))
+
+    def _enqueue(self, codeid: int, slot: int) -> None:
+        self._due_slot[codeid] = slot
+        bucket = self._wheel.get(slot)
+        if bucket is None:
+            bucket = self._wheel[slot] = set()
+            heapq.heappush(self._slots, slot)
+        bucket.add(codeid)
+
+    def _pop_due(self, now: float) -> list[int]:
+        # Entries are removed lazily: a bucket member only fires if it is still kept and
+        # its current due slot is that bucket (it may have been rescheduled since)
+        current = int(now // self.resolution)
+        due = []
+        while self._slots and self._slots[0] <= current:
+            slot = heapq.heappop(self._slots)
+            for codeid in self._wheel.pop(slot, ()):
+                if self._due_slot.get(codeid) == slot and codeid in self._kept:
+                    del self._due_slot[codeid]
+                    due.append(codeid)
+        return due
+
+
+class ActionEvent(NamedTuple):
+    """A single change emitted by :class:`ActionWatcher`.
+
+    Attributes:
+        kind: ``"device_active"``, ``"device_inactive"``, ``"device_pending"`` or
+            ``"device_unpending"`` for summary changes; ``"action_added"``,
+            ``"action_changed"`` or ``"action_removed"`` for action list changes.
+        did: Device ID the change applies to.
+        codeid: RESPOND action ID (``None`` for summary changes).
+        action: Current action object (``None`` for summary changes and removals).
+        previous: Previous action object (``None`` for summary changes and additions).
+    """
+
+    kind: str
+    did: int | None
+    codeid: int | None = None
+    action: dict | None = None
+    previous: dict | None = None
+
+
+class ActionWatcher:
+    """Single poller turning RESPOND snapshots into change events.
+
+    Each :meth:`poll` reads the cheap ``/antigena/summary`` snapshot and diffs its
+    active and pending device sets. The full action list is only re-read when the
+    summary changed or every ``actions_every`` polls (to catch extensions and other
+    changes the summary does not show), and diffed by ``codeid``. The polling
+    interval adapts: it drops to ``min_interval`` whenever a poll produced events
+    and grows by ``backoff`` towards ``max_interval`` while nothing changes.
+
+    The first poll only records a baseline. Events go to every subscribed
+    callback and, if given, to an :class:`asyncio.Queue`.
+
+    Example::
+
+        watcher = ActionWatcher(client.antigena, callbacks=[print])
+        watcher.run(stop_event)
+
+        # or, inside asyncio
+        queue = asyncio.Queue()
+        watcher = ActionWatcher(client.antigena, queue=queue)
+        task = asyncio.create_task(watcher.run_async())
+        event = await queue.get()
+    """
+
+    def __init__(
+        self,
+        antigena: Antigena,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        backoff: float = 2.0,
+        actions_every: int = 10,
+        callbacks: Iterable[Callable[[ActionEvent], None]] = (),
+        queue: asyncio.Queue | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+        **params,
+    ) -> None:
+        """
+        Args:
+            antigena (Antigena): Antigena endpoint used for requests (e.g. ``client.antigena``).
+            min_interval (float, optional): Seconds between polls while state is changing. Defaults to 5.
+            max_interval (float, optional): Upper bound on the idle polling interval. Defaults to 120.
+            backoff (float, optional): Factor the interval grows by after a quiet poll. Defaults to 2.
+            actions_every (int, optional): Re-read the action list at least every N polls even
+                if the summary is unchanged. Defaults to 10.
+            callbacks (iterable of callable, optional): Called with each :class:`ActionEvent`.
+            queue (asyncio.Queue, optional): Queue each event is also put on.
+            loop (asyncio.AbstractEventLoop, optional): Loop owning ``queue``; events are handed
+                over thread-safely when set. :meth:`run_async` sets it automatically.
+            **params: Extra filters forwarded to :meth:`Antigena.get_actions` (e.g. ``includecleared=True``).
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and not greater than max_interval.")
+        self.antigena = antigena
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.actions_every = actions_every
+        self.callbacks = list(callbacks)
+        self.queue = queue
+        self.loop = loop
+        self.params = params
+        self.interval = min_interval
+        self._summary: tuple[frozenset[int], frozenset[int]] | None = None
+        self._actions: dict[int, dict] | None = None
+        self._polls_since_actions = 0
+
+    @property
+    def actions(self) -> dict[int, dict]:
+        """Last seen actions keyed by ``codeid``."""
+        return dict(self._actions or {})
+
+    @property
+    def active_devices(self) -> frozenset[int]:
+        """Devices with active actions at the last poll."""
+        return self._summary[0] if self._summary else frozenset()
+
+    @property
+    def pending_devices(self) -> frozenset[int]:
+        """Devices with pending actions at the last poll."""
+        return self._summary[1] if self._summary else frozenset()
+
+    def subscribe(self, callback: Callable[[ActionEvent], None]) -> None:
+        """Add a callback receiving every subsequent event."""
+        self.callbacks.append(callback)
+
+    def poll(self, timeout: float | tuple[float, float] | None = _UNSET) -> list[ActionEvent]:
+        """
+        Take one snapshot, emit the changes since the previous one and adapt the interval.
+
+        Returns:
+            list of ActionEvent: Events emitted by this poll (empty for the baseline poll).
+        """
+        summary = self.antigena.get_summary(timeout=timeout)
+        summary = summary if isinstance(summary, dict) else {}
+        current = (
+            frozenset(summary.get("activeActionDevices") or ()),
+            frozenset(summary.get("pendingActionDevices") or ()),
+        )
+        events: list[ActionEvent] = []
+        if self._summary is not None:
+            for kinds, before, after in zip(
+                (("device_active", "device_inactive"), ("device_pending", "device_unpending")),
+                self._summary,
+                current,
+            ):
+                events.extend(ActionEvent(kinds[0], did) for did in sorted(after - before))
+                events.extend(ActionEvent(kinds[1], did) for did in sorted(before - after))
+        summary_changed = current != self._summary
+        self._summary = current
+
+        self._polls_since_actions += 1
+        if self._actions is None or summary_changed or self._polls_since_actions >= self.actions_every:
+            events.extend(self._diff_actions(_action_list(self.antigena.get_actions(timeout=timeout, **self.params))))
+            self._polls_since_actions = 0
+
+        self.interval = self.min_interval if events else min(self.interval * self.backoff, self.max_interval)
+        for event in events:
+            self._emit(event)
+        return events
+
+    def run(
+        self,
+        stop: threading.Event | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> None:
+        """Poll every :attr:`interval` seconds until ``stop`` is set (forever if omitted)."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll(timeout=timeout)
+            stop.wait(self.interval)
+
+    async def run_async(
+        self,
+        stop: asyncio.Event | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> None:
+        """Asyncio variant of :meth:`run`; requests run in the default executor."""
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            await loop.run_in_executor(None, lambda: self.poll(timeout=timeout))
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _diff_actions(self, actions: list[dict]) -> list[ActionEvent]:
+        current = {}
+        for action in actions:
+            codeid = _action_codeid(action)
+            if codeid is not None:
+                current[codeid] = action
+        previous_actions, self._actions = self._actions, current
+        if previous_actions is None:
+            return []
+        events = []
+        for codeid, action in current.items():
+            previous = previous_actions.get(codeid)
+            if previous is None:
+                events.append(ActionEvent("action_added", action.get("did"), codeid, action, None))
+            elif previous != action:
+                events.append(ActionEvent("action_changed", action.get("did"), codeid, action, previous))
+        for codeid, previous in previous_actions.items():
+            if codeid not in current:
+                events.append(ActionEvent("action_removed", previous.get("did"), codeid, None, previous))
+        return events
+
+    def _emit(self, event: ActionEvent) -> None:
+        for callback in self.callbacks:
+            callback(event)
+        if self.queue is not None:
+            if self.loop is not None:
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+            else:
+                self.queue.put_nowait(event)
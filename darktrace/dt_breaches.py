@@ -1,10 +1,133 @@
 from __future__ import annotations
 
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
-from .dt_utils import _UNSET, BaseEndpoint
+from .dt_utils import _UNSET, BaseEndpoint, _run_bulk
 
-__all__ = ["ModelBreaches"]
+__all__ = ["Breach", "ModelBreaches"]
+
+_WHITESPACE = " \t\n\r"
+
+
+class Breach:
+    """Compact model breach record decoded lazily from the raw response.
+
+    Only the hot fields (``pbid``, ``time``, ``score``, ``did`` and the model
+    ``pid``) are kept as attributes; the rest of the breach (``model``,
+    ``triggeredComponents``, ``device``, ...) stays as its raw JSON bytes and is
+    parsed on first access through ``breach["key"]``, :meth:`get` or
+    :meth:`to_dict`. Records use ``__slots__`` and hold no per-instance dict.
+
+    Returned by ``ModelBreaches.get(typed=True)``.
+    """
+
+    __slots__ = ("pbid", "time", "score", "did", "pid", "_raw", "_data")
+
+    def __init__(
+        self,
+        raw: bytes,
+        pbid: int | None = None,
+        time: int | None = None,
+        score: float | None = None,
+        did: int | None = None,
+        pid: int | None = None,
+    ) -> None:
+        self.pbid = pbid
+        self.time = time
+        self.score = score
+        self.did = did
+        self.pid = pid
+        self._raw = raw
+        self._data: dict | None = None
+
+    @classmethod
+    def from_dict(cls, breach: dict, raw: bytes | None = None) -> Breach:
+        """Build a record from a decoded breach dict, keeping ``raw`` (or its re-encoding) for lazy access."""
+        if raw is None:
+            raw = json.dumps(breach, separators=(",", ":")).encode()
+        device = breach.get("device")
+        model = breach.get("model")
+        if isinstance(model, dict):
+            # Full breaches describe the model as it was ("then") and is ("now")
+            model = model.get("then") or model.get("now") or model
+        return cls(
+            raw,
+            pbid=breach.get("pbid"),
+            time=breach.get("time"),
+            score=breach.get("score"),
+            did=device.get("did") if isinstance(device, dict) else breach.get("did"),
+            pid=model.get("pid") if isinstance(model, dict) else model,
+        )
+
+    def __repr__(self) -> str:
+        return f"<Breach pbid={self.pbid} did={self.did} pid={self.pid} score={self.score}>"
+
+    def __getitem__(self, key: str) -> Any:
+        return self.to_dict()[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.to_dict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a breach field, decoding the raw record on first access."""
+        return self.to_dict().get(key, default)
+
+    def to_dict(self) -> dict:
+        """Return the full breach dict (decoded once, then cached on the record)."""
+        if self._data is None:
+            self._data = json.loads(self._raw)
+        return self._data
+
+    def release(self) -> None:
+        """Drop the decoded dict so the record goes back to its compact form."""
+        self._data = None
+
+    @property
+    def raw(self) -> bytes:
+        """The undecoded JSON of this breach."""
+        return self._raw
+
+    @property
+    def model(self) -> dict | None:
+        return self.get("model")
+
+    @property
+    def device(self) -> dict | None:
+        return self.get("device")
+
+    @property
+    def triggered_components(self) -> list:
+        return self.get("triggeredComponents") or []
+
+
+def _iter_breach_records(body: bytes) -> Iterator[Breach]:
+    # Walk the top-level JSON array element by element so each breach is decoded only
+    # transiently (to read the hot fields) while its raw slice is what gets kept
+    text = body.decode("utf-8")
+    decoder = json.JSONDecoder()
+    position = len(text) - len(text.lstrip(_WHITESPACE))
+    if not text.startswith("[", position):
+        breach, end = decoder.raw_decode(text, position)
+        if isinstance(breach, dict):
+            yield Breach.from_dict(breach, text[position:end].encode())
+        return
+    position += 1
+    while True:
+        while position < len(text) and text[position] in _WHITESPACE:
+            position += 1
+        if position >= len(text) or text[position] == "]":
+            return
+        breach, end = decoder.raw_decode(text, position)
+        if isinstance(breach, dict):
+            yield Breach.from_dict(breach, text[position:end].encode())
+        position = end
+        while position < len(text) and text[position] in _WHITESPACE:
+            position += 1
+        if position < len(text) and text[position] == ",":
+            position += 1
 
 
 class ModelBreaches(BaseEndpoint):
@@ -16,11 +139,18 @@ class ModelBreaches(BaseEndpoint):
     def get(
         self,
         timeout: float | tuple[float, float] | None = _UNSET,
+        typed: bool = False,
         **params,
     ) -> dict | list:
         """
         Get model breach alerts from the /modelbreaches endpoint.
 
+        Args:
+            timeout (float or tuple, optional): Timeout for the request in seconds.
+            typed (bool, optional): Return a list of compact :class:`Breach` records instead of dicts.
+                Hot fields are decoded eagerly; everything else is parsed from the raw JSON
+                on first access, which keeps large pulls small in memory.
+
         Parameters (all optional, see API docs for details):
             deviceattop (bool): Return device JSON at top-level (default: True)
             did (int): Device ID to filter by
@@ -46,7 +176,7 @@ class ModelBreaches(BaseEndpoint):
             fulldevicedetails (bool): Return full device/component info (if supported)
 
         Returns:
-            list or dict: API response containing model breach data
+            list or dict: API response containing model breach data (list of Breach if typed)
 
         Notes:
             - Time parameters must always be specified in pairs.
@@ -67,6 +197,8 @@ class ModelBreaches(BaseEndpoint):
         else:
             params_list = list(params.items())
 
+        if typed:
+            return list(_iter_breach_records(self._get_raw(endpoint, params=dict(params_list), timeout=timeout)))
         return self._get(endpoint, params=dict(params_list), timeout=timeout)
 
     def get_comments(
@@ -89,6 +221,79 @@ class ModelBreaches(BaseEndpoint):
         endpoint = f"/modelbreaches/{pbid}/comments"
         return self._get(endpoint, params=params, timeout=timeout)
 
+    def get_comments_bulk(
+        self,
+        pbids: Iterable[int],
+        starttime: int | None = None,
+        endtime: int | None = None,
+        strategy: str = "auto",
+        window_count: int = 10000,
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict[int, list | None]:
+        """
+        Get the comments of many model breaches, choosing the cheaper way to fetch them.
+
+        Two strategies are available:
+
+        - ``"window"``: one ``/mbcomments`` request for ``[starttime, endtime]`` (up to
+          ``window_count`` comments), filtered locally by pbid. If the window hits
+          ``window_count`` it may be truncated, so the per-pbid strategy is used instead.
+        - ``"per_pbid"``: concurrent ``/modelbreaches/<pbid>/comments`` requests.
+
+        ``"auto"`` (default) uses the window when ``starttime`` is given and there are more
+        breaches than ``max_workers`` (i.e. more than one round of concurrent requests).
+
+        Args:
+            pbids (iterable of int): Policy breach IDs.
+            starttime (int, optional): Earliest comment time (epoch ms), e.g. the oldest breach time.
+            endtime (int, optional): Latest comment time (epoch ms). Defaults to now.
+            strategy (str, optional): ``"auto"``, ``"window"`` or ``"per_pbid"``.
+            window_count (int, optional): ``count`` for the windowed request. Defaults to 10000.
+            max_workers (int, optional): Concurrent requests for the per-pbid strategy. Defaults to 4.
+            rate_limit (float, optional): Maximum per-pbid requests started per second.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+
+        Returns:
+            dict: ``{pbid: [comment, ...]}`` for every requested pbid (an empty list when it has
+            no comments, None when its per-pbid request failed).
+        """
+        if strategy not in ("auto", "window", "per_pbid"):
+            raise ValueError("strategy must be 'auto', 'window' or 'per_pbid'.")
+        pbids = list(dict.fromkeys(pbids))
+        if strategy == "auto":
+            strategy = "window" if starttime is not None and len(pbids) > max_workers else "per_pbid"
+
+        if strategy == "window" and pbids:
+            if starttime is None:
+                raise ValueError("starttime is required for the 'window' strategy.")
+            params = {
+                "starttime": starttime,
+                "endtime": int(time.time() * 1000) if endtime is None else endtime,
+                "count": window_count,
+            }
+            comments = self._get("/mbcomments", params=params, timeout=timeout)
+            if isinstance(comments, list) and len(comments) < window_count:
+                result: dict[int, list | None] = {pbid: [] for pbid in pbids}
+                for comment in comments:
+                    pbid = comment.get("pbid") if isinstance(comment, dict) else None
+                    if isinstance(pbid, str) and pbid.isdigit():
+                        pbid = int(pbid)
+                    if pbid in result:
+                        result[pbid].append(comment)
+                return result
+
+        result = {}
+        for pbid, comments, error in _run_bulk(
+            lambda pbid: self.get_comments(pbid, timeout=timeout),
+            pbids,
+            max_workers=max_workers,
+            rate_limit=rate_limit,
+        ):
+            result[pbid] = None if error is not None else comments if isinstance(comments, list) else []
+        return result
+
     def add_comment(
         self,
         pbid: int,
@@ -195,3 +400,86 @@ class ModelBreaches(BaseEndpoint):
         unack_response = self.unacknowledge(pbid, timeout=timeout, **params)
         comment_response = self.add_comment(pbid, message, timeout=timeout, **params)
         return {"unacknowledge": unack_response, "add_comment": comment_response}
+
+    def bulk_acknowledge(
+        self,
+        pbids: Iterable[int],
+        comment: str | None = None,
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Acknowledge many model breaches concurrently, optionally adding the same comment to each.
+
+        Unlike ``acknowledge(pbid=[...])``, requests run with bounded concurrency and a
+        failure is recorded in the report instead of aborting the remaining breaches.
+
+        Args:
+            pbids (iterable of int): Policy breach IDs to acknowledge.
+            comment (str, optional): Comment added to every successfully acknowledged breach.
+            max_workers (int, optional): Maximum concurrent breaches in flight. Defaults to 4.
+            rate_limit (float, optional): Maximum breaches started per second. Defaults to no limit.
+            progress (callable, optional): Called as ``progress(done, total)`` after each breach.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+
+        Returns:
+            dict: ``{"succeeded": [pbid, ...], "failed": [{"pbid", "step", "error"}, ...]}`` where
+            ``step`` is ``"acknowledge"`` or ``"comment"``.
+        """
+        return self._bulk_acknowledgement(
+            self.acknowledge, "acknowledge", pbids, comment, max_workers, rate_limit, progress, timeout
+        )
+
+    def bulk_unacknowledge(
+        self,
+        pbids: Iterable[int],
+        comment: str | None = None,
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Unacknowledge many model breaches concurrently, optionally adding the same comment to each.
+
+        Takes the same arguments and returns the same report as :meth:`bulk_acknowledge`,
+        with ``step`` being ``"unacknowledge"`` or ``"comment"``.
+        """
+        return self._bulk_acknowledgement(
+            self.unacknowledge, "unacknowledge", pbids, comment, max_workers, rate_limit, progress, timeout
+        )
+
+    def _bulk_acknowledgement(
+        self,
+        action: Callable[..., dict],
+        step: str,
+        pbids: Iterable[int],
+        comment: str | None,
+        max_workers: int,
+        rate_limit: float | None,
+        progress: Callable[[int, int], None] | None,
+        timeout: float | tuple[float, float] | None,
+    ) -> dict:
+        def apply(pbid: int) -> Exception | None:
+            action(pbid, timeout=timeout)
+            if comment:
+                # The state change already went through, so a failed comment is reported separately
+                try:
+                    self.add_comment(pbid, comment, timeout=timeout)
+                except Exception as e:
+                    return e
+            return None
+
+        report: dict[str, Any] = {"succeeded": [], "failed": []}
+        for pbid, comment_error, error in _run_bulk(
+            apply, dict.fromkeys(pbids), max_workers=max_workers, progress=progress, rate_limit=rate_limit
+        ):
+            if error is not None:
+                report["failed"].append({"pbid": pbid, "step": step, "error": error})
+            elif comment_error is not None:
+                report["failed"].append({"pbid": pbid, "step": "comment", "error": comment_error})
+            else:
+                report["succeeded"].append(pbid)
+        return report
@@ -1,9 +1,38 @@
 from __future__ import annotations
 
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any
+
 from .dt_utils import _UNSET, BaseEndpoint
 
 __all__ = ["Details"]
 
+# Stable column layout for exported connection events: (column, path into the event, type)
+_CONNECTION_COLUMNS: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("timems", ("timems",), "int64"),
+    ("time", ("time",), "string"),
+    ("eventType", ("eventType",), "string"),
+    ("action", ("action",), "string"),
+    ("uid", ("uid",), "string"),
+    ("direction", ("direction",), "string"),
+    ("status", ("status",), "string"),
+    ("protocol", ("protocol",), "string"),
+    ("applicationprotocol", ("applicationprotocol",), "string"),
+    ("sourcePort", ("sourcePort",), "int64"),
+    ("destinationPort", ("destinationPort",), "int64"),
+    ("source", ("source",), "string"),
+    ("destination", ("destination",), "string"),
+    ("sourceDid", ("sourceDevice", "did"), "int64"),
+    ("sourceIp", ("sourceDevice", "ip"), "string"),
+    ("sourceHostname", ("sourceDevice", "hostname"), "string"),
+    ("destinationDid", ("destinationDevice", "did"), "int64"),
+    ("destinationIp", ("destinationDevice", "ip"), "string"),
+    ("destinationHostname", ("destinationDevice", "hostname"), "string"),
+    ("info", ("info",), "string"),
+)
+
 
 class Details(BaseEndpoint):
     def get(
@@ -134,3 +163,116 @@ class Details(BaseEndpoint):
             params["responsedata"] = responsedata
 
         return self._get(endpoint, params=params, timeout=timeout)
+
+    def export(
+        self,
+        path: str,
+        starttime: int,
+        endtime: int,
+        window: int = 3_600_000,
+        format: str = "parquet",
+        eventtype: str = "connection",
+        timeout: float | tuple[float, float] | None = _UNSET,
+        **params,
+    ) -> dict[str, Any]:
+        """
+        Stream details events to partitioned Parquet (or NDJSON) files.
+
+        The time range is fetched in ``window``-sized slices. Each slice is converted to
+        one Arrow record batch with a stable connection-event schema, appended to the
+        partition file for the UTC day the window starts in (``path/date=YYYY-MM-DD/``) and released before the
+        next slice is requested, so memory is bounded by one window rather than the
+        whole export.
+
+        Parameters:
+            path (str): Output directory; created if missing.
+            starttime (int): Start time in ms since epoch.
+            endtime (int): End time in ms since epoch.
+            window (int, optional): Slice length in ms. Defaults to one hour.
+            format (str, optional): ``"parquet"`` (requires pyarrow) or ``"ndjson"``. Defaults to
+                ``"parquet"`` and falls back to ``"ndjson"`` when pyarrow is not installed.
+            eventtype (str, optional): Event type to export. Defaults to 'connection'.
+            timeout (float or tuple, optional): Request timeout in seconds.
+            **params: Filters forwarded to :meth:`get` (at least one of did, pbid, msg or
+                blockedconnections is required).
+
+        Returns:
+            dict: ``rows`` written, ``files`` touched and ``format`` used.
+        """
+        if format not in ("parquet", "ndjson"):
+            raise ValueError("format must be 'parquet' or 'ndjson'.")
+        if window <= 0:
+            raise ValueError("window must be positive.")
+        if endtime < starttime:
+            raise ValueError("endtime must not be before starttime.")
+
+        pa = pq = None
+        if format == "parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                format = "ndjson"
+
+        os.makedirs(path, exist_ok=True)
+        schema = pa.schema([(name, getattr(pa, kind)()) for name, _, kind in _CONNECTION_COLUMNS]) if pa else None
+        rows = 0
+        files: list[str] = []
+        partition = writer = None
+        try:
+            # Windows are inclusive on both ends, so step past the end so no event is fetched twice
+            for window_start in range(starttime, endtime + 1, window):
+                window_end = min(window_start + window - 1, endtime)
+                events = self.get(
+                    starttime=window_start,
+                    endtime=window_end,
+                    eventtype=eventtype,
+                    timeout=timeout,
+                    **params,
+                )
+                if not isinstance(events, list) or not events:
+                    continue
+
+                day = datetime.fromtimestamp(window_start / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+                if day != partition:
+                    if writer is not None:
+                        writer.close()
+                    partition_dir = os.path.join(path, f"date={day}")
+                    os.makedirs(partition_dir, exist_ok=True)
+                    filename = os.path.join(partition_dir, f"part-{window_start}.{format}")
+                    writer = (
+                        pq.ParquetWriter(filename, schema) if pq is not None else open(filename, "w", encoding="utf-8")
+                    )
+                    partition = day
+                    files.append(filename)
+
+                if pq is not None:
+                    arrays = [
+                        pa.array(_event_column(events, keys, kind), type=field.type)
+                        for (_, keys, kind), field in zip(_CONNECTION_COLUMNS, schema)
+                    ]
+                    writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                else:
+                    writer.writelines(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+                rows += len(events)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return {"rows": rows, "files": files, "format": format}
+
+
+def _event_column(events: list, keys: tuple[str, ...], kind: str) -> list:
+    """Extract one typed column from a list of event dicts (``None`` where missing or mistyped)."""
+    column = []
+    for event in events:
+        value: Any = event
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is None:
+            column.append(None)
+        elif kind == "int64":
+            column.append(value if isinstance(value, int) and not isinstance(value, bool) else None)
+        else:
+            column.append(value if isinstance(value, str) else str(value))
+    return column
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-from typing import Any
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
 
-from .dt_utils import _UNSET, BaseEndpoint
+from .dt_utils import _UNSET, BaseEndpoint, _iter_bulk, _run_bulk
 
-__all__ = ["Devices"]
+__all__ = ["DeviceChange", "DeviceHydrator", "DeviceIndex", "DeviceMirror", "DeviceRecord", "Devices"]
+
+# Upper bound accepted by the ``seensince`` parameter (6 months)
+_MAX_SEENSINCE_SECONDS = 180 * 24 * 3600
+
+# Keys holding device references in /modelbreaches, /details and /network responses
+_HYDRATED_FIELDS = ("device", "sourceDevice", "destinationDevice", "sourcedevice", "destinationdevice")
+
+# POST /devices fields that /devices reports under a different name
+_DEVICE_READ_FIELDS = {"type": "typeid"}
 
 
 class Devices(BaseEndpoint):
@@ -92,3 +104,550 @@ class Devices(BaseEndpoint):
         body.update(kwargs)
 
         return self._post_json(endpoint, body=body, timeout=timeout)
+
+    def bulk_update(
+        self,
+        changes: Iterable[tuple[int, dict[str, Any]]],
+        current: Iterable[dict] | None = None,
+        max_workers: int = 8,
+        rate_limit: float | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> list[dict]:
+        """Apply many device property updates, skipping those that change nothing.
+
+        Each change is diffed against a device view and only the fields that differ
+        are POSTed, with bounded concurrency. ``changes`` is consumed lazily while
+        requests are in flight, so large relabels can be fed straight from a CMDB
+        export without materializing it. The updates run when the method is called.
+
+        Args:
+            changes (iterable): ``(did, {"label": ..., "priority": ..., "type": ...})`` pairs.
+            current (iterable of dict, optional): Current device objects to diff against, such as
+                a ``/devices`` response or a :class:`DeviceMirror`. Fetched with one ``/devices``
+                pull when omitted. Devices missing from the view are always updated. Write fields
+                are compared with their read counterparts (``type`` with ``typeid``).
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 8.
+            rate_limit (float, optional): Maximum requests started per second.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+
+        Returns:
+            list: ``{"did", "status", "changes", "error"}`` per change in completion order, where
+            ``status`` is ``"updated"``, ``"unchanged"`` or ``"failed"`` and ``changes`` holds the
+            fields sent.
+
+        Example:
+            report = client.devices.bulk_update((row["did"], {"label": row["name"]}) for row in cmdb)
+            failed = [r for r in report if r["status"] == "failed"]
+        """
+        devices = _device_list(self.get(timeout=timeout)) if current is None else current
+        view = {device["did"]: device for device in devices if isinstance(device, dict) and "did" in device}
+        results: list[dict] = []
+
+        def pending() -> Iterator[tuple[int, dict[str, Any]]]:
+            for did, fields in changes:
+                device = view.get(did)
+                delta = {}
+                for key, value in fields.items():
+                    read_key = _DEVICE_READ_FIELDS.get(key, key)
+                    if device is None or read_key not in device or device[read_key] != value:
+                        delta[key] = value
+                if delta:
+                    yield did, delta
+                else:
+                    results.append({"did": did, "status": "unchanged", "changes": {}, "error": None})
+
+        for (did, delta), _, error in _iter_bulk(
+            lambda change: self.update(change[0], timeout=timeout, **change[1]),
+            pending(),
+            max_workers=max_workers,
+            rate_limit=rate_limit,
+        ):
+            results.append({"did": did, "status": "failed" if error else "updated", "changes": delta, "error": error})
+        return results
+
+
+class DeviceChange(NamedTuple):
+    """A single change emitted by :meth:`DeviceMirror.sync`.
+
+    Attributes:
+        kind: One of ``"added"``, ``"changed"`` or ``"removed"``.
+        did: Device ID the change applies to.
+        device: Current device object (``None`` for removals).
+        previous: Previously mirrored device object (``None`` for additions).
+    """
+
+    kind: str
+    did: int
+    device: dict | None
+    previous: dict | None
+
+
+def _device_list(response: dict | list) -> list[dict]:
+    """Normalize a ``/devices`` response into a list of device dicts."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        if "devices" in response:
+            return response["devices"] or []
+        if "did" in response:
+            return [response]
+    return []
+
+
+def _seensince_window(last_sync: float | None, now: float, overlap: int) -> int | None:
+    """Seconds to request via ``seensince``, or ``None`` when a full pull is required."""
+    if last_sync is None:
+        return None
+    window = int(now - last_sync) + overlap
+    return window if window <= _MAX_SEENSINCE_SECONDS else None
+
+
+class DeviceMirror:
+    """Local, did-indexed mirror of the ``/devices`` inventory.
+
+    The first :meth:`sync` bootstraps the mirror with a full ``/devices`` pull.
+    Subsequent syncs only request devices seen since the previous sync (plus a
+    small overlap), so steady-state cost scales with churn rather than estate
+    size. Removals can only be observed on a full pull; use ``full_sync_every``
+    or ``sync(full=True)`` to reconcile them periodically.
+
+    Example::
+
+        mirror = DeviceMirror(client.devices, full_sync_every=96)
+        for change in mirror.sync():
+            print(change.kind, change.did)
+    """
+
+    def __init__(
+        self,
+        devices: Devices,
+        overlap: int = 60,
+        full_sync_every: int | None = None,
+        volatile_fields: Iterable[str] = ("lastSeen",),
+        **params,
+    ) -> None:
+        """
+        Args:
+            devices (Devices): Devices endpoint used to fetch data (e.g. ``client.devices``).
+            overlap (int, optional): Extra seconds added to each incremental ``seensince``
+                window to avoid missing devices at the boundary. Defaults to 60.
+            full_sync_every (int, optional): Run a full pull (detecting removals) every N syncs.
+                None disables periodic full pulls.
+            volatile_fields (iterable of str, optional): Fields ignored when deciding whether a
+                device changed. Defaults to ``("lastSeen",)``.
+            **params: Extra filters forwarded to :meth:`Devices.get` (e.g. ``includetags=True``).
+        """
+        self.devices = devices
+        self.overlap = overlap
+        self.full_sync_every = full_sync_every
+        self.volatile_fields = frozenset(volatile_fields)
+        self.params = params
+        self._store: dict[int, dict] = {}
+        self._last_sync: float | None = None
+        self._syncs_since_full = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, did: object) -> bool:
+        return did in self._store
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._store.values())
+
+    def get(self, did: int) -> dict | None:
+        """Return the mirrored device for ``did``, or ``None`` if unknown."""
+        return self._store.get(did)
+
+    def sync(
+        self,
+        full: bool = False,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> list[DeviceChange]:
+        """
+        Refresh the mirror and return the changes since the previous sync.
+
+        Args:
+            full (bool, optional): Force a full ``/devices`` pull, which also detects removals.
+            timeout (float or tuple, optional): Request timeout in seconds.
+
+        Returns:
+            list of DeviceChange: Added, changed and removed devices.
+        """
+        now = time.time()
+        window = _seensince_window(self._last_sync, now, self.overlap)
+        if (
+            full
+            or window is None
+            or (self.full_sync_every is not None and self._syncs_since_full >= self.full_sync_every)
+        ):
+            response = self.devices.get(timeout=timeout, **self.params)
+            changes = self._apply(_device_list(response), full=True)
+            self._syncs_since_full = 0
+        else:
+            response = self.devices.get(seensince=str(window), timeout=timeout, **self.params)
+            changes = self._apply(_device_list(response), full=False)
+            self._syncs_since_full += 1
+        self._last_sync = now
+        return changes
+
+    def _apply(self, devices: list[dict], full: bool) -> list[DeviceChange]:
+        changes: list[DeviceChange] = []
+        seen: set[int] = set()
+        for device in devices:
+            did = device.get("did")
+            if did is None:
+                continue
+            seen.add(did)
+            previous = self._store.get(did)
+            self._store[did] = device
+            if previous is None:
+                changes.append(DeviceChange("added", did, device, None))
+            elif self._differs(previous, device):
+                changes.append(DeviceChange("changed", did, device, previous))
+        if full:
+            removed = [did for did in self._store if did not in seen]
+            for did in removed:
+                changes.append(DeviceChange("removed", did, None, self._store.pop(did)))
+        return changes
+
+    def _differs(self, previous: dict, device: dict) -> bool:
+        if not self.volatile_fields:
+            return previous != device
+        keys = (previous.keys() | device.keys()) - self.volatile_fields
+        return any(previous.get(key) != device.get(key) for key in keys)
+
+
+class DeviceRecord:
+    """Compact, slot-based device record held by :class:`DeviceIndex`.
+
+    Only the fields needed for enrichment are kept; repeated strings such as
+    vendor and type names are interned so they are shared across records.
+    """
+
+    __slots__ = ("did", "ip", "ips", "mac", "hostname", "label", "vendor", "typename", "sid", "priority", "last_seen")
+
+    def __init__(
+        self,
+        did: int,
+        ip: str | None = None,
+        ips: tuple[str, ...] = (),
+        mac: str | None = None,
+        hostname: str | None = None,
+        label: str | None = None,
+        vendor: str | None = None,
+        typename: str | None = None,
+        sid: int | None = None,
+        priority: int | None = None,
+        last_seen: int | None = None,
+    ) -> None:
+        self.did = did
+        self.ip = ip
+        self.ips = ips
+        self.mac = mac
+        self.hostname = hostname
+        self.label = label
+        self.vendor = vendor
+        self.typename = typename
+        self.sid = sid
+        self.priority = priority
+        self.last_seen = last_seen
+
+    @classmethod
+    def from_device(cls, device: dict) -> DeviceRecord:
+        """Build a record from a ``/devices`` device object."""
+        ips = tuple(entry["ip"] for entry in device.get("ips") or () if isinstance(entry, dict) and entry.get("ip"))
+        vendor = device.get("vendor")
+        typename = device.get("typename")
+        return cls(
+            did=device["did"],
+            ip=device.get("ip"),
+            ips=ips,
+            mac=device.get("macaddress") or device.get("mac"),
+            hostname=device.get("hostname"),
+            label=device.get("label"),
+            vendor=sys.intern(vendor) if isinstance(vendor, str) else vendor,
+            typename=sys.intern(typename) if isinstance(typename, str) else typename,
+            sid=device.get("sid"),
+            priority=device.get("priority"),
+            last_seen=device.get("lastSeen"),
+        )
+
+    def __repr__(self) -> str:
+        return f"<DeviceRecord did={self.did!r} ip={self.ip!r} hostname={self.hostname!r}>"
+
+
+class DeviceIndex:
+    """In-memory device index with O(1) lookup by did, IP, MAC and hostname.
+
+    :meth:`build` loads the inventory once from ``/devices``; :meth:`refresh`
+    pulls only devices seen since the last load and re-indexes them, so bulk
+    enrichment resolves locally instead of calling ``/devices?ip=`` per value.
+    MAC addresses, hostnames and IPs are matched case-insensitively. When two
+    devices share a key, the one seen most recently wins.
+
+    Example::
+
+        index = DeviceIndex(client.devices)
+        index.build()
+        record = index.by_ip("10.0.0.5")
+    """
+
+    def __init__(self, devices: Devices, overlap: int = 60, **params) -> None:
+        """
+        Args:
+            devices (Devices): Devices endpoint used to fetch data (e.g. ``client.devices``).
+            overlap (int, optional): Extra seconds added to each ``seensince`` refresh window.
+            **params: Extra filters forwarded to :meth:`Devices.get` (e.g. ``sid=12``).
+        """
+        self.devices = devices
+        self.overlap = overlap
+        self.params = params
+        self._by_did: dict[int, DeviceRecord] = {}
+        self._by_ip: dict[str, DeviceRecord] = {}
+        self._by_mac: dict[str, DeviceRecord] = {}
+        self._by_hostname: dict[str, DeviceRecord] = {}
+        self._last_sync: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._by_did)
+
+    def __contains__(self, did: object) -> bool:
+        return did in self._by_did
+
+    def __iter__(self) -> Iterator[DeviceRecord]:
+        return iter(self._by_did.values())
+
+    def build(self, timeout: float | tuple[float, float] | None = _UNSET) -> int:
+        """
+        Rebuild the index from a full ``/devices`` pull.
+
+        Args:
+            timeout (float or tuple, optional): Request timeout in seconds.
+
+        Returns:
+            int: Number of indexed devices.
+        """
+        now = time.time()
+        response = self.devices.get(timeout=timeout, **self.params)
+        self._by_did.clear()
+        self._by_ip.clear()
+        self._by_mac.clear()
+        self._by_hostname.clear()
+        self.add(_device_list(response))
+        self._last_sync = now
+        return len(self._by_did)
+
+    def refresh(self, timeout: float | tuple[float, float] | None = _UNSET) -> int:
+        """
+        Re-index devices seen since the last build or refresh.
+
+        Falls back to :meth:`build` when the index has never been loaded.
+
+        Args:
+            timeout (float or tuple, optional): Request timeout in seconds.
+
+        Returns:
+            int: Number of devices (re-)indexed by this call.
+        """
+        now = time.time()
+        window = _seensince_window(self._last_sync, now, self.overlap)
+        if window is None:
+            return self.build(timeout=timeout)
+        devices = _device_list(self.devices.get(seensince=str(window), timeout=timeout, **self.params))
+        self.add(devices)
+        self._last_sync = now
+        return len(devices)
+
+    def add(self, devices: Iterable[dict]) -> None:
+        """Index (or re-index) device objects, e.g. from a :class:`DeviceMirror` change feed."""
+        for device in devices:
+            if device.get("did") is None:
+                continue
+            record = DeviceRecord.from_device(device)
+            previous = self._by_did.get(record.did)
+            if previous is not None:
+                self._unlink(previous)
+            self._by_did[record.did] = record
+            for ip in (record.ip, *record.ips):
+                if ip:
+                    self._link(self._by_ip, ip.lower(), record)
+            if record.mac:
+                self._link(self._by_mac, record.mac.lower(), record)
+            if record.hostname:
+                self._link(self._by_hostname, record.hostname.lower(), record)
+
+    def by_did(self, did: int) -> DeviceRecord | None:
+        """Return the record for a device ID, or ``None``."""
+        return self._by_did.get(did)
+
+    def by_ip(self, ip: str) -> DeviceRecord | None:
+        """Return the device currently or previously holding ``ip``, or ``None``."""
+        return self._by_ip.get(ip.lower())
+
+    def by_mac(self, mac: str) -> DeviceRecord | None:
+        """Return the device with MAC address ``mac``, or ``None``."""
+        return self._by_mac.get(mac.lower())
+
+    def by_hostname(self, hostname: str) -> DeviceRecord | None:
+        """Return the device with ``hostname`` (case-insensitive), or ``None``."""
+        return self._by_hostname.get(hostname.lower())
+
+    @staticmethod
+    def _link(index: dict[str, DeviceRecord], key: str, record: DeviceRecord) -> None:
+        current = index.get(key)
+        if current is None or current is record or (record.last_seen or 0) >= (current.last_seen or 0):
+            index[key] = record
+
+    def _unlink(self, record: DeviceRecord) -> None:
+        for index, keys in (
+            (self._by_ip, [ip.lower() for ip in (record.ip, *record.ips) if ip]),
+            (self._by_mac, [record.mac.lower()] if record.mac else []),
+            (self._by_hostname, [record.hostname.lower()] if record.hostname else []),
+        ):
+            for key in keys:
+                if index.get(key) is record:
+                    del index[key]
+
+
+class DeviceHydrator:
+    """Attach cached device objects to compact breach, details and network responses.
+
+    Instead of asking the appliance for ``fulldevicedetails=True`` (which embeds a
+    full, often duplicated, device object in every row), fetch the compact form
+    and let the hydrator replace each device reference with the device from a
+    local ``did`` → device cache. Devices missing from the cache are fetched in
+    one round per call of concurrent per-device requests; a single full
+    ``/devices`` pull above ``bulk_threshold`` misses is available as an opt-in.
+
+    Example::
+
+        hydrator = DeviceHydrator(client.devices)
+        breaches = hydrator.hydrate(client.breaches.get(minscore=0.5))
+        events = hydrator.hydrate(client.details.get(did=123, count=500))
+    """
+
+    def __init__(
+        self,
+        devices: Devices,
+        fields: Iterable[str] = _HYDRATED_FIELDS,
+        merge: bool = False,
+        max_workers: int = 8,
+        bulk_threshold: int | None = None,
+    ) -> None:
+        """
+        Args:
+            devices (Devices): Devices endpoint used to fetch data (e.g. ``client.devices``).
+            fields (iterable of str, optional): Keys holding a device reference, either a
+                device ID or a compact device dict with a ``did``. Defaults to ``device``
+                (``/modelbreaches``), ``sourceDevice``/``destinationDevice`` (``/details``)
+                and ``sourcedevice``/``destinationdevice`` (``/network``).
+            merge (bool, optional): Merge the compact block over a copy of the cached device
+                (keeping per-row values) instead of attaching the shared cached object.
+                Defaults to False.
+            max_workers (int, optional): Concurrent requests when fetching misses. Defaults to 8.
+            bulk_threshold (int, optional): Above this many misses, pull the whole ``/devices``
+                estate once instead of one request per device. Defaults to None (never).
+        """
+        self.devices = devices
+        self.fields = frozenset(fields)
+        self.merge = merge
+        self.max_workers = max_workers
+        self.bulk_threshold = bulk_threshold
+        self._cache: dict[int, dict] = {}
+        self._missing: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, did: object) -> bool:
+        return did in self._cache
+
+    def get(self, did: int) -> dict | None:
+        """Return the cached device for ``did``, or ``None``."""
+        return self._cache.get(did)
+
+    def prime(self, devices: Iterable[dict]) -> None:
+        """Seed the cache with device dicts (e.g. a ``/devices`` response or a :class:`DeviceMirror`)."""
+        for device in devices:
+            did = device.get("did")
+            if did is not None:
+                self._cache[did] = device
+                self._missing.discard(did)
+
+    def invalidate(self, did: int | None = None) -> None:
+        """Forget one cached device, or the whole cache when ``did`` is None."""
+        if did is None:
+            self._cache.clear()
+            self._missing.clear()
+        else:
+            self._cache.pop(did, None)
+            self._missing.discard(did)
+
+    def fetch(self, dids: Iterable[int], timeout: float | tuple[float, float] | None = _UNSET) -> None:
+        """Make sure the given devices are cached, fetching only the misses in one concurrent round."""
+        misses = {did for did in dids if did not in self._cache and did not in self._missing}
+        if not misses:
+            return
+        failed: set[int] = set()
+        if self.bulk_threshold is not None and len(misses) > self.bulk_threshold:
+            self.prime(_device_list(self.devices.get(timeout=timeout)))
+        else:
+            results = _run_bulk(
+                lambda did: _device_list(self.devices.get(did=did, timeout=timeout)),
+                sorted(misses),
+                max_workers=self.max_workers,
+            )
+            for did, devices, error in results:
+                if error is None:
+                    self.prime(devices)
+                else:
+                    failed.add(did)
+        # Remember devices the appliance does not know so they are not requested again;
+        # failed requests are retried on the next call
+        self._missing.update(did for did in misses - failed if did not in self._cache)
+
+    def hydrate(
+        self,
+        data: Any,
+        fields: Iterable[str] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> Any:
+        """
+        Replace device references in a response with cached device objects, in place.
+
+        Args:
+            data: Response from ``/modelbreaches``, ``/details``, ``/network`` or similar.
+                Nested dicts and lists are walked.
+            fields (iterable of str, optional): Override the keys holding device references.
+            timeout (float or tuple, optional): Request timeout in seconds for fetching misses.
+
+        Returns:
+            The same ``data`` object. References to unknown devices are left unchanged.
+        """
+        wanted = self.fields if fields is None else frozenset(fields)
+        refs: list[tuple[dict, str, int]] = []
+
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                for key, value in node.items():
+                    if key in wanted:
+                        did = value.get("did") if isinstance(value, dict) else value
+                        if isinstance(did, int) and not isinstance(did, bool):
+                            refs.append((node, key, did))
+                            continue
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+
+        self.fetch((did for _, _, did in refs), timeout=timeout)
+        for node, key, did in refs:
+            device = self._cache.get(did)
+            if device is None:
+                continue
+            value = node[key]
+            node[key] = {**device, **value} if self.merge and isinstance(value, dict) else device
+        return data
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
-from .dt_utils import _UNSET, BaseEndpoint
-from .exceptions import _raise_for_status
+from .dt_utils import _UNSET, BaseEndpoint, _epoch_seconds, _iter_bulk, _run_bulk
+from .exceptions import ConnectionError as DarktraceConnectionError
+from .exceptions import RateLimitError, ServerError, _raise_for_status
 
-__all__ = ["DarktraceEmail"]
+__all__ = ["AuditEventFollower", "DarktraceEmail"]
+
+# Failures worth another attempt once the transport-level retries are exhausted
+_TRANSIENT_ERRORS = (DarktraceConnectionError, RateLimitError, ServerError)
 
 
 class DarktraceEmail(BaseEndpoint):
@@ -196,6 +206,147 @@ class DarktraceEmail(BaseEndpoint):
         endpoint = "/agemail/api/ep/api/v1.0/emails/search"
         return self._post_json(endpoint, body=data, timeout=timeout)
 
+    def bulk_email_action(
+        self,
+        emails: dict[str, Any] | Iterable[str],
+        data: dict[str, Any],
+        page_size: int = 100,
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        retries: int = 1,
+        retry_wait: float = 5.0,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Apply the same action to many emails concurrently.
+
+        Emails are given either as UUIDs or as a :meth:`search_emails` body, whose result
+        pages are fetched lazily (``limit``/``offset``) while actions for earlier pages
+        are already running. One failing UUID does not stop the others. UUIDs that fail
+        with a connection, rate-limit or server error are retried in up to ``retries``
+        further rounds with exponential backoff.
+
+        Args:
+            emails: Iterable of email UUIDs, or a search body (dict) selecting the emails.
+            data (dict): Action body, as for :meth:`email_action` (e.g. ``{"action": "quarantine"}``).
+            page_size (int, optional): Search results per page when ``emails`` is a search body.
+                Defaults to 100.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            rate_limit (float, optional): Maximum action requests started per second.
+            retries (int, optional): Extra rounds for transient failures. Defaults to 1.
+            retry_wait (float, optional): Seconds before the first retry round, doubled for each
+                further round. Defaults to 5.
+            timeout (float, tuple[float, float], optional): Request timeout in seconds.
+
+        Returns:
+            dict: ``{"succeeded": [uuid], "failed": [{"uuid", "error", "attempts"}]}``.
+
+        Note:
+            If the action removes emails from the search results (e.g. a status filter),
+            later pages shift while paging. Pass the UUIDs collected up front in that case.
+
+        Example:
+            report = email.bulk_email_action({"filters": {"sender": "phish@bad.example"}}, {"action": "hold"})
+        """
+        if isinstance(emails, dict):
+            uuids: Iterable[str] = (
+                record["uuid"]
+                for record in self.iter_search(emails, page_size=page_size, fields=("uuid",), timeout=timeout)
+                if record["uuid"]
+            )
+        else:
+            uuids = emails
+
+        def unique(items: Iterable[str]) -> Iterator[str]:
+            seen: set[str] = set()
+            for uuid in items:
+                if uuid not in seen:
+                    seen.add(uuid)
+                    yield uuid
+
+        def apply(uuid: str) -> Any:
+            return self.email_action(uuid, data, timeout=timeout)
+
+        report: dict[str, list] = {"succeeded": [], "failed": []}
+        transient: list[str] = []
+        attempts = 1
+        results: Iterable[tuple[Any, Any, Exception | None]] = _iter_bulk(
+            apply, unique(uuids), max_workers=max_workers, rate_limit=rate_limit
+        )
+        while True:
+            for uuid, _, error in results:
+                if error is None:
+                    report["succeeded"].append(uuid)
+                elif isinstance(error, _TRANSIENT_ERRORS) and attempts <= retries:
+                    transient.append(uuid)
+                else:
+                    report["failed"].append({"uuid": uuid, "error": error, "attempts": attempts})
+            if not transient:
+                return report
+            time.sleep(retry_wait * 2 ** (attempts - 1))
+            attempts += 1
+            results = _run_bulk(apply, transient, max_workers=max_workers, rate_limit=rate_limit)
+            transient = []
+
+    def iter_search(
+        self,
+        data: dict[str, Any],
+        page_size: int = 100,
+        fields: Iterable[str] | None = None,
+        max_results: int | None = None,
+        prefetch: bool = True,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> Iterator[dict]:
+        """
+        Iterate over all emails matching a search, one record at a time.
+
+        Pages are requested with ``limit``/``offset`` until a short page is returned. While
+        one page is being consumed the next is already being fetched in the background.
+        With ``fields``, records are projected as soon as their page arrives, so only the
+        requested values of at most two pages are held in memory.
+
+        Args:
+            data (dict): Search body, as for :meth:`search_emails`. ``limit`` and ``offset``
+                are managed by the iterator; a given ``offset`` is used as the starting point.
+            page_size (int, optional): Results per request. Defaults to 100.
+            fields (iterable of str, optional): Fields to keep, as top-level keys or dotted
+                paths (e.g. ``"header.from"``). Each record becomes a flat dict keyed by the
+                given names, with None for missing values.
+            max_results (int, optional): Stop after this many records.
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+                Defaults to True.
+            timeout (float, tuple[float, float], optional): Request timeout in seconds.
+
+        Yields:
+            dict: Email records (projected when ``fields`` is given).
+
+        Example:
+            for record in email.iter_search({"filters": {"sender_domain": "bad.example"}}, fields=["uuid", "subject"]):
+                print(record["uuid"], record["subject"])
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive.")
+        paths = None if fields is None else [(field, field.split(".")) for field in fields]
+
+        def fetch(offset: int) -> list:
+            page = _email_list(self.search_emails({**data, "limit": page_size, "offset": offset}, timeout=timeout))
+            return page if paths is None else [_project(record, paths) for record in page]
+
+        offset = data.get("offset", 0)
+        remaining = max_results
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Future | None = executor.submit(fetch, offset)
+            while future is not None:
+                page = future.result()
+                offset += page_size
+                more = len(page) == page_size and (remaining is None or remaining > len(page))
+                future = executor.submit(fetch, offset) if more and prefetch else None
+                yield from page if remaining is None else page[:remaining]
+                if remaining is not None:
+                    remaining -= min(remaining, len(page))
+                if more and not prefetch:
+                    future = executor.submit(fetch, offset)
+
     def get_tags(self, timeout: float | tuple[float, float] | None = _UNSET) -> dict | list:
         """
         Get tags from Darktrace/Email API.
@@ -286,3 +437,206 @@ class DarktraceEmail(BaseEndpoint):
         if offset is not None:
             params["offset"] = offset
         return self._get(endpoint, params=params, timeout=timeout)
+
+
+class AuditEventFollower:
+    """Incrementally ship new Darktrace/Email audit events to pluggable sinks.
+
+    ``get_audit_events`` only pages by offset, newest first. The follower keeps a
+    watermark (the newest event timestamp plus the IDs seen at that timestamp)
+    and on each :meth:`poll` reads pages from the top only until it reaches
+    events at or below the watermark. Page requests are issued in parallel
+    windows that grow from one page up to ``prefetch`` pages, so a quiet poll
+    costs a single request. Events that shift across page boundaries while
+    paging are de-duplicated, and new events are passed to every sink oldest
+    first. The watermark advances per delivered event and is persisted to
+    ``state_path`` after each poll, so a restart resumes where it stopped and a
+    failing sink causes redelivery rather than loss.
+
+    Example::
+
+        def to_siem(event):
+            siem.send(json.dumps(event))
+
+        follower = AuditEventFollower(client.email, sinks=[to_siem], state_path="audit.watermark.json")
+        follower.run(stop_event, interval=60)
+    """
+
+    def __init__(
+        self,
+        email: DarktraceEmail,
+        sinks: Iterable[Callable[[dict], None]] = (),
+        state_path: str | os.PathLike | None = None,
+        event_type: str | None = None,
+        page_size: int = 100,
+        prefetch: int = 4,
+        since: Any = None,
+        max_ids: int = 10_000,
+    ) -> None:
+        """
+        Args:
+            email (DarktraceEmail): Email endpoint used for requests (e.g. ``client.email``).
+            sinks (iterable of callable, optional): Called with each new event dict, oldest first.
+            state_path (str or PathLike, optional): JSON file the watermark is loaded from and
+                saved to. Without it the watermark only lives in memory.
+            event_type (str, optional): Only follow this audit event type.
+            page_size (int, optional): Events per request. Defaults to 100.
+            prefetch (int, optional): Maximum pages requested in parallel. Defaults to 4.
+            since (optional): Without a stored watermark, skip events older than this (epoch
+                seconds/ms or ISO 8601). By default the first poll delivers all history.
+            max_ids (int, optional): Maximum event IDs kept in the watermark for de-duplication.
+                IDs of events without a timestamp are only dropped by this cap, oldest first.
+                Defaults to 10,000.
+        """
+        if page_size <= 0 or prefetch <= 0 or max_ids <= 0:
+            raise ValueError("page_size, prefetch and max_ids must be positive.")
+        self.email = email
+        self.sinks = list(sinks)
+        self.state_path = state_path
+        self.event_type = event_type
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.since = _epoch_seconds(since)
+        self.max_ids = max_ids
+        self._timestamp: float | None = None
+        # Insertion-ordered so the cap evicts the oldest IDs first
+        self._ids: dict[str, None] = {}
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path, encoding="utf-8") as handle:
+                state = json.load(handle)
+            self._timestamp = state.get("timestamp")
+            self._ids = dict.fromkeys(state.get("ids") or ())
+
+    @property
+    def watermark(self) -> dict | None:
+        """The current watermark as ``{"timestamp", "ids"}``, or None before any event."""
+        if self._timestamp is None and not self._ids:
+            return None
+        return {"timestamp": self._timestamp, "ids": list(self._ids)}
+
+    def add_sink(self, sink: Callable[[dict], None]) -> None:
+        """Add a sink receiving every subsequent new event."""
+        self.sinks.append(sink)
+
+    def poll(self, timeout: float | tuple[float, float] | None = _UNSET) -> list[dict]:
+        """
+        Fetch events newer than the watermark and deliver them to the sinks.
+
+        Returns:
+            list of dict: The new events, oldest first.
+
+        Raises:
+            Exception: Request errors, or the first sink error; events delivered before a
+                sink error stay acknowledged in the watermark.
+        """
+        new: list[tuple[float | None, str, dict]] = []
+        seen: set[str] = set()
+        offset = 0
+        window = 1
+        done = False
+        while not done:
+            offsets = [offset + page * self.page_size for page in range(window)]
+            for _, response, error in _run_bulk(
+                lambda page_offset: self.email.get_audit_events(
+                    event_type=self.event_type, limit=self.page_size, offset=page_offset, timeout=timeout
+                ),
+                offsets,
+                max_workers=window,
+            ):
+                if error is not None:
+                    raise error
+                events = _audit_list(response)
+                for event in events:
+                    timestamp = _epoch_seconds(event.get("timestamp"))
+                    key = _event_key(event)
+                    if key in seen or ((timestamp is None or timestamp == self._timestamp) and key in self._ids):
+                        continue
+                    if timestamp is not None and self._is_older(timestamp):
+                        done = True
+                        break
+                    seen.add(key)
+                    new.append((timestamp, key, event))
+                if done or len(events) < self.page_size:
+                    done = True
+                    break
+            offset += window * self.page_size
+            window = min(window * 2, self.prefetch)
+
+        # Pages are newest first; deliver oldest first, keeping page order for equal timestamps
+        new.reverse()
+        new.sort(key=lambda item: -1.0 if item[0] is None else item[0])
+        try:
+            for timestamp, key, event in new:
+                for sink in self.sinks:
+                    sink(event)
+                self._advance(timestamp, key)
+        finally:
+            self._save()
+        return [event for _, _, event in new]
+
+    def run(
+        self,
+        stop: threading.Event | None = None,
+        interval: float = 60.0,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> None:
+        """Call :meth:`poll` every ``interval`` seconds until ``stop`` is set (forever if omitted)."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll(timeout=timeout)
+            stop.wait(interval)
+
+    def _is_older(self, timestamp: float) -> bool:
+        if self._timestamp is not None:
+            return timestamp < self._timestamp
+        return self.since is not None and timestamp < self.since
+
+    def _advance(self, timestamp: float | None, key: str) -> None:
+        if timestamp is not None and (self._timestamp is None or timestamp > self._timestamp):
+            self._timestamp = timestamp
+            self._ids = {key: None}
+        else:
+            self._ids[key] = None
+            if len(self._ids) > self.max_ids:
+                del self._ids[next(iter(self._ids))]
+
+    def _save(self) -> None:
+        if self.state_path is None or self.watermark is None:
+            return
+        path = os.fspath(self.state_path)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(self.watermark, handle)
+        os.replace(temporary, path)
+
+
+def _email_list(response: dict | list) -> list:
+    """Normalize a search response into a list of email records."""
+    if isinstance(response, dict):
+        response = response.get("emails") or []
+    return response if isinstance(response, list) else []
+
+
+def _project(record: Any, paths: list[tuple[str, list[str]]]) -> dict:
+    """Keep only the given (dotted) fields of a record, as a flat dict."""
+    projected = {}
+    for field, keys in paths:
+        value = record
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+        projected[field] = value
+    return projected
+
+
+def _audit_list(response: dict | list) -> list:
+    """Normalize an audit events response into a list of event dicts."""
+    if isinstance(response, dict):
+        response = response.get("events") or []
+    return [event for event in response if isinstance(event, dict)] if isinstance(response, list) else []
+
+
+def _event_key(event: dict) -> str:
+    # Events are identified by id; fall back to the full content for id-less events
+    if event.get("id") is not None:
+        return str(event["id"])
+    return json.dumps(event, sort_keys=True, default=str)
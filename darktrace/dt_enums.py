@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable
+from typing import Any
+
 from .dt_utils import _UNSET, BaseEndpoint
 
-__all__ = ["Enums"]
+__all__ = ["EnumDecoder", "Enums"]
+
+# Response field names whose /enums table is not simply the plural of the field
+_FIELD_ENUMS = {
+    "proto": "protocols",
+    "applicationprotocol": "protocols",
+    "typeid": "devicetypes",
+    "devicetype": "devicetypes",
+    "os": "operatingsystems",
+}
 
 
 class Enums(BaseEndpoint):
@@ -33,3 +46,156 @@ class Enums(BaseEndpoint):
             query_params["responsedata"] = responsedata
         query_params.update(params)
         return self._get("/enums", params=query_params, timeout=timeout)
+
+
+class EnumDecoder:
+    """Local replacement for server-side ``expandenums``.
+
+    Fetches ``/enums`` once (cached for ``ttl`` seconds) and decodes numeric
+    codes in compact breach, details or network responses. Decoding is done
+    per field: all occurrences of a field are collected in one walk over the
+    response and mapped as a single column.
+
+    ``/enums`` keys are plural (``protocols``, ``countries``, ``devicetypes``,
+    ...). A field is decoded when its name, case-insensitively, is listed in
+    ``fields``, is a known alias (``typeid`` -> ``devicetypes``, ``proto`` ->
+    ``protocols``, ...) or is the singular or plural of an enum type
+    (``protocol`` -> ``protocols``, ``country`` -> ``countries``). The same
+    resolution applies to ``lookup`` and ``decode_column``.
+
+    Example::
+
+        decoder = EnumDecoder(client.enums, fields={"srcproto": "protocols"})
+        events = decoder.decode(client.details.get(did=1, count=1000))
+    """
+
+    def __init__(
+        self,
+        enums: Enums,
+        ttl: float | None = 3600,
+        fields: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Args:
+            enums (Enums): Enums endpoint used to fetch data (e.g. ``client.enums``).
+            ttl (float, optional): Seconds before the cached enums are refetched. None caches forever.
+            fields (dict, optional): Extra ``{field_name: enum_type}`` mappings, taking
+                precedence over the built-in aliases.
+        """
+        self.enums = enums
+        self.ttl = ttl
+        self.fields = {key.lower(): value.lower() for key, value in (fields or {}).items()}
+        self._tables: dict[str, dict[Any, Any]] | None = None
+        self._loaded_at = 0.0
+
+    def load(self, timeout: float | tuple[float, float] | None = _UNSET) -> dict[str, dict[Any, Any]]:
+        """
+        Fetch ``/enums`` and rebuild the code-to-name tables.
+
+        Args:
+            timeout (float or tuple, optional): Request timeout in seconds.
+
+        Returns:
+            dict: ``{enum_type: {code: name}}`` with lower-cased enum type names.
+        """
+        response = self.enums.get(timeout=timeout)
+        tables: dict[str, dict[Any, Any]] = {}
+        if isinstance(response, dict):
+            for name, values in response.items():
+                tables[name.lower()] = _enum_table(values)
+        self._tables = tables
+        self._loaded_at = time.monotonic()
+        return tables
+
+    @property
+    def tables(self) -> dict[str, dict[Any, Any]]:
+        """Cached enum tables, (re)loaded on first use and after ``ttl`` expiry."""
+        if self._tables is None or (self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl):
+            return self.load()
+        return self._tables
+
+    def resolve(self, field: str) -> str | None:
+        """Return the ``/enums`` table name used for ``field`` or enum type ``field``, or ``None``."""
+        return _resolve(field.lower(), self.fields, self.tables)
+
+    def lookup(self, enum: str, code: Any) -> Any:
+        """Return the name for ``code`` in enum type (or field) ``enum``, or ``None`` if unknown."""
+        tables = self.tables
+        return tables.get(_resolve(enum.lower(), self.fields, tables), {}).get(code)
+
+    def decode_column(self, enum: str, values: Iterable[Any]) -> list[Any]:
+        """Decode a column of codes for one enum type (or field); unknown codes are returned unchanged."""
+        tables = self.tables
+        table = tables.get(_resolve(enum.lower(), self.fields, tables), {})
+        return [table.get(value, value) for value in values]
+
+    def decode(self, data: Any, fields: Iterable[str] | None = None) -> Any:
+        """
+        Decode numeric enum codes in a response, in place.
+
+        Args:
+            data: A response from ``/modelbreaches``, ``/details``, ``/network`` or similar.
+                Nested dicts and lists are walked.
+            fields (iterable of str, optional): Restrict decoding to these field names.
+
+        Returns:
+            The same ``data`` object with codes replaced by their names.
+        """
+        tables = self.tables
+        wanted = None if fields is None else {field.lower() for field in fields}
+        resolved: dict[str, str | None] = {}
+        columns: dict[str, list[tuple[dict, str]]] = {}
+
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                for key, value in node.items():
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+                    elif isinstance(value, int) and not isinstance(value, bool):
+                        field = key.lower()
+                        if wanted is not None and field not in wanted:
+                            continue
+                        if field not in resolved:
+                            resolved[field] = _resolve(field, self.fields, tables)
+                        enum = resolved[field]
+                        if enum is not None:
+                            columns.setdefault(enum, []).append((node, key))
+
+        for enum, refs in columns.items():
+            table = tables[enum]
+            for node, key in refs:
+                node[key] = table.get(node[key], node[key])
+        return data
+
+
+def _resolve(name: str, fields: dict[str, str], tables: dict[str, dict[Any, Any]]) -> str | None:
+    """Map a lower-cased field or enum name to a key of ``tables``."""
+    candidates = [fields.get(name), _FIELD_ENUMS.get(name), name, name + "s", name + "es"]
+    if name.endswith("y"):
+        candidates.append(name[:-1] + "ies")
+    for candidate in candidates:
+        if candidate is not None and candidate in tables:
+            return candidate
+    return None
+
+
+def _enum_table(values: Any) -> dict[Any, Any]:
+    """Build a ``{code: name}`` table from one ``/enums`` entry."""
+    if isinstance(values, dict):
+        return {
+            int(code) if isinstance(code, str) and code.lstrip("-").isdigit() else code: name
+            for code, name in values.items()
+        }
+    if isinstance(values, list):
+        table: dict[Any, Any] = {}
+        for index, value in enumerate(values):
+            if isinstance(value, dict) and "code" in value:
+                table[value["code"]] = value.get("name", value.get("value"))
+            else:
+                table[index] = value
+        return table
+    return {}
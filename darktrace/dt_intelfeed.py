@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import ipaddress
+import time
+from collections.abc import Callable, Iterable
 from typing import Any
 
-from .dt_utils import _UNSET, BaseEndpoint
+from .dt_utils import _UNSET, BaseEndpoint, _epoch_seconds, _run_bulk
 
-__all__ = ["IntelFeed"]
+__all__ = ["IntelFeed", "IntelMatcher"]
+
+# Event fields checked by IntelMatcher.match_events() by default (dotted paths into /details events)
+_EVENT_FIELDS = (
+    "destination",
+    "source",
+    "destinationDevice.hostname",
+    "destinationDevice.ip",
+    "sourceDevice.hostname",
+    "sourceDevice.ip",
+)
 
 
 class IntelFeed(BaseEndpoint):
@@ -22,6 +35,8 @@ class IntelFeed(BaseEndpoint):
     POST parameters (see update method):
         - addentry, addlist, description, expiry, hostname, removeall, removeentry, source, iagn
 
+    Use :meth:`sync` to converge a source onto a desired list without clearing it first.
+
     Returns:
         list: List of watched domains, IPs, or hostnames, or list of sources, or detailed entry dicts.
     """
@@ -123,3 +138,307 @@ class IntelFeed(BaseEndpoint):
             body["iagn"] = True
 
         return self._post_json(endpoint, body=body, timeout=timeout)
+
+    def sync(
+        self,
+        desired_entries: Iterable[str],
+        source: str,
+        description: str | None = None,
+        expiry: str | None = None,
+        is_hostname: bool = False,
+        enable_antigena: bool = False,
+        batch_size: int = 1000,
+        max_workers: int = 4,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """Make the entries of one source match ``desired_entries``.
+
+        The current list for ``source`` is fetched once and diffed locally, so only
+        additions and removals are sent. Additions go out as ``addlist`` batches of at
+        most ``batch_size`` entries. ``/intelfeed`` has no list form of ``removeentry``
+        (only ``removeall``, which would empty the source), so removals are one POST per
+        entry, sent concurrently alongside the additions. Entries already present are
+        never touched, so the watchlist is never empty mid-sync.
+
+        Args:
+            desired_entries: Domains, hostnames or IP addresses that should be on the list.
+            source: Source to synchronize (required, must be under 64 characters).
+            description: Description for added entries (must be under 256 characters)
+            expiry: Expiration time for added items
+            is_hostname: If True, treat added items as hostnames rather than domains
+            enable_antigena: If True, enable automatic Antigena Network actions for added items
+            batch_size: Maximum number of entries per ``addlist`` request.
+            max_workers: Maximum number of concurrent requests.
+            progress: Optional callback invoked as ``progress(done, total)`` after each request.
+
+        Returns:
+            dict: Report with ``added`` and ``removed`` entry lists, the ``unchanged`` count,
+            and ``failed``, a list of ``{"action", "entries", "error"}`` dicts.
+        """
+        if not source:
+            raise ValueError("source is required to scope the sync.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        current = {
+            _normalize_entry(entry): entry for entry in self._entry_names(self.get_by_source(source, timeout=timeout))
+        }
+        desired = {_normalize_entry(entry): entry.strip() for entry in desired_entries if entry and entry.strip()}
+
+        additions = [desired[key] for key in desired if key not in current]
+        removals = [current[key] for key in current if key not in desired]
+
+        tasks: list[tuple[str, list[str]]] = [
+            ("add", additions[i : i + batch_size]) for i in range(0, len(additions), batch_size)
+        ]
+        # removeentry takes a single value; removeall + re-add would leave the source empty mid-sync
+        tasks.extend(("remove", [entry]) for entry in removals)
+
+        def apply(task: tuple[str, list[str]]) -> dict:
+            action, entries = task
+            if action == "add":
+                return self.update(
+                    add_list=entries,
+                    description=description,
+                    source=source,
+                    expiry=expiry,
+                    is_hostname=is_hostname,
+                    enable_antigena=enable_antigena,
+                    timeout=timeout,
+                )
+            return self.update(remove_entry=entries[0], source=source, timeout=timeout)
+
+        report: dict[str, Any] = {
+            "added": [],
+            "removed": [],
+            "unchanged": len(current) - len(removals),
+            "failed": [],
+        }
+        for (action, entries), _, error in _run_bulk(apply, tasks, max_workers=max_workers, progress=progress):
+            if error is not None:
+                report["failed"].append({"action": action, "entries": entries, "error": error})
+            elif action == "add":
+                report["added"].extend(entries)
+            else:
+                report["removed"].extend(entries)
+        return report
+
+    @staticmethod
+    def _entry_names(response: dict | list) -> list[str]:
+        # Plain responses are lists of strings; fulldetails responses are lists of dicts with a "name"
+        if not isinstance(response, list):
+            return []
+        return [entry["name"] if isinstance(entry, dict) else entry for entry in response]
+
+
+def _normalize_entry(entry: str) -> str:
+    return entry.strip().lower()
+
+
+class IntelMatcher:
+    """Local matcher for IntelFeed indicators against hostnames and IP addresses.
+
+    Entries from ``IntelFeed.get(fulldetails=True)`` are compiled once into a
+    reversed-label domain trie (a domain entry matches the domain and all its
+    subdomains; an entry flagged ``hostname`` matches only that exact name) and
+    per-prefix-length hash tables for IPs and CIDRs. Each check is then a
+    handful of dict probes instead of a scan over the whole feed, and the batch
+    methods only look up each distinct value once. Entries past their
+    ``expiry`` never match.
+
+    Example::
+
+        matcher = IntelMatcher(client.intelfeed, source="ThreatFeed")
+        matcher.load()
+        matcher.match("cdn.malicious-domain.com")  # -> entry for malicious-domain.com
+        hits = matcher.match_events(client.details.get(did=123, count=1000))
+    """
+
+    def __init__(self, intelfeed: IntelFeed, source: str | None = None) -> None:
+        """
+        Args:
+            intelfeed (IntelFeed): IntelFeed endpoint used to fetch entries (e.g. ``client.intelfeed``).
+            source (str, optional): Only load entries from this source.
+        """
+        self.intelfeed = intelfeed
+        self.source = source
+        self._count = 0
+        # Trie of reversed labels; the None key holds [(entry, expires, exact)] ending at that node
+        self._domains: dict[str | None, Any] = {}
+        # {version: [(mask, {network_int: [(entry, expires, exact)]})]} longest prefix first
+        self._networks: dict[int, list[tuple[int, dict[int, list[tuple[dict, float | None, bool]]]]]] = {4: [], 6: []}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def load(self, timeout: float | tuple[float, float] | None = _UNSET) -> int:
+        """
+        Fetch the feed with full details and compile the lookup tables.
+
+        Args:
+            timeout (float or tuple, optional): Request timeout in seconds.
+
+        Returns:
+            int: Number of live (unexpired) entries compiled.
+        """
+        response = self.intelfeed.get(source=self.source, fulldetails=True, timeout=timeout)
+        return self.compile(response if isinstance(response, list) else [])
+
+    def compile(self, entries: Iterable[dict | str], now: float | None = None) -> int:
+        """
+        Compile lookup tables from feed entries, skipping ones already expired.
+
+        Args:
+            entries: Entry dicts as returned with ``fulldetails`` (or plain entry strings).
+            now (float, optional): Reference time in epoch seconds. Defaults to the current time.
+
+        Returns:
+            int: Number of entries compiled.
+        """
+        now = time.time() if now is None else now
+        domains: dict[str | None, Any] = {}
+        networks: dict[int, dict[int, dict[int, list]]] = {4: {}, 6: {}}
+        count = 0
+        for entry in entries:
+            if not isinstance(entry, dict):
+                entry = {"name": entry}
+            name = _normalize_entry(str(entry.get("name") or "")).rstrip(".")
+            if not name:
+                continue
+            expires = _epoch_seconds(entry.get("expiry"))
+            if expires is not None and expires <= now:
+                continue
+            candidate = (entry, expires, entry.get("hostname") is True)
+            try:
+                net = ipaddress.ip_network(name, strict=False)
+            except ValueError:
+                node = domains
+                for label in reversed((name[2:] if name.startswith("*.") else name).split(".")):
+                    node = node.setdefault(label, {})
+                node.setdefault(None, []).append(candidate)
+            else:
+                networks[net.version].setdefault(net.prefixlen, {}).setdefault(int(net.network_address), []).append(
+                    candidate
+                )
+            count += 1
+
+        self._domains = domains
+        for version, bits in ((4, 32), (6, 128)):
+            full = (1 << bits) - 1
+            self._networks[version] = [
+                (full ^ ((1 << (bits - prefixlen)) - 1), table)
+                for prefixlen, table in sorted(networks[version].items(), reverse=True)
+            ]
+        self._count = count
+        return count
+
+    def match(self, value: str, now: float | None = None) -> dict | None:
+        """
+        Return the feed entry matching a hostname or IP address.
+
+        Args:
+            value (str): Hostname, domain or IP address.
+            now (float, optional): Reference time in epoch seconds for expiry checks.
+
+        Returns:
+            dict or None: The most specific live entry that matches, or None.
+        """
+        return self._match(value, time.time() if now is None else now)
+
+    def match_many(self, values: Iterable[str | None], now: float | None = None) -> list[dict | None]:
+        """
+        Match a column of hostnames and/or IPs, returning one entry (or None) per value.
+
+        Each distinct value is looked up once, so columns taken from connection
+        logs (which repeat the same destinations heavily) are matched at dict speed.
+        """
+        now = time.time() if now is None else now
+        seen: dict[str | None, dict | None] = {None: None}
+        results = []
+        for value in values:
+            try:
+                results.append(seen[value])
+            except KeyError:
+                seen[value] = result = self._match(value, now)
+                results.append(result)
+        return results
+
+    def match_events(
+        self,
+        events: Iterable[dict],
+        fields: Iterable[str] = _EVENT_FIELDS,
+        now: float | None = None,
+    ) -> list[tuple[dict, str, dict]]:
+        """
+        Match fields of ``/details`` (or similar) events against the feed.
+
+        Args:
+            events: Event dicts, e.g. from :meth:`Details.get`.
+            fields (iterable of str, optional): Dotted paths of the fields to check. Defaults to the
+                source/destination and their device ``hostname``/``ip``.
+            now (float, optional): Reference time in epoch seconds for expiry checks.
+
+        Returns:
+            list: ``(event, field, entry)`` tuples, one per matching field, in event order.
+        """
+        now = time.time() if now is None else now
+        paths = [(field, field.split(".")) for field in fields]
+        seen: dict[Any, dict | None] = {}
+        hits = []
+        for event in events:
+            for field, keys in paths:
+                value: Any = event
+                for key in keys:
+                    value = value.get(key) if isinstance(value, dict) else None
+                if not isinstance(value, str):
+                    continue
+                try:
+                    entry = seen[value]
+                except KeyError:
+                    seen[value] = entry = self._match(value, now)
+                if entry is not None:
+                    hits.append((event, field, entry))
+        return hits
+
+    def _match(self, value: str, now: float) -> dict | None:
+        value = value.strip().lower().rstrip(".")
+        if not value:
+            return None
+        # Hostnames almost never end in a digit, so only those (and IPv6) pay for IP parsing
+        if value[-1].isdigit() or ":" in value:
+            try:
+                address = ipaddress.ip_address(value)
+            except ValueError:
+                pass
+            else:
+                number = int(address)
+                for mask, table in self._networks[address.version]:
+                    candidates = table.get(number & mask)
+                    if candidates:
+                        entry = _live_entry(candidates, now, True)
+                        if entry is not None:
+                            return entry
+                return None
+
+        labels = value.split(".")
+        node = self._domains
+        found = None
+        for depth, label in enumerate(reversed(labels), 1):
+            node = node.get(label)
+            if node is None:
+                break
+            candidates = node.get(None)
+            if candidates:
+                entry = _live_entry(candidates, now, depth == len(labels))
+                if entry is not None:
+                    found = entry
+        return found
+
+
+def _live_entry(candidates: list[tuple[dict, float | None, bool]], now: float, whole: bool) -> dict | None:
+    # First candidate that has not expired; exact (hostname) entries only match the whole name
+    for entry, expires, exact in candidates:
+        if (expires is None or expires > now) and (whole or not exact):
+            return entry
+    return None
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from .dt_utils import _UNSET, BaseEndpoint
+import re
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+
+from .dt_utils import _UNSET, BaseEndpoint, _run_bulk
+
+try:  # Optional dependency for columnar output
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
 
 __all__ = ["MetricData"]
 
+_TIME_KEYS = ("timems", "timestamp", "time")
+_INTERVAL_UNITS_MS = {"sec": 1000, "min": 60_000, "hour": 3_600_000, "day": 86_400_000, "week": 604_800_000}
+
 
 class MetricData(BaseEndpoint):
     def get(
@@ -102,3 +114,254 @@ class MetricData(BaseEndpoint):
         query_params.update(params)
 
         return self._get(endpoint, params=query_params, timeout=timeout)
+
+    def get_frame(
+        self,
+        output: str = "numpy",
+        timeout: float | tuple[float, float] | None = _UNSET,
+        **params,
+    ) -> Any:
+        """
+        Get metric time series as columnar arrays instead of nested JSON.
+
+        Accepts the same filters as :meth:`get`. Every metric/device series in the
+        response becomes one ``float64`` column aligned on a shared ``timems`` vector.
+        When ``interval`` is given the vector is the regular interval grid between the
+        first and last point; otherwise it is the sorted union of all timestamps.
+        Missing points are ``NaN``.
+
+        Args:
+            output (str, optional): ``"numpy"`` (default) for a dict of NumPy arrays,
+                ``"pandas"`` for a DataFrame or ``"arrow"`` for a ``pyarrow.Table``.
+            timeout (float or tuple, optional): Request timeout in seconds.
+            **params: Filters forwarded to :meth:`get` (e.g. ``metric``, ``did``, ``interval``).
+
+        Returns:
+            dict, pandas.DataFrame or pyarrow.Table: A ``timems`` column (epoch ms, ``int64``)
+            plus one column per series, named ``metric`` or ``metric:did``.
+
+        Raises:
+            ImportError: If NumPy (or the library for the requested output) is not installed.
+        """
+        if np is None:
+            raise ImportError("get_frame() requires numpy; install it with 'pip install numpy'.")
+        if output not in ("numpy", "pandas", "arrow"):
+            raise ValueError("output must be one of 'numpy', 'pandas' or 'arrow'.")
+        response = self.get(timeout=timeout, **params)
+        columns = _metric_columns(response, _interval_ms(params.get("interval")))
+        if output == "pandas":
+            import pandas as pd
+
+            return pd.DataFrame(columns)
+        if output == "arrow":
+            import pyarrow as pa
+
+            return pa.table(columns)
+        return columns
+
+    def get_matrix(
+        self,
+        metrics: Sequence[str],
+        dids: Sequence[int],
+        starttime: int,
+        endtime: int,
+        interval: str,
+        max_workers: int = 8,
+        dtype: str = "float64",
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+        **params,
+    ) -> dict[str, Any]:
+        """
+        Fetch a dense devices × metrics × time matrix.
+
+        ``/metricdata`` serves one device filter per call, so the work is split into one
+        request per device/metric pair and run with bounded concurrency. Results are
+        written straight into a preallocated array on the ``interval`` grid, which starts
+        at ``starttime`` floored to an interval boundary like the server's buckets.
+
+        Args:
+            metrics (sequence of str): Metric names (second axis).
+            dids (sequence of int): Device IDs (first axis).
+            starttime (int): Start time (epoch ms).
+            endtime (int): End time (epoch ms).
+            interval (str): Time interval (e.g., '5min', '1hour'); defines the time axis.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+            dtype (str, optional): Floating-point NumPy dtype of the matrix (missing cells are
+                ``NaN``). Defaults to 'float64'.
+            progress (callable, optional): Invoked as ``progress(done, total)`` after each request.
+            timeout (float or tuple, optional): Request timeout in seconds.
+            **params: Extra filters forwarded to :meth:`get` (e.g. ``protocol``).
+
+        Returns:
+            dict: ``timems`` (grid, ``int64``), ``values`` (``len(dids) × len(metrics) × len(timems)``,
+            ``NaN`` where no data was returned), ``dids``, ``metrics`` and ``failed``, a list of
+            ``{"did", "metric", "error"}`` dicts for requests that failed (their cells stay ``NaN``).
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``dtype`` is not a floating-point type, or a response holds more than
+                one series (e.g. because of a breakdown filter in ``params``).
+        """
+        if np is None:
+            raise ImportError("get_matrix() requires numpy; install it with 'pip install numpy'.")
+        step = _interval_ms(interval)
+        if step is None:
+            raise ValueError(f"Unsupported interval {interval!r}.")
+        if endtime < starttime:
+            raise ValueError("endtime must not be before starttime.")
+        if np.dtype(dtype).kind != "f":
+            raise ValueError(f"dtype must be a floating-point type to hold NaN holes, got {dtype!r}.")
+
+        dids, metrics = list(dids), list(metrics)
+        grid = np.arange(starttime // step * step, endtime + 1, step, dtype=np.int64)
+        values = np.full((len(dids), len(metrics), len(grid)), np.nan, dtype=dtype)
+        ambiguous: list[tuple[int, str, int]] = []
+
+        def fetch(cell: tuple[int, int]) -> None:
+            row, col = cell
+            response = self.get(
+                metric=metrics[col],
+                did=dids[row],
+                starttime=starttime,
+                endtime=endtime,
+                interval=interval,
+                timeout=timeout,
+                **params,
+            )
+            found = list(_metric_series(response))
+            if len(found) > 1:
+                ambiguous.append((dids[row], metrics[col], len(found)))
+                return
+            for _, times, series in found:
+                positions = (times - grid[0]) // step
+                in_range = (positions >= 0) & (positions < len(grid))
+                values[row, col, positions[in_range]] = series[in_range]
+
+        cells = [(row, col) for row in range(len(dids)) for col in range(len(metrics))]
+        failed = [
+            {"did": dids[row], "metric": metrics[col], "error": error}
+            for (row, col), _, error in _run_bulk(fetch, cells, max_workers=max_workers, progress=progress)
+            if error is not None
+        ]
+        if ambiguous:
+            did, metric, count = ambiguous[0]
+            raise ValueError(
+                f"/metricdata returned {count} series for did={did}, metric={metric!r}; "
+                "get_matrix() needs exactly one series per device/metric pair."
+            )
+        return {"timems": grid, "values": values, "dids": dids, "metrics": metrics, "failed": failed}
+
+
+def _interval_ms(interval: Any) -> int | None:
+    """Convert an ``interval`` parameter ('5min', '1hour', '3600') to milliseconds."""
+    if interval is None:
+        return None
+    if isinstance(interval, (int, float)):
+        return int(interval * 1000)
+    match = re.fullmatch(r"\s*(\d+)\s*([a-z]*)\s*", str(interval).lower())
+    if not match:
+        return None
+    value, unit = int(match.group(1)), match.group(2).rstrip("s") or "sec"
+    unit = {"second": "sec", "minute": "min", "hr": "hour", "h": "hour", "d": "day", "m": "min", "s": "sec"}.get(
+        unit, unit
+    )
+    if unit not in _INTERVAL_UNITS_MS or value <= 0:
+        return None
+    return value * _INTERVAL_UNITS_MS[unit]
+
+
+def _metric_series(response: Any) -> Iterator[tuple[str, Any, Any]]:
+    """Yield ``(label, timems, values)`` arrays for every series in a ``/metricdata`` response."""
+    series_list = response if isinstance(response, list) else [response] if isinstance(response, dict) else []
+    for series in series_list:
+        if not isinstance(series, dict):
+            continue
+        device = series.get("device")
+        did = series.get("did", device.get("did") if isinstance(device, dict) else None)
+        data = series.get("data")
+        groups = data.items() if isinstance(data, dict) else [(series.get("metric"), data)]
+        for metric, points in groups:
+            if points:
+                yield from _points_to_arrays(str(metric or "value"), did, points)
+
+
+def _points_to_arrays(metric: str, did: Any, points: list) -> Iterator[tuple[str, Any, Any]]:
+    first = points[0]
+    if isinstance(first, (list, tuple)):
+        # Compact [timems, value] pairs convert in one C-level pass
+        pairs = np.asarray(points, dtype=np.float64).reshape(len(points), -1)
+        yield _label(metric, did), pairs[:, 0].astype(np.int64), pairs[:, 1]
+        return
+    if not isinstance(first, dict):
+        return
+
+    time_key = next((key for key in _TIME_KEYS if isinstance(first.get(key), (int, float))), None)
+    if time_key is None:
+        return
+    value_key = "value" if "value" in first else "size" if "size" in first else None
+    if value_key is None:
+        value_key = next(
+            (
+                key
+                for key, value in first.items()
+                if key not in _TIME_KEYS and isinstance(value, (int, float)) and not isinstance(value, bool)
+            ),
+            None,
+        )
+    if value_key is None:
+        return
+
+    nan = float("nan")
+    if not isinstance(first.get("device"), dict):
+        count = len(points)
+        times = np.fromiter((point.get(time_key, 0) for point in points), dtype=np.int64, count=count)
+        values = np.fromiter((_number(point.get(value_key), nan) for point in points), dtype=np.float64, count=count)
+        yield _label(metric, did), times, values
+        return
+
+    # Points that carry their own device are split into one series per device
+    grouped: dict[Any, tuple[list, list]] = {}
+    for point in points:
+        point_did = (point.get("device") or {}).get("did", did)
+        times_list, values_list = grouped.setdefault(point_did, ([], []))
+        times_list.append(point.get(time_key, 0))
+        values_list.append(_number(point.get(value_key), nan))
+    for point_did, (times_list, values_list) in grouped.items():
+        yield _label(metric, point_did), np.array(times_list, dtype=np.int64), np.array(values_list, dtype=np.float64)
+
+
+def _number(value: Any, default: float) -> float:
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
+
+def _label(metric: str, did: Any) -> str:
+    return metric if did is None else f"{metric}:{did}"
+
+
+def _metric_columns(response: Any, step: int | None) -> dict[str, Any]:
+    """Align all series of a response on one timestamp vector."""
+    series = list(_metric_series(response))
+    if not series:
+        return {"timems": np.empty(0, dtype=np.int64)}
+
+    if step:
+        start = min(int(times.min()) for _, times, _ in series)
+        end = max(int(times.max()) for _, times, _ in series)
+        grid = np.arange(start, end + 1, step, dtype=np.int64)
+    else:
+        grid = np.unique(np.concatenate([times for _, times, _ in series]))
+
+    columns: dict[str, Any] = {"timems": grid}
+    for label, times, values in series:
+        if step:
+            positions = (times - grid[0]) // step
+        else:
+            positions = np.searchsorted(grid, times)
+        column = np.full(len(grid), np.nan, dtype=np.float64)
+        column[positions] = values
+        name, suffix = label, 2
+        while name in columns:
+            name, suffix = f"{label}#{suffix}", suffix + 1
+        columns[name] = column
+    return columns
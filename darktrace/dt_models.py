@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from .dt_utils import _UNSET, BaseEndpoint
+import time
+from typing import Any
 
-__all__ = ["Models"]
+from .dt_utils import _UNSET, BaseEndpoint, _run_bulk
+
+__all__ = ["ModelCatalog", "Models"]
 
 
 class Models(BaseEndpoint):
@@ -28,3 +31,163 @@ class Models(BaseEndpoint):
         if responsedata is not None:
             params["responsedata"] = responsedata
         return self._get("/models", params=params, timeout=timeout)
+
+
+class ModelCatalog:
+    """Indexed join of ``/models``, ``/components`` and ``/filtertypes``.
+
+    All three endpoints are fetched once (concurrently) and cached for ``ttl``
+    seconds. Models are indexed by ``uuid`` and ``pid``, components by ``cid``
+    and filter types by name, with reverse indexes from filter type to
+    components and from component to models, so questions like "which models
+    use filter X" become dictionary lookups instead of nested loops.
+
+    Example::
+
+        catalog = ModelCatalog(client.models, client.components, client.filtertypes)
+        for model in catalog.models_using_filter("Destination port"):
+            print(model["name"])
+        model = catalog.model_for_breach(breach)
+    """
+
+    def __init__(
+        self,
+        models: Models,
+        components: BaseEndpoint,
+        filtertypes: BaseEndpoint,
+        ttl: float | None = 3600,
+    ) -> None:
+        """
+        Args:
+            models (Models): Models endpoint (e.g. ``client.models``).
+            components (Components): Components endpoint (e.g. ``client.components``).
+            filtertypes (FilterTypes): Filter types endpoint (e.g. ``client.filtertypes``).
+            ttl (float, optional): Seconds before the catalog is refetched. None caches forever.
+        """
+        self.models = models
+        self.components = components
+        self.filtertypes = filtertypes
+        self.ttl = ttl
+        self._loaded_at: float | None = None
+        self._models_by_uuid: dict[str, dict] = {}
+        self._models_by_pid: dict[int, dict] = {}
+        self._components: dict[int, dict] = {}
+        self._filtertypes: dict[str, dict] = {}
+        self._cids_by_filter: dict[str, set[int]] = {}
+        self._pids_by_cid: dict[int, set[int]] = {}
+        self._cids_by_pid: dict[int, list[int]] = {}
+
+    def load(self, timeout: float | tuple[float, float] | None = _UNSET) -> None:
+        """
+        Fetch all three endpoints and rebuild the indexes.
+
+        Args:
+            timeout (float or tuple, optional): Request timeout in seconds.
+        """
+        fetches = [self.models.get, self.components.get, self.filtertypes.get]
+        results = _run_bulk(lambda fetch: fetch(timeout=timeout), fetches, max_workers=len(fetches))
+        for _, _, error in results:
+            if error is not None:
+                raise error
+        models, components, filtertypes = (result if isinstance(result, list) else [] for _, result, _ in results)
+
+        self._models_by_uuid = {model["uuid"]: model for model in models if model.get("uuid")}
+        self._models_by_pid = {model["pid"]: model for model in models if model.get("pid") is not None}
+        self._components = {component["cid"]: component for component in components if component.get("cid") is not None}
+        self._filtertypes = {ft["filtertype"]: ft for ft in filtertypes if ft.get("filtertype")}
+
+        self._cids_by_filter = {}
+        for cid, component in self._components.items():
+            for component_filter in component.get("filters") or ():
+                name = component_filter.get("filtertype")
+                if name:
+                    self._cids_by_filter.setdefault(name, set()).add(cid)
+
+        self._pids_by_cid = {}
+        self._cids_by_pid = {}
+        for pid, model in self._models_by_pid.items():
+            cids = _model_cids(model)
+            self._cids_by_pid[pid] = cids
+            for cid in cids:
+                self._pids_by_cid.setdefault(cid, set()).add(pid)
+
+        self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded_at is None or (self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl):
+            self.load()
+
+    def model(self, pid: int | None = None, uuid: str | None = None) -> dict | None:
+        """Return a model by ``pid`` or ``uuid``, or ``None`` if unknown."""
+        self._ensure_loaded()
+        if uuid is not None:
+            return self._models_by_uuid.get(uuid)
+        return self._models_by_pid.get(pid)
+
+    def component(self, cid: int) -> dict | None:
+        """Return a component by ``cid``, or ``None`` if unknown."""
+        self._ensure_loaded()
+        return self._components.get(cid)
+
+    def filtertype(self, name: str) -> dict | None:
+        """Return a filter type definition by name, or ``None`` if unknown."""
+        self._ensure_loaded()
+        return self._filtertypes.get(name)
+
+    def components_of(self, pid: int | None = None, uuid: str | None = None) -> list[dict]:
+        """Return the components that make up a model (by ``pid`` or ``uuid``)."""
+        model = self.model(pid=pid, uuid=uuid)
+        if model is None:
+            return []
+        return [self._components[cid] for cid in self._cids_by_pid.get(model["pid"], ()) if cid in self._components]
+
+    def filters_of(self, pid: int | None = None, uuid: str | None = None) -> set[str]:
+        """Return the filter type names used by a model's components."""
+        return {
+            component_filter["filtertype"]
+            for component in self.components_of(pid=pid, uuid=uuid)
+            for component_filter in component.get("filters") or ()
+            if component_filter.get("filtertype")
+        }
+
+    def components_using_filter(self, filtertype: str) -> list[dict]:
+        """Return all components with a filter of type ``filtertype``."""
+        self._ensure_loaded()
+        return [self._components[cid] for cid in sorted(self._cids_by_filter.get(filtertype, ()))]
+
+    def models_using_component(self, cid: int) -> list[dict]:
+        """Return all models whose logic references component ``cid``."""
+        self._ensure_loaded()
+        return [self._models_by_pid[pid] for pid in sorted(self._pids_by_cid.get(cid, ()))]
+
+    def models_using_filter(self, filtertype: str) -> list[dict]:
+        """Return all models with at least one component using filter type ``filtertype``."""
+        self._ensure_loaded()
+        pids: set[int] = set()
+        for cid in self._cids_by_filter.get(filtertype, ()):
+            pids.update(self._pids_by_cid.get(cid, ()))
+        return [self._models_by_pid[pid] for pid in sorted(pids)]
+
+    def model_for_breach(self, breach: dict) -> dict | None:
+        """Resolve the catalog model for a ``/modelbreaches`` entry (full or ``minimal``)."""
+        model: Any = breach.get("model")
+        if isinstance(model, dict):
+            model = model.get("then") or model.get("now") or model
+            if model.get("uuid"):
+                found = self.model(uuid=model["uuid"])
+                if found is not None:
+                    return found
+            return self.model(pid=model.get("pid"))
+        return self.model(pid=model if model is not None else breach.get("pid"))
+
+
+def _model_cids(model: dict) -> list[int]:
+    """Component IDs referenced by a model's logic (plain or weighted component lists)."""
+    logic = model.get("logic") or {}
+    cids = []
+    for entry in logic.get("data") or ():
+        if isinstance(entry, dict):
+            entry = entry.get("cid")
+        if isinstance(entry, int):
+            cids.append(entry)
+    return cids
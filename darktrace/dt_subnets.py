@@ -1,8 +1,41 @@
 from __future__ import annotations
 
-from .dt_utils import _UNSET, BaseEndpoint
+import csv
+import ipaddress
+import json
+import os
+from collections.abc import Callable, Iterable
+from typing import Any
 
-__all__ = ["Subnets"]
+from .dt_utils import _UNSET, BaseEndpoint, _run_bulk
+
+try:  # Optional dependency for vectorized lookups
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+__all__ = ["SubnetResolver", "Subnets"]
+
+_MAX_IP = {4: (1 << 32) - 1, 6: (1 << 128) - 1}
+_UINT64_MAX = (1 << 64) - 1
+
+# Writable subnet fields accepted by POST /subnets, keyed by lower-case name for header matching
+_SUBNET_FIELDS = {
+    name.lower(): name
+    for name in (
+        "label",
+        "network",
+        "longitude",
+        "latitude",
+        "dhcp",
+        "uniqueUsernames",
+        "uniqueHostnames",
+        "excluded",
+        "modelExcluded",
+    )
+}
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "t"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "n", "f"})
 
 
 class Subnets(BaseEndpoint):
@@ -100,3 +133,384 @@ class Subnets(BaseEndpoint):
             body["responsedata"] = responsedata
 
         return self._post_json(endpoint, body=body, timeout=timeout)
+
+    def bulk_import(
+        self,
+        source: str | os.PathLike | Iterable[dict],
+        format: str | None = None,
+        current: Iterable[dict] | None = None,
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> list[dict]:
+        """
+        Provision many subnets from a CSV/JSON export or an iterable of dicts.
+
+        Rows use the :meth:`post` field names (matched case-insensitively; other columns are
+        ignored). Each row is validated locally (CIDR, paired and in-range latitude/longitude,
+        booleans), matched to an existing subnet by ``sid`` or, when ``sid`` is missing, by an
+        identical ``network``, and diffed against it. Only rows with real changes are POSTed,
+        concurrently and with an optional rate limit, sending just the changed fields.
+
+        Args:
+            source: Path to a ``.csv``, ``.json`` (list of objects or ``{"subnets": [...]}``) or
+                ``.ndjson``/``.jsonl`` file, or an iterable of row dicts.
+            format (str, optional): ``"csv"``, ``"json"`` or ``"ndjson"``; inferred from the file
+                extension when omitted.
+            current (iterable of dict, optional): Current subnet objects to diff against. Fetched
+                with one ``/subnets`` request when omitted.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            rate_limit (float, optional): Maximum requests started per second.
+            progress (callable, optional): Called as ``progress(done, total)`` after each POST.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+
+        Returns:
+            list of dict: One ``{"row", "sid", "status", "changes", "error"}`` entry per input row,
+            in input order. ``row`` is the 1-based row number, ``status`` one of ``"updated"``,
+            ``"unchanged"``, ``"invalid"`` or ``"failed"``, and ``error`` the exception for
+            invalid and failed rows.
+
+        Example:
+            log = client.subnets.bulk_import("ipam_export.csv", rate_limit=10)
+            problems = [entry for entry in log if entry["error"]]
+        """
+        if current is None:
+            response = self.get(timeout=timeout)
+            current = response.get("subnets", [response]) if isinstance(response, dict) else response or []
+        by_sid: dict[int, dict] = {}
+        by_network: dict[str, list[dict]] = {}
+        for subnet in current:
+            if subnet.get("sid") is None:
+                continue
+            by_sid[subnet["sid"]] = subnet
+            network = _normalize_network(subnet.get("network"))
+            if network:
+                by_network.setdefault(network, []).append(subnet)
+
+        log: list[dict] = []
+        pending: list[tuple[dict, dict]] = []
+        for number, row in enumerate(_subnet_rows(source, format), start=1):
+            entry: dict[str, Any] = {"row": number, "sid": None, "status": "invalid", "changes": {}, "error": None}
+            log.append(entry)
+            try:
+                sid, fields = _subnet_fields(row)
+                if sid is None:
+                    matches = by_network.get(fields.get("network", ""), [])
+                    if len(matches) != 1:
+                        reason = "No existing subnet has" if not matches else "Several subnets have"
+                        raise ValueError(f"{reason} network {fields.get('network')!r}; specify sid")
+                    sid = matches[0]["sid"]
+                subnet = by_sid.get(sid)
+                if subnet is None:
+                    raise ValueError(f"No existing subnet with sid {sid}")
+            except ValueError as e:
+                entry["error"] = e
+                continue
+            entry["sid"] = sid
+            entry["changes"] = {
+                key: value for key, value in fields.items() if not _same_value(key, subnet.get(key), value)
+            }
+            if entry["changes"]:
+                pending.append((entry, entry["changes"]))
+            else:
+                entry["status"] = "unchanged"
+
+        for (entry, changes), _, error in _run_bulk(
+            lambda item: self.post(item[0]["sid"], timeout=timeout, **item[1]),
+            pending,
+            max_workers=max_workers,
+            progress=progress,
+            rate_limit=rate_limit,
+        ):
+            entry["status"] = "failed" if error else "updated"
+            entry["error"] = error
+        return log
+
+
+class SubnetResolver:
+    """Longest-prefix IP-to-subnet resolution built from ``/subnets``.
+
+    The subnet ``network`` CIDRs are compiled once into one hash table per
+    prefix length, so a lookup costs at most one dict probe per distinct prefix
+    length in use. With NumPy installed, :meth:`resolve_array` resolves whole
+    arrays of integer IPs with one vectorized pass per prefix length.
+
+    Example::
+
+        resolver = SubnetResolver(client.subnets)
+        resolver.load()
+        subnet = resolver.resolve("10.0.12.7")
+        sids = resolver.resolve_array(np.array([167772161, 167775239], dtype=np.uint32))
+    """
+
+    def __init__(self, subnets: Subnets) -> None:
+        """
+        Args:
+            subnets (Subnets): Subnets endpoint used to fetch data (e.g. ``client.subnets``).
+        """
+        self.subnets = subnets
+        # {version: [(prefixlen, mask, {network_int: subnet})]} longest prefix first
+        self._tables: dict[int, list[tuple[int, int, dict[int, dict]]]] = {4: [], 6: []}
+        self._sorted: dict[int, list[tuple[Any, Any, Any]]] = {}
+
+    def load(self, timeout: float | tuple[float, float] | None = _UNSET, **params) -> int:
+        """
+        Fetch ``/subnets`` and compile the lookup tables.
+
+        Args:
+            timeout (float or tuple, optional): Request timeout in seconds.
+            **params: Extra filters forwarded to :meth:`Subnets.get` (e.g. ``seensince``).
+
+        Returns:
+            int: Number of subnets with a usable ``network`` CIDR.
+        """
+        response = self.subnets.get(timeout=timeout, **params)
+        if isinstance(response, dict):
+            response = response.get("subnets", [response])
+        return self.compile(response or [])
+
+    def compile(self, subnets: Iterable[dict]) -> int:
+        """Compile lookup tables from subnet objects (as returned by ``/subnets``)."""
+        tables: dict[int, dict[int, dict[int, dict]]] = {4: {}, 6: {}}
+        count = 0
+        for subnet in subnets:
+            network = subnet.get("network")
+            if not network:
+                continue
+            try:
+                net = ipaddress.ip_network(network, strict=False)
+            except ValueError:
+                continue
+            tables[net.version].setdefault(net.prefixlen, {})[int(net.network_address)] = subnet
+            count += 1
+
+        for version, bits in ((4, 32), (6, 128)):
+            full = (1 << bits) - 1
+            self._tables[version] = [
+                (prefixlen, full ^ ((1 << (bits - prefixlen)) - 1), table)
+                for prefixlen, table in sorted(tables[version].items(), reverse=True)
+            ]
+        self._sorted = {}
+        return count
+
+    def resolve(self, ip: str | int | ipaddress.IPv4Address | ipaddress.IPv6Address, version: int = 4) -> dict | None:
+        """
+        Return the most specific subnet containing ``ip``.
+
+        Args:
+            ip: IP address as a string, an ``ipaddress`` object, or an integer.
+            version (int, optional): IP version used to interpret integer input. Defaults to 4.
+
+        Returns:
+            dict or None: The matching subnet object from ``/subnets``, or None. Integers that are
+            not a valid address for ``version`` (negative or too large) never match.
+        """
+        if isinstance(ip, int):
+            value = ip
+            if not 0 <= value <= _MAX_IP[version]:
+                return None
+        else:
+            address = ipaddress.ip_address(ip) if isinstance(ip, str) else ip
+            value, version = int(address), address.version
+        for _, mask, table in self._tables[version]:
+            subnet = table.get(value & mask)
+            if subnet is not None:
+                return subnet
+        return None
+
+    def resolve_sid(
+        self, ip: str | int | ipaddress.IPv4Address | ipaddress.IPv6Address, version: int = 4
+    ) -> int | None:
+        """Return the ``sid`` of the most specific subnet containing ``ip``, or None."""
+        subnet = self.resolve(ip, version=version)
+        return None if subnet is None else subnet.get("sid")
+
+    def resolve_many(self, ips: Iterable[str | int], version: int = 4) -> list[dict | None]:
+        """Resolve an iterable of IPs, returning one subnet (or None) per input."""
+        return [self.resolve(ip, version=version) for ip in ips]
+
+    def resolve_array(self, ips: Any, version: int = 4) -> Any:
+        """
+        Resolve a NumPy array of integer IPs to subnet IDs.
+
+        Lookups are vectorized with one ``searchsorted`` pass per prefix length.
+        IPv4 addresses are matched as ``uint64``. IPv6 addresses do not fit NumPy's
+        64-bit integers, so they are split into high and low ``uint64`` halves and
+        matched as 16-byte big-endian keys; only converting object arrays of Python
+        ints into the halves is done per element.
+
+        Args:
+            ips: NumPy array (or array-like) of IPs as integers.
+            version (int, optional): IP version of the input. Defaults to 4.
+
+        Returns:
+            numpy.ndarray: ``int64`` array of ``sid`` values, ``-1`` where no subnet matches
+            or the value is not a valid address for ``version`` (negative or too large).
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("resolve_array() requires numpy; install it with 'pip install numpy'.")
+        shape = np.shape(ips)
+        ips = np.atleast_1d(np.asarray(ips))
+        result = np.full(ips.shape, -1, dtype=np.int64)
+        if ips.dtype.kind not in "iu":
+            ips = np.asarray(np.frompyfunc(int, 1, 1)(ips), dtype=object)
+        # Out-of-range values would wrap when cast to uint64; they never match
+        if ips.dtype.kind in "iu" and version == 6:
+            valid = ips >= 0
+        else:
+            valid = np.asarray((ips >= 0) & (ips <= _MAX_IP[version]), dtype=bool)
+
+        if version == 6:
+            if ips.dtype == object:
+                values = np.where(valid, ips, 0)
+                high = (values >> 64).astype(np.uint64)
+                low = (values & _UINT64_MAX).astype(np.uint64)
+            else:
+                high = np.zeros(ips.shape, dtype=np.uint64)
+                low = np.where(valid, ips, 0).astype(np.uint64)
+        else:
+            values = np.where(valid, ips, 0).astype(np.uint64)
+
+        unresolved = valid.copy()
+        for mask, networks, sids in self._sorted_tables(version):
+            if version == 6:
+                masked = _ipv6_keys(high & mask[0], low & mask[1])
+            else:
+                masked = values & mask
+            positions = np.searchsorted(networks, masked)
+            np.minimum(positions, len(networks) - 1, out=positions)
+            hit = unresolved & (networks[positions] == masked)
+            result[hit] = sids[positions[hit]]
+            unresolved &= ~hit
+            if not unresolved.any():
+                break
+        return result.reshape(shape)
+
+    def _sorted_tables(self, version: int) -> list[tuple[Any, Any, Any]]:
+        # Sorted network/sid arrays per prefix length, built lazily for resolve_array()
+        if version not in self._sorted:
+            arrays = []
+            for _, mask, table in self._tables[version]:
+                networks = sorted(table)
+                sids = np.array([_sid_or_missing(table[network]) for network in networks], dtype=np.int64)
+                if version == 6:
+                    keys = _ipv6_keys(
+                        np.array([network >> 64 for network in networks], dtype=np.uint64),
+                        np.array([network & _UINT64_MAX for network in networks], dtype=np.uint64),
+                    )
+                    arrays.append(((np.uint64(mask >> 64), np.uint64(mask & _UINT64_MAX)), keys, sids))
+                else:
+                    arrays.append((np.uint64(mask), np.array(networks, dtype=np.uint64), sids))
+            self._sorted[version] = arrays
+        return self._sorted[version]
+
+
+def _ipv6_keys(high: Any, low: Any) -> Any:
+    """Pack ``uint64`` halves into 16-byte big-endian keys that sort like the 128-bit values."""
+    keys = np.empty(high.shape, dtype=[("high", ">u8"), ("low", ">u8")])
+    keys["high"] = high
+    keys["low"] = low
+    return keys.view("V16")
+
+
+def _sid_or_missing(subnet: dict) -> int:
+    sid = subnet.get("sid")
+    return -1 if sid is None else sid
+
+
+def _subnet_rows(source: str | os.PathLike | Iterable[dict], format: str | None) -> Iterable[dict]:
+    """Yield row dicts from a CSV/JSON/NDJSON file or pass an iterable of dicts through."""
+    if not isinstance(source, (str, os.PathLike)):
+        yield from source
+        return
+    path = os.fspath(source)
+    if format is None:
+        extension = os.path.splitext(path)[1].lower().lstrip(".")
+        format = "ndjson" if extension == "jsonl" else extension
+    if format not in ("csv", "json", "ndjson"):
+        raise ValueError("format must be 'csv', 'json' or 'ndjson'.")
+    with open(path, newline="" if format == "csv" else None, encoding="utf-8") as handle:
+        if format == "csv":
+            yield from csv.DictReader(handle)
+        elif format == "ndjson":
+            yield from (json.loads(line) for line in handle if line.strip())
+        else:
+            data = json.load(handle)
+            yield from data.get("subnets", []) if isinstance(data, dict) else data
+
+
+def _subnet_fields(row: dict) -> tuple[int | None, dict[str, Any]]:
+    """Validate one import row into ``(sid, fields)``, raising ValueError on bad values."""
+    if not isinstance(row, dict):
+        raise ValueError(f"Row must be a mapping, got {type(row).__name__}")
+    sid = None
+    fields: dict[str, Any] = {}
+    for key, value in row.items():
+        if value is None or value == "" or not isinstance(key, str):
+            continue
+        if key.lower() == "sid":
+            try:
+                sid = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid sid {value!r}") from None
+            continue
+        name = _SUBNET_FIELDS.get(key.lower())
+        if name is None:
+            continue
+        if name == "network":
+            normalized = _normalize_network(value)
+            if normalized is None:
+                raise ValueError(f"Invalid network CIDR {value!r}")
+            fields[name] = normalized
+        elif name in ("latitude", "longitude"):
+            try:
+                fields[name] = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid {name} {value!r}") from None
+        elif name == "label":
+            fields[name] = str(value)
+        else:
+            fields[name] = _parse_bool(name, value)
+
+    if ("latitude" in fields) != ("longitude" in fields):
+        raise ValueError("latitude and longitude must be given together")
+    if not -90 <= fields.get("latitude", 0) <= 90:
+        raise ValueError(f"latitude {fields['latitude']} is out of range (-90 to 90)")
+    if not -180 <= fields.get("longitude", 0) <= 180:
+        raise ValueError(f"longitude {fields['longitude']} is out of range (-180 to 180)")
+    if sid is None and "network" not in fields:
+        raise ValueError("Row needs a sid or a network to match an existing subnet")
+    return sid, fields
+
+
+def _normalize_network(value: Any) -> str | None:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return str(ipaddress.ip_network(value.strip(), strict=False))
+    except ValueError:
+        return None
+
+
+def _parse_bool(name: str, value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Invalid {name} {value!r}; expected true/false")
+
+
+def _same_value(key: str, current: Any, value: Any) -> bool:
+    # Appliance values may be formatted differently from the normalized import values
+    if key == "network":
+        return _normalize_network(current) == value
+    if isinstance(value, float) and isinstance(current, (int, float)) and not isinstance(current, bool):
+        return abs(current - value) < 1e-9
+    return current == value
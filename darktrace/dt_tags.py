@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
-from .dt_utils import _UNSET, BaseEndpoint
+from .dt_utils import _UNSET, BaseEndpoint, _run_bulk
 
-__all__ = ["Tags"]
+__all__ = ["DeviceSet", "TagIndex", "Tags"]
 
 
 class Tags(BaseEndpoint):
+    # Tag name (lower-cased) -> tid, filled from one get() by resolve_tag_ids()
+    _tag_ids: dict[str, int] | None = None
+
     # TAGS ENDPOINT
     def get(
         self,
@@ -226,3 +230,398 @@ class Tags(BaseEndpoint):
             dict: The response from the Darktrace API.
         """
         return self._delete(f"/tags/{tid}/entities/{teid}", timeout=timeout)
+
+    # BULK HELPERS
+
+    def resolve_tag_ids(
+        self,
+        tags: Iterable[str],
+        refresh: bool = False,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict[str, int]:
+        """
+        Resolve tag names to tag IDs (tids) from a cached tag list.
+
+        The full tag list is fetched with :meth:`get` on first use and reused afterwards;
+        a name missing from the cache triggers one refresh.
+
+        Args:
+            tags (iterable of str): Tag names (case-insensitive).
+            refresh (bool, optional): Refetch the tag list first.
+            timeout (float or tuple, optional): Request timeout in seconds.
+
+        Returns:
+            dict: ``{name: tid}`` for the requested names.
+
+        Raises:
+            ValueError: If a tag name does not exist.
+        """
+        names = list(dict.fromkeys(tags))
+        if refresh or self._tag_ids is None or any(name.lower() not in self._tag_ids for name in names):
+            response = self.get(timeout=timeout)
+            if isinstance(response, dict):
+                response = response.get("tags", [response])
+            self._tag_ids = {
+                tag["name"].lower(): tag["tid"]
+                for tag in response or []
+                if isinstance(tag, dict) and tag.get("name") and tag.get("tid") is not None
+            }
+        unknown = [name for name in names if name.lower() not in self._tag_ids]
+        if unknown:
+            raise ValueError(f"Unknown tag(s): {', '.join(unknown)}")
+        return {name: self._tag_ids[name.lower()] for name in names}
+
+    def bulk_tag(
+        self,
+        dids: Iterable[int],
+        tags: str | Iterable[str],
+        duration: int | None = None,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Apply one or more tags to many devices.
+
+        Tag IDs are resolved once via :meth:`resolve_tag_ids`, then devices are sent to
+        :meth:`post_tag_entities` in batches of ``batch_size`` with bounded concurrency.
+
+        Args:
+            dids (iterable of int): Device IDs to tag.
+            tags (str or iterable of str): Tag name(s) to apply.
+            duration (int, optional): Seconds the tags should stay applied.
+            batch_size (int, optional): Devices per request. Defaults to 100.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            rate_limit (float, optional): Maximum requests started per second.
+            progress (callable, optional): Called as ``progress(done, total)`` after each request.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+
+        Returns:
+            dict: ``{"succeeded": [{"did", "tag"}], "failed": [{"did", "tag", "error"}], "skipped": []}``.
+            A failed request marks every device of its batch as failed.
+
+        Raises:
+            ValueError: If a tag does not exist or ``batch_size`` is below 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        tag_ids = self.resolve_tag_ids([tags] if isinstance(tags, str) else tags, timeout=timeout)
+        dids = list(dict.fromkeys(dids))
+        tasks = [
+            (tag, tid, dids[i : i + batch_size])
+            for tag, tid in tag_ids.items()
+            for i in range(0, len(dids), batch_size)
+        ]
+
+        def apply(task: tuple[str, int, list[int]]) -> dict:
+            _, tid, batch = task
+            return self.post_tag_entities(
+                tid, "Device", [str(did) for did in batch], expiryDuration=duration, timeout=timeout
+            )
+
+        report: dict[str, list] = {"succeeded": [], "failed": [], "skipped": []}
+        for (tag, _, batch), _, error in _run_bulk(
+            apply, tasks, max_workers=max_workers, progress=progress, rate_limit=rate_limit
+        ):
+            for did in batch:
+                if error is None:
+                    report["succeeded"].append({"did": did, "tag": tag})
+                else:
+                    report["failed"].append({"did": did, "tag": tag, "error": error})
+        return report
+
+    def bulk_untag(
+        self,
+        dids: Iterable[int],
+        tags: str | Iterable[str],
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> dict:
+        """
+        Remove one or more tags from many devices.
+
+        For each tag, the current tag entities are listed once with :meth:`get_tag_entities`
+        to find each device's tag-entity ID (teid); :meth:`delete_tag_entity` is then called
+        per device with bounded concurrency.
+
+        Args:
+            dids (iterable of int): Device IDs to untag.
+            tags (str or iterable of str): Tag name(s) to remove.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            rate_limit (float, optional): Maximum requests started per second.
+            progress (callable, optional): Called as ``progress(done, total)`` after each request.
+            timeout (float or tuple, optional): Timeout for each request in seconds.
+
+        Returns:
+            dict: ``{"succeeded": [{"did", "tag"}], "failed": [{"did", "tag", "error"}],
+            "skipped": [{"did", "tag"}]}``, where skipped devices did not carry the tag.
+
+        Raises:
+            ValueError: If a tag does not exist.
+        """
+        tag_ids = self.resolve_tag_ids([tags] if isinstance(tags, str) else tags, timeout=timeout)
+        dids = list(dict.fromkeys(dids))
+        report: dict[str, list] = {"succeeded": [], "failed": [], "skipped": []}
+        tasks = []
+        for tag, tid in tag_ids.items():
+            teids = _device_teids(self.get_tag_entities(tid, timeout=timeout))
+            for did in dids:
+                if did in teids:
+                    tasks.append((tag, tid, did, teids[did]))
+                else:
+                    report["skipped"].append({"did": did, "tag": tag})
+
+        def apply(task: tuple[str, int, int, int]) -> dict:
+            _, tid, _, teid = task
+            return self.delete_tag_entity(tid, teid, timeout=timeout)
+
+        for (tag, _, did, _), _, error in _run_bulk(
+            apply, tasks, max_workers=max_workers, progress=progress, rate_limit=rate_limit
+        ):
+            if error is None:
+                report["succeeded"].append({"did": did, "tag": tag})
+            else:
+                report["failed"].append({"did": did, "tag": tag, "error": error})
+        return report
+
+
+class DeviceSet:
+    """Immutable set of devices backed by a bitmap over a :class:`TagIndex`.
+
+    Supports ``&``, ``|``, ``-``, ``^`` and ``~`` (complement within the index),
+    ``len()``, ``in`` and iteration over device IDs. Operations work on whole
+    machine words at a time, so combining sets of tens of thousands of devices
+    takes microseconds.
+    """
+
+    __slots__ = ("_index", "bits")
+
+    def __init__(self, index: TagIndex, bits: int) -> None:
+        self._index = index
+        self.bits = bits
+
+    def _combine(self, other: DeviceSet, bits: int) -> DeviceSet:
+        if other._index is not self._index:
+            raise ValueError("DeviceSets from different TagIndex instances cannot be combined.")
+        return DeviceSet(self._index, bits)
+
+    def __and__(self, other: DeviceSet) -> DeviceSet:
+        return self._combine(other, self.bits & other.bits)
+
+    def __or__(self, other: DeviceSet) -> DeviceSet:
+        return self._combine(other, self.bits | other.bits)
+
+    def __sub__(self, other: DeviceSet) -> DeviceSet:
+        return self._combine(other, self.bits & ~other.bits)
+
+    def __xor__(self, other: DeviceSet) -> DeviceSet:
+        return self._combine(other, self.bits ^ other.bits)
+
+    def __invert__(self) -> DeviceSet:
+        return DeviceSet(self._index, self._index.all().bits & ~self.bits)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DeviceSet) and other._index is self._index and other.bits == self.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, did: object) -> bool:
+        position = self._index._positions.get(did)  # type: ignore[arg-type]
+        return position is not None and (self.bits >> position) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.dids())
+
+    def __repr__(self) -> str:
+        return f"<DeviceSet size={len(self)}>"
+
+    def dids(self) -> list[int]:
+        """Return the device IDs in the set, in index order."""
+        dids = self._index._dids
+        # Reverse the binary string so character i is bit i
+        return [dids[position] for position, bit in enumerate(bin(self.bits)[:1:-1]) if bit == "1"]
+
+
+class TagIndex:
+    """Device membership bitmaps for tags, subnets and device types.
+
+    :meth:`load` fetches ``/devices`` once and each tag's entities via
+    :meth:`Tags.get_tag_entities` (concurrently), assigns every device a dense
+    bit position and stores each tag, subnet (``sid``) and device type
+    (``typename``) as a bitmap. Queries combine :class:`DeviceSet` objects
+    with set operators instead of repeated API calls and Python set work.
+
+    Example::
+
+        index = TagIndex(client.tags, client.devices)
+        index.load()
+        hits = index.tag("Critical") & index.subnet(12) - index.tag("Ignored")
+        print(len(hits), hits.dids()[:10])
+    """
+
+    def __init__(self, tags: Tags, devices: BaseEndpoint, max_workers: int = 4) -> None:
+        """
+        Args:
+            tags (Tags): Tags endpoint used to fetch tags and their entities (e.g. ``client.tags``).
+            devices (Devices): Devices endpoint used to fetch the device list (e.g. ``client.devices``).
+            max_workers (int, optional): Concurrent ``get_tag_entities`` requests. Defaults to 4.
+        """
+        self._tags_endpoint = tags
+        self._devices_endpoint = devices
+        self.max_workers = max_workers
+        self._dids: list[int] = []
+        self._positions: dict[int, int] = {}
+        self._tags: dict[str, int] = {}
+        self._subnets: dict[int, int] = {}
+        self._types: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._dids)
+
+    def load(
+        self,
+        tags: Iterable[str] | None = None,
+        timeout: float | tuple[float, float] | None = _UNSET,
+    ) -> None:
+        """
+        Fetch devices and tag memberships and rebuild all bitmaps.
+
+        Args:
+            tags (iterable of str, optional): Only load these tags. Defaults to every tag.
+            timeout (float or tuple, optional): Request timeout in seconds.
+
+        Raises:
+            Exception: The first error from fetching a tag's entities.
+        """
+        devices = self._devices_endpoint.get(timeout=timeout)
+        if isinstance(devices, dict):
+            devices = devices.get("devices", [devices])
+        tag_list = self._tags_endpoint.get(timeout=timeout)
+        if isinstance(tag_list, dict):
+            tag_list = tag_list.get("tags", [tag_list])
+        wanted = None if tags is None else {tag.lower() for tag in tags}
+        tag_ids = {
+            tag["name"]: tag["tid"]
+            for tag in tag_list or []
+            if isinstance(tag, dict)
+            and tag.get("name")
+            and tag.get("tid") is not None
+            and (wanted is None or tag["name"].lower() in wanted)
+        }
+        results = _run_bulk(
+            lambda tid: _entity_dids(self._tags_endpoint.get_tag_entities(tid, timeout=timeout)),
+            list(tag_ids.values()),
+            max_workers=self.max_workers,
+        )
+        for _, _, error in results:
+            if error is not None:
+                raise error
+
+        self._dids = []
+        self._positions = {}
+        subnets: dict[int, list[int]] = {}
+        types: dict[str, list[int]] = {}
+        for device in devices or []:
+            did = device.get("did") if isinstance(device, dict) else None
+            if did is None or did in self._positions:
+                continue
+            position = self._position(did)
+            if device.get("sid") is not None:
+                subnets.setdefault(device["sid"], []).append(position)
+            if device.get("typename"):
+                types.setdefault(device["typename"].lower(), []).append(position)
+
+        self._tags = {
+            name.lower(): _bitmap(self._position(did) for did in dids) for name, (_, dids, _) in zip(tag_ids, results)
+        }
+        self._subnets = {sid: _bitmap(positions) for sid, positions in subnets.items()}
+        self._types = {typename: _bitmap(positions) for typename, positions in types.items()}
+
+    def all(self) -> DeviceSet:
+        """Every device known to the index."""
+        return DeviceSet(self, (1 << len(self._dids)) - 1)
+
+    def none(self) -> DeviceSet:
+        """The empty set."""
+        return DeviceSet(self, 0)
+
+    def tag(self, name: str) -> DeviceSet:
+        """Devices carrying tag ``name`` (case-insensitive); empty if unknown."""
+        return DeviceSet(self, self._tags.get(name.lower(), 0))
+
+    def subnet(self, sid: int) -> DeviceSet:
+        """Devices in subnet ``sid``."""
+        return DeviceSet(self, self._subnets.get(sid, 0))
+
+    def type(self, typename: str) -> DeviceSet:
+        """Devices of type ``typename`` (case-insensitive, e.g. ``"desktop"``)."""
+        return DeviceSet(self, self._types.get(typename.lower(), 0))
+
+    def devices(self, dids: Iterable[int]) -> DeviceSet:
+        """A set from explicit device IDs; IDs unknown to the index are ignored."""
+        return DeviceSet(self, _bitmap(self._positions[did] for did in dids if did in self._positions))
+
+    @property
+    def tags(self) -> list[str]:
+        """Names (lower-cased) of the loaded tags."""
+        return list(self._tags)
+
+    def _position(self, did: int) -> int:
+        position = self._positions.get(did)
+        if position is None:
+            position = self._positions[did] = len(self._dids)
+            self._dids.append(did)
+        return position
+
+
+def _bitmap(positions: Iterable[int]) -> int:
+    """Pack bit positions into an int bitmap."""
+    positions = list(positions)
+    if not positions:
+        return 0
+    buffer = bytearray(max(positions) // 8 + 1)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _entity_did(entity: Any) -> int | None:
+    """Device ID of a ``/tags/[tid]/entities`` item, or None for credentials/unparseable items."""
+    if not isinstance(entity, dict) or entity.get("entityType", "Device") != "Device":
+        return None
+    try:
+        return int(entity.get("did", entity.get("entityValue")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _entity_list(response: dict | list) -> list:
+    if isinstance(response, dict):
+        return response.get("entities", [response])
+    return response or []
+
+
+def _entity_dids(response: dict | list) -> list[int]:
+    """Device IDs from a ``/tags/[tid]/entities`` response."""
+    return [did for did in map(_entity_did, _entity_list(response)) if did is not None]
+
+
+def _device_teids(response: dict | list) -> dict[int, int]:
+    """Map device ID -> tag-entity ID (teid) from a ``/tags/[tid]/entities`` response."""
+    teids: dict[int, int] = {}
+    for entity in _entity_list(response):
+        did = _entity_did(entity)
+        if did is not None and entity.get("teid") is not None:
+            teids[did] = entity["teid"]
+    return teids
@@ -5,7 +5,11 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import requests
@@ -145,6 +149,33 @@ class BaseEndpoint:
         Returns:
             Parsed JSON response.
         """
+        return self._decode(self._get_response(endpoint, params=params, timeout=timeout))
+
+    def _get_raw(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        timeout: _InternalTimeoutType = _UNSET,
+    ) -> bytes:
+        """Make an authenticated GET request and return the undecoded response body.
+
+        Used by callers that decode the JSON themselves (e.g. into compact records).
+        """
+        return self._get_response(endpoint, params=params, timeout=timeout).content
+
+    def _decode(self, response: requests.Response) -> Any:
+        """Decode a JSON response, compacting it when the client has ``compact_json`` enabled."""
+        if getattr(self.client, "compact_json", False):
+            return _compact_loads(response.content)
+        return response.json()
+
+    def _get_response(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        timeout: _InternalTimeoutType = _UNSET,
+    ) -> requests.Response:
+        """Make an authenticated GET request and return the checked response object."""
         headers, sorted_params = self._get_headers(endpoint, params)
         url = f"{self.client.host}{endpoint}"
         resolved_timeout = self._resolve_timeout(timeout)
@@ -157,7 +188,7 @@ class BaseEndpoint:
             timeout=resolved_timeout,
         )
         _raise_for_status(response, method="GET", url=url)
-        return response.json()
+        return response
 
     def _post_json(
         self,
@@ -335,6 +366,185 @@ class BaseEndpoint:
         raise RuntimeError("Unexpected state in retry loop")  # pragma: no cover
 
 
+class _RateLimiter:
+    """Thread-safe limiter spacing calls evenly at ``rate`` calls per second."""
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate_limit must be positive.")
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller's slot is due."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _run_bulk(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 4,
+    progress: Callable[[int, int], None] | None = None,
+    rate_limit: float | None = None,
+) -> list[tuple[Any, Any, Exception | None]]:
+    """Apply ``func`` to every item with bounded concurrency.
+
+    Failures are collected per item instead of aborting the whole batch.
+    Requests share the client's ``requests.Session``; keep ``max_workers``
+    at or below the session's connection pool size (10 by default).
+
+    Args:
+        func: Callable invoked once per item.
+        items: Items to process.
+        max_workers: Maximum number of concurrent calls.
+        progress: Optional callback invoked as ``progress(done, total)`` after each item.
+        rate_limit: Optional maximum number of calls started per second, across all workers.
+
+    Returns:
+        List of ``(item, result, error)`` tuples in input order. ``error`` is
+        ``None`` on success and ``result`` is ``None`` on failure.
+    """
+    items = list(items)
+    total = len(items)
+    results: list[tuple[Any, Any, Exception | None]] = [(item, None, None) for item in items]
+    completed = _iter_bulk(
+        lambda pair: func(pair[1]), enumerate(items), max_workers=min(max_workers, total), rate_limit=rate_limit
+    )
+    for done, ((index, item), result, error) in enumerate(completed, start=1):
+        results[index] = (item, result, error)
+        if progress is not None:
+            progress(done, total)
+    return results
+
+
+def _iter_bulk(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 4,
+    rate_limit: float | None = None,
+) -> Iterator[tuple[Any, Any, Exception | None]]:
+    """Streaming form of :func:`_run_bulk`.
+
+    Items are pulled lazily and at most ``2 * max_workers`` calls are in flight,
+    so arbitrarily long (or generated) inputs run in bounded memory. Results are
+    yielded as ``(item, result, error)`` tuples in completion order.
+    """
+    if rate_limit is not None:
+        limiter = _RateLimiter(rate_limit)
+        unlimited = func
+
+        def func(item: Any) -> Any:
+            limiter.wait()
+            return unlimited(item)
+
+    max_workers = max(1, max_workers)
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: dict[Future, Any] = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < 2 * max_workers:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                else:
+                    in_flight[executor.submit(func, item)] = item
+            if not in_flight:
+                return
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                item = in_flight.pop(future)
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    logger.debug("Bulk item %r failed: %s", item, e)
+                    yield item, None, e
+
+
+def _compact_loads(body: bytes | str) -> Any:
+    """Decode JSON so equal strings and equal sub-objects are shared instead of duplicated.
+
+    String values are deduplicated through a per-response table and objects/arrays are
+    built bottom-up, so an object whose contents match one already seen (e.g. the same
+    device block embedded in thousands of rows) is replaced by that first instance.
+    Shared containers are aliased: treat the result as read-only.
+    """
+    strings: dict[str, str] = {}
+    shared: dict[tuple, Any] = {}
+
+    def share(value: Any) -> tuple[Any, Any]:
+        # Return the shared instance of value and a hashable key identifying its contents
+        kind = type(value)
+        if kind is str:
+            value = strings.setdefault(value, value)
+            return value, value
+        if kind is list:
+            items = [share(item) for item in value]
+            signature = (list, *(key for _, key in items))
+            found = shared.get(signature)
+            if found is None:
+                found = shared[signature] = [item for item, _ in items]
+            return found, (list, id(found))
+        if kind is dict:
+            # Objects come out of object_pairs_hook already shared, so identity is content
+            return value, (dict, id(value))
+        if kind is float:
+            # 0.0 == -0.0, so key floats by their text to keep the sign
+            return value, (float, repr(value))
+        return value, (kind, value)
+
+    def hook(pairs: list[tuple[str, Any]]) -> dict:
+        obj = {}
+        signature = []
+        for name, value in pairs:
+            kind = type(value)
+            # Inline the common scalar cases; share() handles containers
+            if kind is str:
+                obj[name] = key = strings.setdefault(value, value)
+            elif kind is int or kind is bool or value is None:
+                obj[name] = value
+                key = (kind, value)
+            else:
+                obj[name], key = share(value)
+            signature.append(name)
+            signature.append(key)
+        return shared.setdefault(tuple(signature), obj)
+
+    try:
+        return share(json.loads(body, object_pairs_hook=hook))[0]
+    finally:
+        # share() is a self-referencing closure; free the tables now rather than at the next GC
+        strings.clear()
+        shared.clear()
+
+
+def _epoch_seconds(value: Any) -> float | None:
+    # Timestamps may be epoch seconds/ms (number or numeric string) or an ISO 8601 timestamp
+    if value is None or value == "" or isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)
+    return None
+
+
 def encode_query(query: dict) -> str:
     """Encode a query dict as a base64-encoded JSON string.
 
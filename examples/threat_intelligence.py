@@ -21,7 +21,7 @@ from typing import List, Dict, Any
 # Add the parent directory to the path so we can import the darktrace module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from darktrace import DarktraceClient
+from darktrace import DarktraceClient, DeviceIndex, IntelMatcher
 
 # Set up logging
 logging.basicConfig(
@@ -86,13 +86,23 @@ def find_devices_communicating_with_threats(
     """
     logger.info("Searching for devices communicating with known threats")
 
-    # Get all devices
-    all_devices = client.devices.get()
-
-    # This is a simplified example - in a real implementation, you would use
-    # the advanced search module to find devices communicating with the threat IPs/domains
-    # For demonstration purposes, we'll just return a subset of devices
-    return all_devices[:5] if len(all_devices) > 5 else all_devices
+    # Load the device inventory once and compile the indicators into a local matcher,
+    # so each device costs a few dict lookups instead of a scan over every threat
+    index = DeviceIndex(client.devices)
+    index.build()
+    matcher = IntelMatcher(client.intelfeed)
+    matcher.compile(threats)
+
+    # This is a simplified example - it only matches indicators against internal
+    # device IPs and hostnames. In a real implementation, you would also run
+    # matcher.match_events() over client.details.get(...) connection events
+    matched = {}
+    for record in index:
+        candidates = [record.hostname, record.ip, *record.ips]
+        if any(hit is not None for hit in matcher.match_many(candidates)):
+            matched[record.did] = {"did": record.did, "hostname": record.hostname, "ip": record.ip}
+
+    return list(matched.values())
 
 
 def get_model_breaches_for_devices(
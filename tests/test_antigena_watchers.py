@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Mock tests for long-running RESPOND (Antigena) helpers.
+
+Covers helpers that track RESPOND actions over time rather than issuing a
+single request (action keeper, action watcher, ...).
+
+All tests use mocks — no live API calls.
+
+Run: pytest tests/test_antigena_watchers.py -v
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from darktrace import ActionEvent, ActionKeeper, ActionWatcher, DarktraceClient
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+@pytest.fixture
+def client():
+    """Create a DarktraceClient instance for testing."""
+    return DarktraceClient(
+        host="https://test.example.com",
+        public_token="test_public",
+        private_token="test_private",
+    )
+
+
+def _response(payload, status_code=200):
+    """Build a mock response returning ``payload``."""
+    response = Mock()
+    response.status_code = status_code
+    response.reason = "Error" if status_code >= 400 else "OK"
+    response.url = "https://test.example.com"
+    response.headers = {}
+    response.json = Mock(return_value=payload)
+    return response
+
+
+class _FakeAntigena:
+    """Serves ``/antigena`` from an in-memory action table and records requests."""
+
+    def __init__(self, client, actions, failing=()):
+        self.actions = {action["codeid"]: action for action in actions}
+        self.failing = set(failing)
+        self.gets = 0
+        self.extends = []
+        client._session.request = Mock(side_effect=self.request)
+
+    def request(self, method, url, **kwargs):
+        if method == "GET":
+            self.gets += 1
+            return _response({"actions": list(self.actions.values())})
+        body = json.loads(kwargs["data"])
+        if body["codeid"] in self.failing:
+            return _response({}, status_code=400)
+        self.extends.append((body["codeid"], body["duration"]))
+        return _response({"code": 200})
+
+
+T = 1_700_000_000  # base epoch seconds; tests use offsets from it
+
+
+def _action(codeid, expires, **fields):
+    return {
+        "codeid": codeid,
+        "did": codeid,
+        "active": True,
+        "cleared": False,
+        "expires": (T + expires) * 1000,
+        **fields,
+    }
+
+
+# ==============================================================================
+# ActionKeeper
+# ==============================================================================
+class TestActionKeeper:
+    """Test just-in-time extension of kept RESPOND actions."""
+
+    def test_extends_only_when_due_and_batches(self, client):
+        """Actions are extended once they enter the lead window, in one batch per slot."""
+        api = _FakeAntigena(client, [_action(1, 1000), _action(2, 1005), _action(3, 5000)])
+        keeper = ActionKeeper(client.antigena, duration=600, lead=60, resolution=10, refresh_interval=300)
+        for codeid in (1, 2, 3):
+            keeper.keep(codeid)
+
+        assert keeper.run_pending(now=T + 900) == {"extended": [], "failed": [], "released": []}
+        assert api.gets == 1 and api.extends == []
+
+        report = keeper.run_pending(now=T + 945)
+
+        assert sorted(report["extended"]) == [1, 2]
+        assert sorted(api.extends) == [(1, 600), (2, 600)]
+        assert keeper.expires(1) == T + 1545
+        assert api.gets == 1
+        assert keeper.next_due(now=T + 945) == pytest.approx(1200 - 945)
+
+    def test_refresh_releases_cleared_and_adopts_selected(self, client):
+        """Refresh drops cleared actions, picks up outside extensions and adopts selected ones."""
+        api = _FakeAntigena(client, [_action(1, 1000), _action(2, 1000)])
+        keeper = ActionKeeper(
+            client.antigena, duration=600, lead=60, refresh_interval=100, select=lambda a: a.get("manual") is True
+        )
+        keeper.keep(1)
+        keeper.keep(2)
+        keeper.run_pending(now=T + 0)
+
+        api.actions[1]["cleared"] = True
+        api.actions[2]["expires"] = (T + 3000) * 1000
+        api.actions[9] = _action(9, 1000, manual=True)
+        api.actions[10] = _action(10, 1000)
+        keeper.run_pending(now=T + 100)
+
+        assert 1 not in keeper and 10 not in keeper
+        assert keeper.expires(2) == T + 3000 and 9 in keeper
+        keeper.run_pending(now=T + 950)
+        assert api.extends == [(9, 600)]
+
+    def test_until_and_failure_retry(self, client):
+        """Extensions stop at ``until``; failed extensions retry in the next slot."""
+        api = _FakeAntigena(client, [], failing={2})
+        keeper = ActionKeeper(client.antigena, duration=600, lead=60, resolution=10, refresh_interval=10_000)
+        keeper.keep(1, until=T + 1200, expires=T + 1000)
+        keeper.keep(2, expires=T + 1000)
+        keeper._last_refresh = T
+
+        report = keeper.run_pending(now=T + 950)
+
+        assert api.extends == [(1, 250)]
+        assert [f["codeid"] for f in report["failed"]] == [2]
+        api.failing.clear()
+        assert keeper.run_pending(now=T + 960)["extended"] == [2]
+        assert keeper.run_pending(now=T + 1150)["released"] == [1]
+        assert 1 not in keeper
+
+    def test_rejects_lead_longer_than_duration(self, client):
+        """A lead window as long as the extension would extend continuously."""
+        with pytest.raises(ValueError):
+            ActionKeeper(client.antigena, duration=60, lead=60)
+
+
+# ==============================================================================
+# ActionWatcher
+# ==============================================================================
+class _FakeSnapshots:
+    """Serves ``/antigena/summary`` and ``/antigena`` from mutable snapshots."""
+
+    def __init__(self, client):
+        self.summary = {"activeActionDevices": [1], "pendingActionDevices": []}
+        self.actions = [{"codeid": 10, "did": 1, "active": True, "expires": 1000}]
+        self.paths = []
+        client._session.request = Mock(side_effect=self.request)
+
+    def request(self, method, url, **kwargs):
+        path = url.split("test.example.com", 1)[1]
+        self.paths.append(path)
+        return _response(self.summary if path == "/antigena/summary" else {"actions": self.actions})
+
+
+class TestActionWatcher:
+    """Test snapshot diffing and adaptive polling of RESPOND state."""
+
+    def test_diffs_summary_and_actions(self, client):
+        """Device set and action list changes become compact events after a silent baseline."""
+        api = _FakeSnapshots(client)
+        received = []
+        watcher = ActionWatcher(client.antigena, callbacks=[received.append])
+
+        assert watcher.poll() == []
+
+        api.summary = {"activeActionDevices": [2], "pendingActionDevices": [3]}
+        api.actions = [
+            {"codeid": 10, "did": 1, "active": True, "expires": 2000},
+            {"codeid": 11, "did": 2, "active": True, "expires": 1000},
+        ]
+        events = watcher.poll()
+
+        assert [(e.kind, e.did, e.codeid) for e in events] == [
+            ("device_active", 2, None),
+            ("device_inactive", 1, None),
+            ("device_pending", 3, None),
+            ("action_changed", 1, 10),
+            ("action_added", 2, 11),
+        ]
+        assert events[3].previous["expires"] == 1000
+        assert received == events
+        assert watcher.active_devices == {2}
+
+    def test_action_list_only_read_when_needed(self, client):
+        """Quiet polls read only the summary and back off; changes reset the interval."""
+        api = _FakeSnapshots(client)
+        watcher = ActionWatcher(client.antigena, min_interval=1, max_interval=4, actions_every=3)
+        watcher.poll()
+        api.paths.clear()
+
+        watcher.poll()
+        watcher.poll()
+        assert api.paths == ["/antigena/summary", "/antigena/summary"]
+        assert watcher.interval == 4
+
+        api.actions = []
+        watcher.poll()
+        assert api.paths[-1] == "/antigena"
+        assert watcher.interval == 1
+
+    def test_events_reach_asyncio_queue(self, client):
+        """run_async hands events to an asyncio queue from the executor thread."""
+        api = _FakeSnapshots(client)
+
+        async def main():
+            queue = asyncio.Queue()
+            stop = asyncio.Event()
+            watcher = ActionWatcher(client.antigena, min_interval=0.01, queue=queue)
+            task = asyncio.ensure_future(watcher.run_async(stop))
+            while api.paths.count("/antigena/summary") < 1:
+                await asyncio.sleep(0.01)
+            api.summary = {"activeActionDevices": [1, 5], "pendingActionDevices": []}
+            event = await asyncio.wait_for(queue.get(), 5)
+            stop.set()
+            await task
+            return event
+
+        assert asyncio.run(main()) == ActionEvent("device_active", 5)
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+Mock tests for bulk and synchronization operations in the Darktrace SDK.
+
+Covers helpers that fan a large change set out over many API calls with
+bounded concurrency and collect per-item outcomes (IntelFeed sync, breach
+acknowledgement, breach comments, device tagging, RESPOND actions,
+...).
+
+All tests use mocks — no live API calls.
+
+Run: pytest tests/test_bulk_operations.py -v
+"""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from darktrace import DarktraceClient
+from darktrace.dt_utils import _iter_bulk, _run_bulk
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+@pytest.fixture
+def client():
+    """Create a DarktraceClient instance for testing."""
+    return DarktraceClient(
+        host="https://test.example.com",
+        public_token="test_public",
+        private_token="test_private",
+    )
+
+
+def _response(payload, status_code=200):
+    """Build a mock response returning ``payload``."""
+    response = Mock()
+    response.status_code = status_code
+    response.reason = "Error" if status_code >= 400 else "OK"
+    response.url = "https://test.example.com"
+    response.headers = {}
+    response.json = Mock(return_value=payload)
+    return response
+
+
+# ==============================================================================
+# _run_bulk
+# ==============================================================================
+class TestRunBulk:
+    """Test the shared bounded-concurrency helper."""
+
+    def test_results_keep_input_order(self):
+        """Results are returned in input order with errors collected per item."""
+
+        def func(item):
+            if item == 3:
+                raise ValueError("boom")
+            return item * 2
+
+        progress = []
+        results = _run_bulk(func, range(5), max_workers=3, progress=lambda done, total: progress.append(total))
+
+        assert [item for item, _, _ in results] == [0, 1, 2, 3, 4]
+        assert [result for _, result, _ in results] == [0, 2, 4, None, 8]
+        assert isinstance(results[3][2], ValueError)
+        assert progress == [5] * 5
+
+    def test_empty_items(self):
+        """No items means no work and an empty result."""
+        assert _run_bulk(lambda item: item, []) == []
+
+    def test_rate_limit_spaces_calls(self):
+        """Calls are started no faster than rate_limit per second across workers."""
+        started = []
+        _run_bulk(lambda item: started.append(time.monotonic()), range(5), max_workers=5, rate_limit=50)
+
+        started.sort()
+        assert started[-1] - started[0] >= 4 / 50 * 0.9
+
+    def test_rate_limit_must_be_positive(self):
+        """A non-positive rate limit is rejected."""
+        with pytest.raises(ValueError):
+            _run_bulk(lambda item: item, [1], rate_limit=0)
+
+    def test_iter_bulk_pulls_items_lazily(self):
+        """The streaming form keeps only a bounded window of items in flight."""
+        pulled = []
+
+        def items():
+            for item in range(100):
+                pulled.append(item)
+                yield item
+
+        stream = _iter_bulk(lambda item: item, items(), max_workers=2)
+        first = next(stream)
+
+        assert first[2] is None and len(pulled) <= 5
+        assert sorted([first[0]] + [item for item, _, _ in stream]) == list(range(100))
+
+
+# ==============================================================================
+# IntelFeed.sync
+# ==============================================================================
+class TestIntelFeedSync:
+    """Test differential IntelFeed synchronization."""
+
+    def test_sync_applies_only_differences(self, client):
+        """Only missing entries are added (in batches) and stale ones removed."""
+        posts = []
+
+        def request(method, url, **kwargs):
+            if method == "GET":
+                return _response(["keep.com", "Stale.com"])
+            posts.append(json.loads(kwargs["data"]))
+            return _response({"added": True})
+
+        client._session.request = Mock(side_effect=request)
+
+        report = client.intelfeed.sync(
+            ["keep.com", "new1.com", "new2.com", "new3.com"],
+            source="feed",
+            batch_size=2,
+        )
+
+        assert sorted(report["added"]) == ["new1.com", "new2.com", "new3.com"]
+        assert report["removed"] == ["Stale.com"]
+        assert report["unchanged"] == 1
+        assert report["failed"] == []
+        add_bodies = [body for body in posts if "addlist" in body]
+        assert sorted(len(body["addlist"].split(",")) for body in add_bodies) == [1, 2]
+        assert all(body["source"] == "feed" for body in posts)
+        assert {"removeentry": "Stale.com", "source": "feed"} in posts
+
+    def test_sync_reports_failed_batches(self, client):
+        """A failing request is reported instead of aborting the sync."""
+
+        def request(method, url, **kwargs):
+            if method == "GET":
+                return _response(["old.com"])
+            if "removeentry" in json.loads(kwargs["data"]):
+                return _response({}, status_code=400)
+            return _response({"added": True})
+
+        client._session.request = Mock(side_effect=request)
+
+        report = client.intelfeed.sync(["new.com"], source="feed")
+
+        assert report["added"] == ["new.com"]
+        assert report["removed"] == []
+        assert report["failed"][0]["action"] == "remove"
+        assert report["failed"][0]["entries"] == ["old.com"]
+
+    def test_sync_requires_source(self, client):
+        """Syncing without a source is rejected."""
+        with pytest.raises(ValueError):
+            client.intelfeed.sync(["a.com"], source="")
+
+
+# ==============================================================================
+# ModelBreaches.bulk_acknowledge / bulk_unacknowledge
+# ==============================================================================
+class TestBulkAcknowledge:
+    """Test concurrent breach acknowledgement with per-pbid reporting."""
+
+    def test_failures_do_not_abort_batch(self, client):
+        """Every pbid is attempted; failed state changes and comments are reported per step."""
+        calls = []
+
+        def request(method, url, **kwargs):
+            path = url.replace(client.host, "")
+            calls.append(path)
+            if path == "/modelbreaches/2/acknowledge" or path == "/modelbreaches/3/comments":
+                return _response({}, status_code=400)
+            return _response({"response": "SUCCESS"})
+
+        client._session.request = Mock(side_effect=request)
+        progress = []
+
+        report = client.breaches.bulk_acknowledge(
+            [1, 2, 3, 4, 1],
+            comment="False positive storm",
+            rate_limit=1000,
+            progress=lambda done, total: progress.append(done),
+        )
+
+        assert report["succeeded"] == [1, 4]
+        assert [(f["pbid"], f["step"]) for f in report["failed"]] == [(2, "acknowledge"), (3, "comment")]
+        assert "/modelbreaches/2/comments" not in calls
+        assert sorted(progress) == [1, 2, 3, 4]
+
+    def test_unacknowledge_without_comment(self, client):
+        """Without a comment only the state-change POSTs are sent."""
+        client._session.request = Mock(return_value=_response({"response": "SUCCESS"}))
+
+        report = client.breaches.bulk_unacknowledge([5, 6])
+
+        assert report == {"succeeded": [5, 6], "failed": []}
+        urls = sorted(call[0][1] for call in client._session.request.call_args_list)
+        assert urls == [
+            "https://test.example.com/modelbreaches/5/unacknowledge",
+            "https://test.example.com/modelbreaches/6/unacknowledge",
+        ]
+
+
+# ==============================================================================
+# ModelBreaches.get_comments_bulk
+# ==============================================================================
+class TestBulkComments:
+    """Test strategy selection for bulk comment retrieval."""
+
+    def test_window_strategy_single_request(self, client):
+        """Many breaches with a time window are served by one /mbcomments pull."""
+        comments = [
+            {"pbid": 1, "message": "a"},
+            {"pbid": "3", "message": "b"},
+            {"pbid": 1, "message": "c"},
+            {"pbid": 42, "message": "other breach"},
+        ]
+        client._session.request = Mock(return_value=_response(comments))
+
+        result = client.breaches.get_comments_bulk(range(1, 7), starttime=1000, endtime=2000, max_workers=2)
+
+        assert client._session.request.call_count == 1
+        assert client._session.request.call_args[0][1].endswith("/mbcomments")
+        assert client._session.request.call_args[1]["params"] == {"count": 10000, "endtime": 2000, "starttime": 1000}
+        assert [c["message"] for c in result[1]] == ["a", "c"]
+        assert result[3] == [comments[1]]
+        assert result[6] == []
+        assert 42 not in result
+
+    def test_per_pbid_strategy_and_truncated_window(self, client):
+        """A truncated window falls back to concurrent per-pbid calls; failures map to None."""
+
+        def request(method, url, **kwargs):
+            path = url.replace(client.host, "")
+            if path == "/mbcomments":
+                return _response([{"pbid": 1}, {"pbid": 2}])
+            if path == "/modelbreaches/2/comments":
+                return _response({}, status_code=400)
+            return _response([{"pbid": int(path.split("/")[2]), "message": "x"}])
+
+        client._session.request = Mock(side_effect=request)
+
+        result = client.breaches.get_comments_bulk([1, 2, 3], starttime=0, strategy="window", window_count=2)
+
+        assert result[1] == [{"pbid": 1, "message": "x"}]
+        assert result[2] is None
+        assert client._session.request.call_count == 4
+
+    def test_auto_without_window_uses_per_pbid(self, client):
+        """Without starttime the per-pbid strategy is used."""
+        client._session.request = Mock(return_value=_response([]))
+
+        assert client.breaches.get_comments_bulk([7, 8]) == {7: [], 8: []}
+        assert all("/comments" in call[0][1] for call in client._session.request.call_args_list)
+
+
+# ==============================================================================
+# Tags.bulk_tag / bulk_untag
+# ==============================================================================
+class TestBulkTagging:
+    """Test bulk tag application and removal."""
+
+    TAGS = [{"tid": 5, "name": "Incident 42"}, {"tid": 6, "name": "Quarantine"}]
+
+    def test_bulk_tag_batches_per_tag(self, client):
+        """Tag IDs are resolved once; devices are posted in batches per tag."""
+        posts = []
+
+        def request(method, url, **kwargs):
+            path = url.replace(client.host, "")
+            if method == "GET":
+                return _response(self.TAGS)
+            body = json.loads(kwargs["data"])
+            posts.append((path, body["entityValue"]))
+            if path == "/tags/6/entities" and "3" in body["entityValue"]:
+                return _response({}, status_code=400)
+            return _response({"ok": True})
+
+        client._session.request = Mock(side_effect=request)
+
+        report = client.tags.bulk_tag([1, 2, 3, 1], ["incident 42", "Quarantine"], batch_size=2, duration=3600)
+        client.tags.bulk_tag([4], "Quarantine")
+
+        gets = [call for call in client._session.request.call_args_list if call[0][0] == "GET"]
+        assert len(gets) == 1
+        assert sorted(posts[:4]) == [
+            ("/tags/5/entities", ["1", "2"]),
+            ("/tags/5/entities", ["3"]),
+            ("/tags/6/entities", ["1", "2"]),
+            ("/tags/6/entities", ["3"]),
+        ]
+        assert len(report["succeeded"]) == 5
+        assert [(f["did"], f["tag"]) for f in report["failed"]] == [(3, "Quarantine")]
+
+    def test_unknown_tag_rejected(self, client):
+        """Unknown tag names fail before any change is made."""
+        client._session.request = Mock(return_value=_response(self.TAGS))
+        with pytest.raises(ValueError, match="Nope"):
+            client.tags.bulk_tag([1], "Nope")
+        assert all(call[0][0] == "GET" for call in client._session.request.call_args_list)
+
+    def test_bulk_untag_uses_teids(self, client):
+        """Removal looks up each device's teid once per tag and skips untagged devices."""
+        deletes = []
+
+        def request(method, url, **kwargs):
+            path = url.replace(client.host, "")
+            if path == "/tags":
+                return _response(self.TAGS)
+            if path == "/tags/5/entities":
+                return _response(
+                    [
+                        {"teid": 50, "entityType": "Device", "entityValue": "1"},
+                        {"teid": 51, "entityType": "Device", "entityValue": "2"},
+                        {"teid": 52, "entityType": "Credential", "entityValue": "bob"},
+                    ]
+                )
+            deletes.append(path)
+            return _response({"ok": True})
+
+        client._session.request = Mock(side_effect=request)
+
+        report = client.tags.bulk_untag([1, 2, 3], "Incident 42")
+
+        assert sorted(deletes) == ["/tags/5/entities/50", "/tags/5/entities/51"]
+        assert [r["did"] for r in report["succeeded"]] == [1, 2]
+        assert report["skipped"] == [{"did": 3, "tag": "Incident 42"}]
+
+
+# ==============================================================================
+# Antigena bulk RESPOND actions
+# ==============================================================================
+class TestBulkRespond:
+    """Test bulk creation, extension and clearing of RESPOND actions."""
+
+    def _client(self, client, failing_did=None):
+        posts = []
+
+        def request(method, url, **kwargs):
+            body = json.loads(kwargs["data"])
+            posts.append((url.replace(client.host, ""), body))
+            if "did" in body and body["did"] == failing_did:
+                return _response({}, status_code=400)
+            if "did" in body:
+                return _response({"code": 200, "codeid": 1000 + body["did"]})
+            return _response({"code": 200})
+
+        client._session.request = Mock(side_effect=request)
+        return posts
+
+    def test_create_records_codeids(self, client):
+        """Each device gets one manual action and its codeid is recorded."""
+        posts = self._client(client)
+        progress = []
+
+        report = client.antigena.bulk_create_actions(
+            [1, 2, 3], "quarantine", 600, reason="Outbreak", progress=lambda d, t: progress.append(t)
+        )
+
+        assert report["created"] == {1: 1001, 2: 1002, 3: 1003}
+        assert report["failed"] == [] and report["rolled_back"] == []
+        assert all(path == "/antigena/manual" for path, _ in posts)
+        assert progress == [3, 3, 3]
+
+    def test_partial_failure_rolls_back(self, client):
+        """With rollback, a failure clears every action created by the batch."""
+        posts = self._client(client, failing_did=2)
+
+        report = client.antigena.bulk_create_actions([1, 2, 3], "quarantine", 600, reason="Outbreak", rollback=True)
+
+        assert [f["did"] for f in report["failed"]] == [2]
+        assert sorted(report["rolled_back"]) == [1001, 1003]
+        clears = [body for path, body in posts if path == "/antigena"]
+        assert sorted(body["codeid"] for body in clears) == [1001, 1003]
+        assert all(body["clear"] is True and body["reason"] == "Rollback: Outbreak" for body in clears)
+
+    def test_partial_failure_without_rollback(self, client):
+        """Without rollback the successful actions stay in place."""
+        posts = self._client(client, failing_did=2)
+
+        report = client.antigena.bulk_create_actions([1, 2], "quarantine", 600)
+
+        assert report["created"] == {1: 1001}
+        assert not any(path == "/antigena" for path, _ in posts)
+
+    def test_extend_and_clear(self, client):
+        """Extend and clear send one POST per codeid and report per codeid."""
+        posts = self._client(client)
+
+        extended = client.antigena.bulk_extend_actions([1001, 1002], 1200, rate_limit=1000)
+        cleared = client.antigena.bulk_clear_actions([1001])
+
+        assert sorted(extended["succeeded"]) == [1001, 1002]
+        assert cleared == {"succeeded": [1001], "failed": []}
+        assert sorted(body.get("duration", 0) for _, body in posts) == [0, 1200, 1200]
+
+
+# ==============================================================================
+# Devices.bulk_update
+# ==============================================================================
+class TestBulkDeviceUpdate:
+    """Test diffed, concurrent device property updates."""
+
+    DEVICES = [
+        {"did": 1, "label": "web-1", "priority": 2, "typeid": 4, "typename": "Server"},
+        {"did": 2, "label": "db-1", "priority": 0, "typeid": 4, "typename": "Server"},
+    ]
+
+    def _client(self, client, failing_did=None):
+        posts = []
+
+        def request(method, url, **kwargs):
+            if method == "GET":
+                return _response(self.DEVICES)
+            body = json.loads(kwargs["data"])
+            posts.append(body)
+            return _response({}, status_code=400) if body["did"] == failing_did else _response({"code": 200})
+
+        client._session.request = Mock(side_effect=request)
+        return posts
+
+    def test_skips_noops_and_sends_only_differences(self, client):
+        """Unchanged devices are not POSTed and only differing fields are sent."""
+        posts = self._client(client)
+        changes = [(1, {"label": "web-1", "priority": 2}), (2, {"label": "db-1", "priority": 4}), (3, {"label": "new"})]
+
+        report = {row["did"]: row for row in client.devices.bulk_update(changes, current=self.DEVICES)}
+
+        assert report[1]["status"] == "unchanged"
+        assert report[2] == {"did": 2, "status": "updated", "changes": {"priority": 4}, "error": None}
+        assert report[3]["changes"] == {"label": "new"}
+        assert sorted(posts, key=lambda body: body["did"]) == [{"did": 2, "priority": 4}, {"did": 3, "label": "new"}]
+        assert client._session.request.call_count == 2
+
+    def test_type_compared_with_typeid(self, client):
+        """The ``type`` write field is diffed against the ``typeid`` /devices reports."""
+        posts = self._client(client)
+        changes = [(1, {"type": 4, "label": "web-1"}), (2, {"type": 7})]
+
+        report = {row["did"]: row for row in client.devices.bulk_update(changes, current=self.DEVICES)}
+
+        assert report[1]["status"] == "unchanged"
+        assert report[2]["changes"] == {"type": 7}
+        assert posts == [{"did": 2, "type": 7}]
+
+    def test_fetches_view_and_reports_failures(self, client):
+        """Without a view /devices is read once; failures are reported per device."""
+        self._client(client, failing_did=1)
+
+        report = client.devices.bulk_update(iter([(1, {"label": "x"}), (2, {"label": "y"})]), max_workers=2)
+
+        assert isinstance(report, list)
+        assert [call[0][0] for call in client._session.request.call_args_list].count("GET") == 1
+        statuses = {row["did"]: row["status"] for row in report}
+        assert statuses == {1: "failed", 2: "updated"}
+        assert next(row for row in report if row["did"] == 1)["error"] is not None
+
+
+# ==============================================================================
+# Subnets.bulk_import
+# ==============================================================================
+class TestSubnetImport:
+    """Test validated, diffed subnet provisioning from files and iterables."""
+
+    SUBNETS = [
+        {"sid": 10, "network": "10.0.0.0/24", "label": "Office", "latitude": 51.5, "longitude": -0.1, "dhcp": True},
+        {"sid": 11, "network": "10.0.1.0/24", "label": "Lab", "dhcp": False},
+    ]
+
+    def _client(self, client, failing_sid=None):
+        posts = []
+
+        def request(method, url, **kwargs):
+            if method == "GET":
+                return _response(self.SUBNETS)
+            body = json.loads(kwargs["data"])
+            posts.append(body)
+            return _response({}, status_code=400) if body["sid"] == failing_sid else _response({"code": 200})
+
+        client._session.request = Mock(side_effect=request)
+        return posts
+
+    def test_csv_rows_validated_diffed_and_logged(self, client, tmp_path):
+        """Only changed fields of valid rows are POSTed; every row gets a log entry."""
+        posts = self._client(client)
+        path = tmp_path / "ipam.csv"
+        path.write_text(
+            "SID,Network,Label,Latitude,Longitude,DHCP,Owner\n"
+            "10,10.0.0.0/24,Office,51.5,-0.1,true,it\n"
+            ",10.0.1.7/24,Lab 2,,,no,it\n"
+            "12,10.0.2.0/33,Bad,,,,it\n"
+            "10,,Office,95,0,,it\n"
+            "10,,Office,51.5,,,it\n"
+            ",192.168.0.0/24,Unknown,,,,it\n"
+        )
+
+        log = client.subnets.bulk_import(str(path))
+
+        assert [entry["status"] for entry in log] == [
+            "unchanged",
+            "updated",
+            "invalid",
+            "invalid",
+            "invalid",
+            "invalid",
+        ]
+        assert log[1]["sid"] == 11 and log[1]["changes"] == {"label": "Lab 2"}
+        assert "CIDR" in str(log[2]["error"]) and "latitude" in str(log[3]["error"])
+        assert "together" in str(log[4]["error"]) and "network" in str(log[5]["error"])
+        assert posts == [{"sid": 11, "label": "Lab 2"}]
+
+    def test_iterable_with_current_view_and_failures(self, client):
+        """Dict rows diff against a supplied view; POST failures are logged per row."""
+        posts = self._client(client, failing_sid=11)
+        rows = [
+            {"sid": 10, "latitude": 48.85, "longitude": 2.35},
+            {"sid": 11, "excluded": True},
+        ]
+
+        log = client.subnets.bulk_import(rows, current=self.SUBNETS, rate_limit=1000)
+
+        assert client._session.request.call_count == 2
+        assert log[0]["status"] == "updated" and log[0]["changes"] == {"latitude": 48.85, "longitude": 2.35}
+        assert log[1]["status"] == "failed" and log[1]["error"] is not None
+        assert sorted(body["sid"] for body in posts) == [10, 11]
+
+    def test_json_file(self, client, tmp_path):
+        """JSON files may wrap rows in a subnets key."""
+        self._client(client)
+        path = tmp_path / "ipam.json"
+        path.write_text(json.dumps({"subnets": [{"network": "10.0.0.0/24", "label": "HQ"}]}))
+
+        log = client.subnets.bulk_import(path)
+
+        assert log == [{"row": 1, "sid": 10, "status": "updated", "changes": {"label": "HQ"}, "error": None}]
+
+
+# ==============================================================================
+# DarktraceEmail.bulk_email_action
+# ==============================================================================
+class TestBulkEmailAction:
+    """Test concurrent email actions over UUID lists and lazily paged searches."""
+
+    SEARCH = "/agemail/api/ep/api/v1.0/emails/search"
+
+    def _client(self, client, emails=(), flaky=(), broken=()):
+        calls = {"search": [], "action": []}
+        failures = {uuid: 1 for uuid in flaky}
+
+        def request(method, url, **kwargs):
+            path = url.replace(client.host, "")
+            body = json.loads(kwargs["data"])
+            if path == self.SEARCH:
+                calls["search"].append(body)
+                page = emails[body["offset"] : body["offset"] + body["limit"]]
+                return _response({"emails": [{"uuid": uuid} for uuid in page]})
+            uuid = path.split("/")[-2]
+            calls["action"].append(uuid)
+            if uuid in broken:
+                return _response({}, status_code=400)
+            if failures.get(uuid):
+                failures[uuid] -= 1
+                return _response({}, status_code=503)
+            return _response({"success": True})
+
+        client._session.request = Mock(side_effect=request)
+        return calls
+
+    def test_search_body_is_paged_lazily(self, client):
+        """Search pages are requested with limit/offset until a short page."""
+        emails = [f"u{i}" for i in range(5)]
+        calls = self._client(client, emails=emails)
+
+        report = client.email.bulk_email_action({"filters": {"sender": "x"}}, {"action": "hold"}, page_size=2)
+
+        assert sorted(report["succeeded"]) == emails and report["failed"] == []
+        assert [(body["offset"], body["limit"]) for body in calls["search"]] == [(0, 2), (2, 2), (4, 2)]
+        assert all(body["filters"] == {"sender": "x"} for body in calls["search"])
+
+    def test_transient_failures_retried_and_errors_reported(self, client):
+        """Server errors get another round; client errors fail straight away."""
+        calls = self._client(client, flaky={"b"}, broken={"c"})
+
+        with patch("darktrace.dt_utils.time.sleep"):
+            # Exhaust the transport retries so the bulk retry round is exercised
+            with patch("darktrace.dt_utils._MAX_RETRIES", 0):
+                report = client.email.bulk_email_action(["a", "b", "c", "a"], {"action": "release"}, retry_wait=0)
+
+        assert sorted(report["succeeded"]) == ["a", "b"]
+        assert [(f["uuid"], f["attempts"]) for f in report["failed"]] == [("c", 1)]
+        assert sorted(calls["action"]) == ["a", "b", "b", "c"]
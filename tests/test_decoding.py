@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Mock tests for alternative response decoding in the Darktrace SDK.
+
+Covers decode paths that trade the plain ``response.json()`` dicts for more
+compact or cheaper representations (typed breach records, string interning and
+shared sub-objects, client-side device hydration, ...). The memory benchmarks build large synthetic fixtures and
+measure the decoded size with ``tracemalloc``.
+
+All tests use mocks — no live API calls.
+
+Run: pytest tests/test_decoding.py -v
+"""
+
+import json
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from darktrace import Breach, DarktraceClient, DeviceHydrator
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+@pytest.fixture
+def client():
+    """Create a DarktraceClient instance for testing."""
+    return DarktraceClient(
+        host="https://test.example.com",
+        public_token="test_public",
+        private_token="test_private",
+    )
+
+
+def _raw_response(body):
+    """Build a mock response whose raw content is ``body`` (bytes or JSON-serializable)."""
+    response = Mock()
+    response.status_code = 200
+    response.content = body if isinstance(body, bytes) else json.dumps(body, indent=1).encode()
+    response.json = Mock(side_effect=lambda: json.loads(response.content))
+    return response
+
+
+BREACHES = [
+    {
+        "pbid": 101,
+        "time": 1700000000000,
+        "score": 0.82,
+        "device": {"did": 7, "hostname": "web01"},
+        "model": {"then": {"pid": 12, "name": "Anomalous Connection::Data Sent"}, "now": {"pid": 12}},
+        "triggeredComponents": [{"cid": 1, "triggeredFilters": [{"filterType": "Direction"}]}],
+    },
+    {"pbid": 102, "time": 1700000000500, "score": 0.1, "did": 9, "model": 13},
+]
+
+
+# ==============================================================================
+# ModelBreaches.get(typed=True)
+# ==============================================================================
+class TestTypedBreaches:
+    """Test compact, lazily decoded Breach records."""
+
+    def test_hot_fields_and_lazy_fields(self, client):
+        """Hot fields are attributes; other fields decode from the raw slice on access."""
+        client._session.request = Mock(return_value=_raw_response(BREACHES))
+
+        breaches = client.breaches.get(typed=True, minscore=0.1)
+
+        assert [type(b) for b in breaches] == [Breach, Breach]
+        first, second = breaches
+        assert (first.pbid, first.time, first.score, first.did, first.pid) == (101, 1700000000000, 0.82, 7, 12)
+        assert (second.did, second.pid) == (9, 13)
+        assert first._data is None
+        assert json.loads(first.raw) == BREACHES[0]
+        assert first.model["then"]["name"] == "Anomalous Connection::Data Sent"
+        assert first.triggered_components[0]["cid"] == 1
+        assert first["device"]["hostname"] == "web01"
+        assert second.get("triggeredComponents") is None
+        assert not hasattr(first, "__dict__")
+        assert client._session.request.call_args[1]["params"] == {"minscore": 0.1}
+
+    def test_release_and_single_object(self, client):
+        """A single-breach response yields one record; release() drops the decoded dict."""
+        client._session.request = Mock(return_value=_raw_response(BREACHES[0]))
+
+        (breach,) = client.breaches.get(typed=True, pbid=101)
+        assert breach.to_dict()["pbid"] == 101
+        breach.release()
+        assert breach._data is None
+
+    def test_empty_list(self, client):
+        """An empty response yields no records."""
+        client._session.request = Mock(return_value=_raw_response(b" [ ] "))
+        assert client.breaches.get(typed=True) == []
+
+
+# ==============================================================================
+# compact_json decode mode
+# ==============================================================================
+def _device(did):
+    """Build a device block as embedded by fulldevicedetails."""
+    return {
+        "did": did,
+        "ip": f"10.0.{did % 256}.{did % 200}",
+        "ips": [{"ip": f"10.0.{did % 256}.{did % 200}", "timems": 1700000000000, "sid": 3}],
+        "hostname": f"host{did}.corp.example.com",
+        "vendor": "Dell Inc.",
+        "typename": "desktop",
+        "sid": 3,
+        "tags": [{"tid": 1, "name": "Admin", "data": {"auto": False, "color": 200, "visibility": "Public"}}],
+    }
+
+
+def _decoded_size(decode, body):
+    """Bytes still allocated by the result of ``decode(body)``."""
+    tracemalloc.start()
+    try:
+        result = decode(body)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+class TestCompactJson:
+    """Test the opt-in interning/sharing decode mode."""
+
+    def test_equal_values_and_shared_objects(self):
+        """The result equals json.loads while repeated objects and strings are shared."""
+        from darktrace.dt_utils import _compact_loads
+
+        rows = [
+            {"uid": f"C{i}", "protocol": "TCP", "sourceDevice": _device(i % 3), "flags": [1, True, 1.0]}
+            for i in range(9)
+        ]
+        result = _compact_loads(json.dumps(rows))
+
+        assert result == rows
+        assert result[0]["sourceDevice"] is result[3]["sourceDevice"]
+        assert result[0]["sourceDevice"] is not result[1]["sourceDevice"]
+        assert result[0]["protocol"] is result[8]["protocol"]
+        assert [type(value) for value in result[0]["flags"]] == [int, bool, float]
+
+    def test_signed_zero_preserved(self):
+        """0.0 and -0.0 compare equal but are never merged."""
+        from darktrace.dt_utils import _compact_loads
+
+        body = '[-0.0, {"x": 0.0}, {"x": -0.0}, [0.0], [-0.0]]'
+        assert repr(_compact_loads(body)) == repr(json.loads(body))
+
+    def test_client_opt_in(self):
+        """Only clients created with compact_json=True use the compact decoder."""
+        rows = [{"sourceDevice": _device(1)}, {"sourceDevice": _device(1)}]
+        for compact in (False, True):
+            client = DarktraceClient(
+                host="https://test.example.com",
+                public_token="test_public",
+                private_token="test_private",
+                compact_json=compact,
+            )
+            client._session.request = Mock(return_value=_raw_response(rows))
+            result = client.details.get(did=1)
+            assert result == rows
+            assert (result[0]["sourceDevice"] is result[1]["sourceDevice"]) is compact
+
+    @pytest.mark.parametrize(
+        "name, row, max_ratio",
+        [
+            (
+                "details",
+                lambda i: {
+                    "time": 1700000000000 + i,
+                    "uid": f"C{i}",
+                    "eventType": "connection",
+                    "protocol": "TCP",
+                    "applicationprotocol": "HTTPS",
+                    "sourceDevice": _device(i % 500),
+                    "destinationDevice": _device(1000 + i % 50),
+                    "destination": "example.com",
+                },
+                0.4,
+            ),
+            (
+                "modelbreaches",
+                lambda i: {
+                    "pbid": i,
+                    "time": 1700000000000 + i,
+                    "score": 0.5,
+                    "device": _device(i % 500),
+                    "model": {"then": {"pid": i % 20, "name": "Anomalous Connection::Data Sent", "priority": 3}},
+                },
+                0.5,
+            ),
+            # Every device is distinct, so only repeated strings and tag blocks are shared
+            ("devices", lambda i: _device(i), 0.75),
+        ],
+    )
+    def test_memory_benchmark(self, name, row, max_ratio):
+        """Large fixtures decode to a fraction of the memory json.loads needs."""
+        from darktrace.dt_utils import _compact_loads
+
+        body = json.dumps([row(i) for i in range(5000)]).encode()
+
+        plain = _decoded_size(json.loads, body)
+        compact = _decoded_size(_compact_loads, body)
+
+        assert compact < plain * max_ratio, f"{name}: json.loads {plain} bytes vs compact {compact} bytes"
+
+
+# ==============================================================================
+# DeviceHydrator
+# ==============================================================================
+class TestDeviceHydrator:
+    """Test attaching cached devices to compact responses."""
+
+    def test_hydrates_and_batches_misses(self, client):
+        """Misses are fetched once per device; cached devices are reused across calls."""
+
+        def request(method, url, **kwargs):
+            did = kwargs["params"]["did"]
+            return _raw_response(_device(did) if did != 99 else [])
+
+        client._session.request = Mock(side_effect=request)
+        hydrator = DeviceHydrator(client.devices)
+        events = [
+            {"uid": "C1", "sourceDevice": {"did": 1, "ip": "10.9.9.9"}, "destinationDevice": 2},
+            {"uid": "C2", "sourceDevice": {"did": 1}, "destinationDevice": {"did": 99}},
+        ]
+
+        result = hydrator.hydrate(events)
+
+        assert result is events
+        assert events[0]["sourceDevice"]["hostname"] == "host1.corp.example.com"
+        assert events[0]["sourceDevice"] is events[1]["sourceDevice"]
+        assert events[0]["destinationDevice"]["did"] == 2
+        assert events[1]["destinationDevice"] == {"did": 99}
+        assert sorted(call[1]["params"]["did"] for call in client._session.request.call_args_list) == [1, 2, 99]
+
+        hydrator.hydrate({"device": {"did": 2}, "nested": [{"device": 99}]})
+        assert client._session.request.call_count == 3
+
+    def test_many_misses_fetch_only_missing_devices(self, client):
+        """Without an opt-in threshold, many misses never pull the whole estate."""
+
+        def request(method, url, **kwargs):
+            return _raw_response(_device(kwargs["params"]["did"]))
+
+        client._session.request = Mock(side_effect=request)
+        hydrator = DeviceHydrator(client.devices)
+        network = {"traffic": [{"sourcedevice": {"did": did}, "destinationdevice": did + 100} for did in range(40)]}
+
+        hydrator.hydrate(network)
+
+        assert client._session.request.call_count == 80
+        assert all("did" in call[1]["params"] for call in client._session.request.call_args_list)
+        assert network["traffic"][5]["destinationdevice"]["hostname"] == "host105.corp.example.com"
+
+    def test_merge_and_bulk_pull(self, client):
+        """Many misses trigger one /devices pull; merge keeps per-row values."""
+        client._session.request = Mock(return_value=_raw_response([_device(did) for did in range(10)]))
+        hydrator = DeviceHydrator(client.devices, merge=True, bulk_threshold=2)
+        breaches = [{"pbid": did, "device": {"did": did, "ip": "192.0.2.1"}} for did in range(5)]
+
+        hydrator.hydrate(breaches)
+
+        assert client._session.request.call_count == 1
+        assert "did" not in client._session.request.call_args[1]["params"]
+        assert breaches[3]["device"]["hostname"] == "host3.corp.example.com"
+        assert breaches[3]["device"]["ip"] == "192.0.2.1"
+        assert len(hydrator) == 10
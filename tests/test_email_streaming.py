@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Mock tests for streaming Darktrace/Email data.
+
+Covers generators that page through Email API results on the caller's
+behalf (search iteration, audit event following, ...).
+
+All tests use mocks — no live API calls.
+
+Run: pytest tests/test_email_streaming.py -v
+"""
+
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from darktrace import AuditEventFollower, DarktraceClient
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+@pytest.fixture
+def client():
+    """Create a DarktraceClient instance for testing."""
+    return DarktraceClient(
+        host="https://test.example.com",
+        public_token="test_public",
+        private_token="test_private",
+    )
+
+
+def _response(payload, status_code=200):
+    """Build a mock response returning ``payload``."""
+    response = Mock()
+    response.status_code = status_code
+    response.reason = "Error" if status_code >= 400 else "OK"
+    response.url = "https://test.example.com"
+    response.headers = {}
+    response.json = Mock(return_value=payload)
+    return response
+
+
+def _emails(count):
+    return [
+        {"uuid": f"u{i}", "subject": f"Invoice {i}", "header": {"from": f"s{i}@x.example"}, "body": "x" * 100}
+        for i in range(count)
+    ]
+
+
+def _serve(client, emails):
+    """Serve search pages from ``emails`` and record requested offsets."""
+    offsets = []
+
+    def request(method, url, **kwargs):
+        body = json.loads(kwargs["data"])
+        offsets.append(body["offset"])
+        page = emails[body["offset"] : body["offset"] + body["limit"]]
+        return _response({"emails": page})
+
+    client._session.request = Mock(side_effect=request)
+    return offsets
+
+
+# ==============================================================================
+# DarktraceEmail.iter_search
+# ==============================================================================
+class TestIterSearch:
+    """Test automatic paging, prefetch and projection of email searches."""
+
+    def test_pages_until_short_page(self, client):
+        """All records are yielded in order, paging with limit/offset."""
+        emails = _emails(7)
+        offsets = _serve(client, emails)
+
+        records = list(client.email.iter_search({"filters": {"sender": "x"}}, page_size=3))
+
+        assert [record["uuid"] for record in records] == [f"u{i}" for i in range(7)]
+        assert offsets == [0, 3, 6]
+
+    def test_prefetches_next_page(self, client):
+        """The next page is requested before the current one is consumed."""
+        offsets = _serve(client, _emails(6))
+        requested = threading.Event()
+        original = client._session.request.side_effect
+
+        def request(*args, **kwargs):
+            response = original(*args, **kwargs)
+            if len(offsets) == 2:
+                requested.set()
+            return response
+
+        client._session.request.side_effect = request
+        stream = client.email.iter_search({}, page_size=3)
+
+        next(stream)
+        assert requested.wait(5)
+        assert offsets[:2] == [0, 3]
+        stream.close()
+
+    def test_projection_and_max_results(self, client):
+        """Records are reduced to the requested (dotted) fields and capped."""
+        offsets = _serve(client, _emails(10))
+
+        records = list(
+            client.email.iter_search(
+                {"offset": 2}, page_size=4, fields=["uuid", "header.from", "missing"], max_results=5
+            )
+        )
+
+        assert records[0] == {"uuid": "u2", "header.from": "s2@x.example", "missing": None}
+        assert [record["uuid"] for record in records] == ["u2", "u3", "u4", "u5", "u6"]
+        assert offsets == [2, 6]
+
+    def test_without_prefetch(self, client):
+        """With prefetch disabled pages are fetched strictly on demand."""
+        offsets = _serve(client, _emails(4))
+
+        stream = client.email.iter_search({}, page_size=2, prefetch=False)
+        next(stream)
+
+        assert offsets == [0]
+        assert len(list(stream)) == 3 and offsets == [0, 2, 4]
+
+
+# ==============================================================================
+# AuditEventFollower
+# ==============================================================================
+class _AuditLog:
+    """Serves audit events newest first with offset/limit paging."""
+
+    def __init__(self, client):
+        self.events = []
+        self.offsets = []
+        self.insert_during_paging = []
+        client._session.request = Mock(side_effect=self.request)
+
+    def add(self, *ids):
+        for event_id in ids:
+            self.events.insert(0, {"id": event_id, "timestamp": 1_700_000_000 + event_id, "event_type": "login"})
+
+    def request(self, method, url, **kwargs):
+        params = kwargs["params"]
+        self.offsets.append(params["offset"])
+        if self.insert_during_paging and params["offset"] > 0:
+            self.add(*self.insert_during_paging)
+            self.insert_during_paging = []
+        page = self.events[params["offset"] : params["offset"] + params["limit"]]
+        return _response({"events": page, "pagination": {"total": len(self.events)}})
+
+
+class TestAuditEventFollower:
+    """Test incremental, watermarked audit event delivery."""
+
+    def test_delivers_only_new_events_oldest_first(self, client):
+        """The first poll backfills; later polls read only until the watermark."""
+        log = _AuditLog(client)
+        log.add(*range(1, 8))
+        received = []
+        follower = AuditEventFollower(client.email, sinks=[received.append], page_size=2, prefetch=4)
+
+        follower.poll()
+        assert [event["id"] for event in received] == list(range(1, 8))
+        assert follower.watermark == {"timestamp": 1_700_000_007, "ids": ["7"]}
+
+        log.offsets.clear()
+        log.add(8, 9)
+        assert [event["id"] for event in follower.poll()] == [8, 9]
+        # One page first, then a parallel window of two pages (the second is speculative)
+        assert log.offsets == [0, 2, 4]
+        log.offsets.clear()
+        assert follower.poll() == [] and log.offsets == [0]
+
+    def test_page_boundary_shift_is_deduplicated(self, client):
+        """Events pushed across a page boundary while paging are delivered once."""
+        log = _AuditLog(client)
+        log.add(*range(1, 6))
+        log.insert_during_paging = [6]
+        follower = AuditEventFollower(client.email, page_size=2, prefetch=1)
+
+        ids = [event["id"] for event in follower.poll()]
+
+        assert sorted(ids) == sorted(set(ids))
+        assert set(ids) >= {1, 2, 3, 4, 5}
+
+    def test_watermark_persisted_and_resumed(self, client, tmp_path):
+        """A new follower resumes from the stored watermark; sink failures cause redelivery."""
+        log = _AuditLog(client)
+        log.add(1, 2)
+        state = tmp_path / "audit.json"
+        AuditEventFollower(client.email, state_path=state).poll()
+
+        log.add(3, 4)
+        delivered = []
+
+        def flaky_sink(event):
+            if event["id"] == 4:
+                raise RuntimeError("SIEM down")
+            delivered.append(event["id"])
+
+        with pytest.raises(RuntimeError):
+            AuditEventFollower(client.email, sinks=[flaky_sink], state_path=state).poll()
+        assert delivered == [3]
+        assert json.loads(state.read_text())["timestamp"] == 1_700_000_003
+
+        resumed = AuditEventFollower(client.email, state_path=state)
+        assert [event["id"] for event in resumed.poll()] == [4]
+
+    def test_untimestamped_ids_are_capped(self, client):
+        """IDs of events without a timestamp never advance the watermark, so they are capped."""
+        log = _AuditLog(client)
+        log.events = [{"id": event_id, "event_type": "login"} for event_id in range(5, 0, -1)]
+        follower = AuditEventFollower(client.email, page_size=10, max_ids=3)
+
+        assert [event["id"] for event in follower.poll()] == [1, 2, 3, 4, 5]
+        assert follower.watermark == {"timestamp": None, "ids": ["3", "4", "5"]}
+
+    def test_since_limits_first_poll(self, client):
+        """Without a watermark, events older than ``since`` are skipped."""
+        log = _AuditLog(client)
+        log.add(1, 2, 3)
+
+        follower = AuditEventFollower(client.email, since=1_700_000_002)
+
+        assert [event["id"] for event in follower.poll()] == [2, 3]
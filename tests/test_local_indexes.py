@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Mock tests for the local mirrors and indexes built on top of endpoint data.
+
+Covers client-side structures that are bootstrapped from the API once and then
+answer queries locally (device mirror, device index, subnet resolver, enum decoder, model catalog,
+intel matcher, tag index, ...).
+
+All tests use mocks — no live API calls.
+
+Run: pytest tests/test_local_indexes.py -v
+"""
+
+import ipaddress
+from unittest.mock import Mock
+
+import pytest
+
+from darktrace import (
+    DarktraceClient,
+    DeviceIndex,
+    DeviceMirror,
+    DeviceRecord,
+    EnumDecoder,
+    IntelMatcher,
+    ModelCatalog,
+    SubnetResolver,
+    TagIndex,
+)
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+@pytest.fixture
+def client():
+    """Create a DarktraceClient instance for testing."""
+    return DarktraceClient(
+        host="https://test.example.com",
+        public_token="test_public",
+        private_token="test_private",
+    )
+
+
+def _responses(*payloads):
+    """Build mock responses returning each payload in turn."""
+    responses = []
+    for payload in payloads:
+        response = Mock()
+        response.status_code = 200
+        response.json = Mock(return_value=payload)
+        responses.append(response)
+    return responses
+
+
+# ==============================================================================
+# DeviceMirror
+# ==============================================================================
+class TestDeviceMirror:
+    """Test DeviceMirror bootstrap and incremental sync."""
+
+    def test_bootstrap_emits_added(self, client):
+        """First sync pulls the full inventory and reports every device as added."""
+        devices = [{"did": 1, "hostname": "a"}, {"did": 2, "hostname": "b"}]
+        client._session.request = Mock(side_effect=_responses(devices))
+
+        mirror = DeviceMirror(client.devices)
+        changes = mirror.sync()
+
+        assert [(c.kind, c.did) for c in changes] == [("added", 1), ("added", 2)]
+        assert len(mirror) == 2
+        assert mirror.get(2)["hostname"] == "b"
+        params = client._session.request.call_args[1]["params"]
+        assert "seensince" not in params
+
+    def test_incremental_sync_uses_seensince(self, client):
+        """Later syncs only request recently seen devices and diff them."""
+        client._session.request = Mock(
+            side_effect=_responses(
+                [{"did": 1, "hostname": "a", "lastSeen": 1}, {"did": 2, "hostname": "b", "lastSeen": 1}],
+                [{"did": 1, "hostname": "a", "lastSeen": 2}, {"did": 2, "hostname": "c", "lastSeen": 2}, {"did": 3}],
+            )
+        )
+
+        mirror = DeviceMirror(client.devices, overlap=30)
+        mirror.sync()
+        changes = mirror.sync()
+
+        assert [(c.kind, c.did) for c in changes] == [("changed", 2), ("added", 3)]
+        assert changes[0].previous["hostname"] == "b"
+        params = client._session.request.call_args[1]["params"]
+        assert int(params["seensince"]) >= 30
+
+    def test_full_sync_detects_removals(self, client):
+        """A full pull reports devices missing from the response as removed."""
+        client._session.request = Mock(
+            side_effect=_responses({"devices": [{"did": 1}, {"did": 2}]}, {"devices": [{"did": 2}]})
+        )
+
+        mirror = DeviceMirror(client.devices)
+        mirror.sync()
+        changes = mirror.sync(full=True)
+
+        assert [(c.kind, c.did) for c in changes] == [("removed", 1)]
+        assert 1 not in mirror
+        assert 2 in mirror
+
+
+# ==============================================================================
+# DeviceIndex
+# ==============================================================================
+class TestDeviceIndex:
+    """Test DeviceIndex lookups and refresh."""
+
+    DEVICES = [
+        {
+            "did": 1,
+            "ip": "10.0.0.1",
+            "ips": [{"ip": "10.0.0.1"}, {"ip": "10.0.0.9"}],
+            "macaddress": "AA:BB:CC:00:00:01",
+            "hostname": "Web01",
+            "vendor": "Dell Inc.",
+            "lastSeen": 100,
+        },
+        {"did": 2, "ip": "10.0.0.2", "hostname": "db01", "lastSeen": 100},
+    ]
+
+    def test_lookups(self, client):
+        """Devices resolve by did, any IP, MAC and hostname case-insensitively."""
+        client._session.request = Mock(side_effect=_responses(self.DEVICES))
+
+        index = DeviceIndex(client.devices)
+        assert index.build() == 2
+
+        assert index.by_did(1).hostname == "Web01"
+        assert index.by_ip("10.0.0.9").did == 1
+        assert index.by_mac("aa:bb:cc:00:00:01").did == 1
+        assert index.by_hostname("WEB01").did == 1
+        assert index.by_ip("192.168.0.1") is None
+        assert isinstance(index.by_did(2), DeviceRecord)
+        assert not hasattr(index.by_did(2), "__dict__")
+
+    def test_refresh_reindexes_changed_keys(self, client):
+        """A refresh moves index keys that changed and requests only recent devices."""
+        client._session.request = Mock(
+            side_effect=_responses(self.DEVICES, [{"did": 2, "ip": "10.0.0.3", "hostname": "db01", "lastSeen": 200}])
+        )
+
+        index = DeviceIndex(client.devices)
+        index.build()
+        assert index.refresh() == 1
+
+        assert index.by_ip("10.0.0.2") is None
+        assert index.by_ip("10.0.0.3").did == 2
+        assert index.by_hostname("db01").did == 2
+        assert "seensince" in client._session.request.call_args[1]["params"]
+
+
+# ==============================================================================
+# SubnetResolver
+# ==============================================================================
+class TestSubnetResolver:
+    """Test longest-prefix subnet resolution."""
+
+    SUBNETS = [
+        {"sid": 1, "label": "Corp", "network": "10.0.0.0/8"},
+        {"sid": 2, "label": "Servers", "network": "10.1.0.0/16"},
+        {"sid": 3, "label": "DMZ", "network": "10.1.2.0/24"},
+        {"sid": 4, "label": "V6", "network": "2001:db8::/32"},
+        {"sid": 5, "label": "No network"},
+    ]
+
+    @pytest.fixture
+    def resolver(self, client):
+        client._session.request = Mock(side_effect=_responses(self.SUBNETS))
+        resolver = SubnetResolver(client.subnets)
+        assert resolver.load() == 4
+        return resolver
+
+    def test_longest_prefix_match(self, resolver):
+        """The most specific containing subnet wins."""
+        assert resolver.resolve("10.1.2.3")["label"] == "DMZ"
+        assert resolver.resolve_sid("10.1.9.9") == 2
+        assert resolver.resolve_sid("10.200.0.1") == 1
+        assert resolver.resolve("192.168.0.1") is None
+        assert resolver.resolve_sid("2001:db8::1") == 4
+        assert resolver.resolve_sid(int.from_bytes(bytes([10, 1, 2, 3]), "big")) == 3
+
+    def test_resolve_many(self, resolver):
+        """Batches of strings resolve to one subnet (or None) per input."""
+        results = resolver.resolve_many(["10.1.2.3", "8.8.8.8"])
+        assert results[0]["sid"] == 3
+        assert results[1] is None
+
+    def test_resolve_array(self, resolver):
+        """IPv4 integer arrays resolve vectorized to sids, -1 for misses."""
+        np = pytest.importorskip("numpy")
+        ips = np.array(
+            [
+                int.from_bytes(bytes(octets), "big")
+                for octets in ([10, 1, 2, 3], [10, 1, 9, 9], [10, 9, 0, 1], [8, 8, 8, 8])
+            ],
+            dtype=np.uint32,
+        )
+        assert resolver.resolve_array(ips).tolist() == [3, 2, 1, -1]
+
+    def test_resolve_out_of_range(self, resolver):
+        """Negative and wider-than-32-bit integers never match instead of wrapping."""
+        resolver.compile([{"sid": 7, "network": "0.0.0.0/8"}, {"sid": 8, "network": "255.0.0.0/8"}])
+        assert resolver.resolve_sid(5) == 7 and resolver.resolve_sid(0xFF000001) == 8
+        assert resolver.resolve(1 << 40) is None
+        assert resolver.resolve_sid(-1) is None
+        assert resolver.resolve_sid(1 << 128, version=6) is None
+
+    def test_resolve_array_out_of_range(self, resolver):
+        """Negative and wider-than-32-bit values never match instead of wrapping."""
+        np = pytest.importorskip("numpy")
+        dmz = int.from_bytes(bytes([10, 1, 2, 3]), "big")
+        ips = np.array([dmz, -1, dmz - (1 << 32), dmz + (1 << 32)], dtype=np.int64)
+        assert resolver.resolve_array(ips).tolist() == [3, -1, -1, -1]
+
+    def test_resolve_array_ipv6(self, resolver):
+        """IPv6 addresses resolve through 128-bit keys; invalid entries give -1."""
+        np = pytest.importorskip("numpy")
+        resolver.compile(self.SUBNETS + [{"sid": 6, "network": "2001:db8:0:0:8000::/65"}])
+        ips = np.array(
+            [
+                int(ipaddress.ip_address("2001:db8::1")),
+                int(ipaddress.ip_address("2001:db8::8000:0:0:1")),
+                int(ipaddress.ip_address("2001:db9::1")),
+                -1,
+                1 << 128,
+            ],
+            dtype=object,
+        )
+        assert resolver.resolve_array(ips, version=6).tolist() == [4, 6, -1, -1, -1]
+        assert resolver.resolve_array(np.array([1, 2], dtype=np.uint64), version=6).tolist() == [-1, -1]
+
+
+# ==============================================================================
+# EnumDecoder
+# ==============================================================================
+class TestEnumDecoder:
+    """Test local enum decoding."""
+
+    # Shape of the real /enums response: plural keys, string codes
+    ENUMS = {
+        "countries": {"0": "Unknown", "276": "Germany"},
+        "protocols": {"0": "Unknown", "6": "TCP", "17": "UDP", "80": "HTTP"},
+        "devicetypes": {"0": "Unknown", "1": "Server", "2": "Desktop"},
+        "severities": {"0": "Informational", "3": "High"},
+    }
+
+    def test_decode_nested_response(self, client):
+        """Singular, aliased and mapped fields are decoded in place, including nested ones."""
+        client._session.request = Mock(side_effect=_responses(self.ENUMS))
+        decoder = EnumDecoder(client.enums, fields={"srcproto": "protocols"})
+        events = [
+            {"protocol": 6, "applicationprotocol": 80, "typeid": 2, "did": 5},
+            {"protocol": 99, "srcproto": 17, "nested": {"Country": 276, "severity": 3}},
+        ]
+
+        result = decoder.decode(events)
+
+        assert result is events
+        assert events[0] == {"protocol": "TCP", "applicationprotocol": "HTTP", "typeid": "Desktop", "did": 5}
+        assert events[1]["protocol"] == 99 and events[1]["srcproto"] == "UDP"
+        assert events[1]["nested"] == {"Country": "Germany", "severity": "High"}
+
+    def test_enums_cached(self, client):
+        """/enums is fetched once and reused within the TTL."""
+        client._session.request = Mock(side_effect=_responses(self.ENUMS))
+        decoder = EnumDecoder(client.enums)
+
+        assert decoder.lookup("Protocol", 17) == "UDP"
+        assert decoder.lookup("protocols", 6) == "TCP"
+        assert decoder.decode_column("devicetype", [1, 2, 9]) == ["Server", "Desktop", 9]
+        assert decoder.resolve("did") is None
+        decoder.decode([{"protocol": 6}], fields=["protocol"])
+        assert client._session.request.call_count == 1
+
+
+# ==============================================================================
+# ModelCatalog
+# ==============================================================================
+class TestModelCatalog:
+    """Test the joined models/components/filtertypes catalog."""
+
+    PAYLOADS = {
+        "/models": [
+            {"uuid": "u-1", "pid": 1, "name": "Beaconing", "logic": {"type": "componentList", "data": [10, 11]}},
+            {
+                "uuid": "u-2",
+                "pid": 2,
+                "name": "Scanning",
+                "logic": {"type": "weightedComponentList", "data": [{"cid": 11, "weight": 1}]},
+            },
+        ],
+        "/components": [
+            {"cid": 10, "filters": [{"filtertype": "Direction"}, {"filtertype": "Destination port"}]},
+            {"cid": 11, "filters": [{"filtertype": "Connection hostname"}]},
+        ],
+        "/filtertypes": [{"filtertype": "Direction", "valuetype": "enum"}],
+    }
+
+    @pytest.fixture
+    def catalog(self, client):
+        def request(method, url, **kwargs):
+            return _responses(self.PAYLOADS[url.replace(client.host, "")])[0]
+
+        client._session.request = Mock(side_effect=request)
+        return ModelCatalog(client.models, client.components, client.filtertypes)
+
+    def test_indexes(self, catalog):
+        """Models, components and filter types resolve through the indexes."""
+        assert catalog.model(pid=1)["name"] == "Beaconing"
+        assert catalog.model(uuid="u-2")["pid"] == 2
+        assert [c["cid"] for c in catalog.components_of(pid=1)] == [10, 11]
+        assert catalog.filters_of(uuid="u-1") == {"Direction", "Destination port", "Connection hostname"}
+        assert [m["pid"] for m in catalog.models_using_filter("Connection hostname")] == [1, 2]
+        assert [m["pid"] for m in catalog.models_using_filter("Direction")] == [1]
+        assert [m["pid"] for m in catalog.models_using_component(11)] == [1, 2]
+        assert catalog.filtertype("Direction")["valuetype"] == "enum"
+
+    def test_model_for_breach(self, catalog):
+        """Breach model metadata resolves from full and minimal breach shapes."""
+        assert catalog.model_for_breach({"model": {"then": {"uuid": "u-2", "pid": 2}}})["name"] == "Scanning"
+        assert catalog.model_for_breach({"model": 1})["name"] == "Beaconing"
+        assert catalog.model_for_breach({"model": {"then": {"pid": 99}}}) is None
+
+    def test_loaded_once(self, client, catalog):
+        """All three endpoints are fetched once and cached."""
+        catalog.model(pid=1)
+        catalog.models_using_filter("Direction")
+        assert client._session.request.call_count == 3
+
+
+# ==============================================================================
+# IntelMatcher
+# ==============================================================================
+class TestIntelMatcher:
+    """Test local matching of hostnames and IPs against IntelFeed entries."""
+
+    ENTRIES = [
+        {"name": "Evil.com", "expiry": None, "hostname": False},
+        {"name": "c2.bad.org", "expiry": "2099-01-01T00:00:00Z", "hostname": True},
+        {"name": "gone.net", "expiry": "2000-01-01T00:00:00Z"},
+        {"name": "203.0.113.0/24"},
+        {"name": "198.51.100.7", "expiry": 4_102_444_800_000},
+        "2001:db8::/32",
+    ]
+
+    @pytest.fixture
+    def matcher(self, client):
+        client._session.request = Mock(side_effect=_responses(self.ENTRIES))
+        matcher = IntelMatcher(client.intelfeed, source="feed")
+        assert matcher.load() == 5
+        params = client._session.request.call_args[1]["params"]
+        assert params == {"source": "feed", "fulldetails": "true"}
+        return matcher
+
+    def test_domains_and_hostnames(self, matcher):
+        """Domain entries match subdomains; hostname entries match only exactly."""
+        assert matcher.match("evil.com")["name"] == "Evil.com"
+        assert matcher.match("A.B.EVIL.COM.")["name"] == "Evil.com"
+        assert matcher.match("notevil.com") is None
+        assert matcher.match("c2.bad.org")["name"] == "c2.bad.org"
+        assert matcher.match("x.c2.bad.org") is None
+        assert matcher.match("gone.net") is None
+
+    def test_ips_cidrs_and_expiry(self, matcher):
+        """IPs match exact entries and containing CIDRs until they expire."""
+        assert matcher.match("203.0.113.200")["name"] == "203.0.113.0/24"
+        assert matcher.match("198.51.100.7")["name"] == "198.51.100.7"
+        assert matcher.match("198.51.100.8") is None
+        assert matcher.match("2001:db8::1") == {"name": "2001:db8::/32"}
+        assert matcher.match("198.51.100.7", now=4_102_444_800) is None
+
+    def test_batch_apis(self, matcher):
+        """Columns and details events are matched value by value."""
+        assert [hit and hit["name"] for hit in matcher.match_many(["a.evil.com", None, "ok.org", "a.evil.com"])] == [
+            "Evil.com",
+            None,
+            None,
+            "Evil.com",
+        ]
+        events = [
+            {"uid": "C1", "destination": "cdn.evil.com", "sourceDevice": {"ip": "10.0.0.1"}},
+            {"uid": "C2", "destinationDevice": {"ip": "203.0.113.9"}},
+            {"uid": "C3", "destination": "example.org"},
+        ]
+        hits = matcher.match_events(events)
+        assert [(event["uid"], field) for event, field, _ in hits] == [
+            ("C1", "destination"),
+            ("C2", "destinationDevice.ip"),
+        ]
+
+
+# ==============================================================================
+# TagIndex
+# ==============================================================================
+class TestTagIndex:
+    """Test tag/subnet/type membership bitmaps and set algebra."""
+
+    PAYLOADS = {
+        "/devices": [
+            {"did": 10, "sid": 12, "typename": "desktop"},
+            {"did": 11, "sid": 12, "typename": "server"},
+            {"did": 12, "sid": 13, "typename": "server"},
+            {"did": 13, "sid": 12, "typename": "Desktop"},
+        ],
+        "/tags": [{"tid": 1, "name": "Critical"}, {"tid": 2, "name": "Ignored"}],
+        "/tags/1/entities": [
+            {"teid": 100, "entityType": "Device", "entityValue": "10"},
+            {"teid": 101, "entityType": "Device", "entityValue": "11"},
+            {"teid": 102, "entityType": "Device", "entityValue": "12"},
+            {"teid": 103, "entityType": "Credential", "entityValue": "bob"},
+        ],
+        "/tags/2/entities": [{"teid": 200, "entityType": "Device", "entityValue": "11"}],
+    }
+
+    @pytest.fixture
+    def index(self, client):
+        def request(method, url, **kwargs):
+            return _responses(self.PAYLOADS[url.replace(client.host, "")])[0]
+
+        client._session.request = Mock(side_effect=request)
+        index = TagIndex(client.tags, client.devices)
+        index.load()
+        return index
+
+    def test_set_algebra(self, index):
+        """Tag, subnet and type sets combine with set operators."""
+        assert (index.tag("critical") & index.subnet(12) - index.tag("Ignored")).dids() == [10]
+        assert sorted(index.type("desktop") | index.tag("ignored")) == [10, 11, 13]
+        assert sorted(~index.tag("Critical")) == [13]
+        assert (index.subnet(12) ^ index.type("server")).dids() == [10, 12, 13]
+        assert len(index.all()) == 4
+        assert 11 in index.tag("Ignored") and 10 not in index.tag("Ignored")
+        assert not index.tag("unknown")
+        assert index.devices([13, 999]) == index.all() - index.tag("Critical")
+        assert index.tags == ["critical", "ignored"]
+
+    def test_sets_from_other_index_rejected(self, client, index):
+        """Combining sets from different indexes is an error."""
+        other = TagIndex(client.tags, client.devices)
+        with pytest.raises(ValueError):
+            index.all() & other.all()
@@ -396,6 +396,9 @@ class TestEndpointSignatures:
         assert hasattr(client.antigena, "clear_action")
         assert hasattr(client.antigena, "reactivate_action")
         assert hasattr(client.antigena, "create_manual_action")
+        assert hasattr(client.antigena, "bulk_create_actions")
+        assert hasattr(client.antigena, "bulk_extend_actions")
+        assert hasattr(client.antigena, "bulk_clear_actions")
 
     def test_breaches_methods(self, client):
         """Test ModelBreaches endpoint methods exist."""
@@ -404,6 +407,9 @@ class TestEndpointSignatures:
         assert hasattr(client.breaches, "add_comment")
         assert hasattr(client.breaches, "acknowledge")
         assert hasattr(client.breaches, "unacknowledge")
+        assert hasattr(client.breaches, "bulk_acknowledge")
+        assert hasattr(client.breaches, "bulk_unacknowledge")
+        assert hasattr(client.breaches, "get_comments_bulk")
         assert hasattr(client.breaches, "acknowledge_with_comment")
         assert hasattr(client.breaches, "unacknowledge_with_comment")
 
@@ -421,11 +427,13 @@ class TestEndpointSignatures:
         """Test Details endpoint methods exist."""
         assert hasattr(client.details, "get")
         assert callable(client.details.get)
+        assert hasattr(client.details, "export")
 
     def test_devices_methods(self, client):
         """Test Devices endpoint methods exist."""
         assert hasattr(client.devices, "get")
         assert hasattr(client.devices, "update")
+        assert hasattr(client.devices, "bulk_update")
         assert callable(client.devices.get)
         assert callable(client.devices.update)
 
@@ -461,6 +469,7 @@ class TestEndpointSignatures:
         assert hasattr(client.email, "get_email")
         assert hasattr(client.email, "download_email")
         assert hasattr(client.email, "search_emails")
+        assert hasattr(client.email, "bulk_email_action")
         assert hasattr(client.email, "get_tags")
         assert hasattr(client.email, "get_actions")
         assert hasattr(client.email, "get_filters")
@@ -489,6 +498,7 @@ class TestEndpointSignatures:
         assert hasattr(client.intelfeed, "get_by_source")
         assert hasattr(client.intelfeed, "get_with_details")
         assert hasattr(client.intelfeed, "update")
+        assert hasattr(client.intelfeed, "sync")
 
     def test_mbcomments_methods(self, client):
         """Test MBComments endpoint methods exist."""
@@ -500,6 +510,8 @@ class TestEndpointSignatures:
     def test_metricdata_methods(self, client):
         """Test MetricData endpoint methods exist."""
         assert hasattr(client.metricdata, "get")
+        assert hasattr(client.metricdata, "get_frame")
+        assert hasattr(client.metricdata, "get_matrix")
         assert callable(client.metricdata.get)
 
     def test_metrics_methods(self, client):
@@ -538,6 +550,7 @@ class TestEndpointSignatures:
         """Test Subnets endpoint methods exist."""
         assert hasattr(client.subnets, "get")
         assert hasattr(client.subnets, "post")
+        assert hasattr(client.subnets, "bulk_import")
         assert callable(client.subnets.get)
         assert callable(client.subnets.post)
 
@@ -557,6 +570,9 @@ class TestEndpointSignatures:
         assert hasattr(client.tags, "get_tag_entities")
         assert hasattr(client.tags, "post_tag_entities")
         assert hasattr(client.tags, "delete_tag_entity")
+        assert hasattr(client.tags, "resolve_tag_ids")
+        assert hasattr(client.tags, "bulk_tag")
+        assert hasattr(client.tags, "bulk_untag")
 
 
 # ==============================================================================
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Mock tests for columnar/tabular conversions of endpoint data.
+
+Covers helpers that turn nested JSON responses into column arrays
+(MetricData frames and matrices, Details exports, ...). NumPy- and pyarrow-dependent
+tests are skipped when those packages are not installed.
+
+All tests use mocks — no live API calls.
+
+Run: pytest tests/test_tabular.py -v
+"""
+
+import json
+import math
+from unittest.mock import Mock
+
+import pytest
+
+from darktrace import DarktraceClient
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+@pytest.fixture
+def client():
+    """Create a DarktraceClient instance for testing."""
+    return DarktraceClient(
+        host="https://test.example.com",
+        public_token="test_public",
+        private_token="test_private",
+    )
+
+
+def _response(payload):
+    """Build a mock response returning ``payload``."""
+    response = Mock()
+    response.status_code = 200
+    response.json = Mock(return_value=payload)
+    return response
+
+
+# ==============================================================================
+# MetricData.get_frame
+# ==============================================================================
+class TestMetricDataFrame:
+    """Test columnar parsing of /metricdata responses."""
+
+    def test_aligns_series_on_interval_grid(self, client):
+        """Each metric becomes a column on a shared grid, with NaN for gaps."""
+        pytest.importorskip("numpy")
+        client._session.request = Mock(
+            return_value=_response(
+                [
+                    {
+                        "metric": "externalconnections",
+                        "did": 7,
+                        "data": [{"timems": 0, "size": 1}, {"timems": 120_000, "size": 3}],
+                    },
+                    {"metric": "internalconnections", "data": [[60_000, 5], [120_000, 6]]},
+                ]
+            )
+        )
+
+        frame = client.metricdata.get_frame(metrics=["externalconnections", "internalconnections"], interval="1min")
+
+        assert frame["timems"].tolist() == [0, 60_000, 120_000]
+        external = frame["externalconnections:7"].tolist()
+        assert external[0] == 1 and math.isnan(external[1]) and external[2] == 3
+        internal = frame["internalconnections"].tolist()
+        assert math.isnan(internal[0]) and internal[1:] == [5, 6]
+
+    def test_union_of_timestamps_without_interval(self, client):
+        """Without an interval the timestamp vector is the union of all points."""
+        pytest.importorskip("numpy")
+        client._session.request = Mock(
+            return_value=_response(
+                {
+                    "metric": "bandwidth",
+                    "data": [
+                        {"timestamp": 10, "value": 1.5, "device": {"did": 1}},
+                        {"timestamp": 30, "value": 2.5, "device": {"did": 2}},
+                    ],
+                }
+            )
+        )
+
+        frame = client.metricdata.get_frame(metric="bandwidth")
+
+        assert frame["timems"].tolist() == [10, 30]
+        assert frame["bandwidth:1"].tolist()[0] == 1.5
+        assert frame["bandwidth:2"].tolist()[1] == 2.5
+
+    def test_rejects_unknown_output(self, client):
+        """Unsupported output formats are rejected before any request."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            client.metricdata.get_frame(metric="bandwidth", output="csv")
+
+
+# ==============================================================================
+# MetricData.get_matrix
+# ==============================================================================
+class TestMetricDataMatrix:
+    """Test the devices × metrics × time matrix fetch."""
+
+    def test_matrix_shape_and_holes(self, client):
+        """One request per device/metric fills a preallocated matrix; failures stay NaN."""
+        np = pytest.importorskip("numpy")
+
+        def request(method, url, **kwargs):
+            params = kwargs["params"]
+            if params["did"] == 2 and params["metric"] == "b":
+                response = _response({})
+                response.status_code = 400
+                response.reason = "Bad Request"
+                response.url = url
+                return response
+            value = params["did"] * 10 + (1 if params["metric"] == "a" else 2)
+            return _response([{"metric": params["metric"], "data": [{"timems": 60_000, "size": value}]}])
+
+        client._session.request = Mock(side_effect=request)
+
+        matrix = client.metricdata.get_matrix(["a", "b"], [1, 2], starttime=0, endtime=120_000, interval="1min")
+
+        assert matrix["values"].shape == (2, 2, 3)
+        assert matrix["timems"].tolist() == [0, 60_000, 120_000]
+        assert matrix["values"][:, :, 1].tolist()[0] == [11, 12]
+        assert matrix["values"][1, 0, 1] == 21
+        assert np.isnan(matrix["values"][1, 1]).all()
+        assert np.isnan(matrix["values"][:, :, 0]).all()
+        assert [(f["did"], f["metric"]) for f in matrix["failed"]] == [(2, "b")]
+        assert client._session.request.call_count == 4
+
+    def test_grid_aligned_to_interval(self, client):
+        """The grid starts at the interval boundary so the first server bucket is kept."""
+        pytest.importorskip("numpy")
+        client._session.request = Mock(
+            return_value=_response(
+                [{"metric": "a", "data": [{"timems": 60_000, "size": 5}, {"timems": 120_000, "size": 6}]}]
+            )
+        )
+
+        matrix = client.metricdata.get_matrix(["a"], [1], starttime=90_000, endtime=150_000, interval="1min")
+
+        assert matrix["timems"].tolist() == [60_000, 120_000]
+        assert matrix["values"][0, 0].tolist() == [5, 6]
+
+    def test_rejects_int_dtype_and_multiple_series(self, client):
+        """Integer dtypes cannot hold NaN; several series per request are ambiguous."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            client.metricdata.get_matrix(["a"], [1], starttime=0, endtime=60_000, interval="1min", dtype="int64")
+
+        series = [
+            {"metric": "a", "data": [{"timems": 0, "size": 1}]},
+            {"metric": "a", "data": [{"timems": 0, "size": 2}]},
+        ]
+        client._session.request = Mock(return_value=_response(series))
+        with pytest.raises(ValueError, match="2 series"):
+            client.metricdata.get_matrix(["a"], [1], starttime=0, endtime=60_000, interval="1min")
+
+
+# ==============================================================================
+# Details.export
+# ==============================================================================
+class TestDetailsExport:
+    """Test windowed export of details events to files."""
+
+    DAY_MS = 86_400_000
+    EVENTS = [
+        {
+            "timems": 1000,
+            "time": "1970-01-01 00:00:01",
+            "eventType": "connection",
+            "uid": "C1",
+            "sourcePort": 51000,
+            "destinationPort": 443,
+            "protocol": "TCP",
+            "sourceDevice": {"did": 1, "ip": "10.0.0.1"},
+            "destinationDevice": {"ip": "1.2.3.4", "hostname": "example.com"},
+        },
+        {"timems": 2000, "uid": "C2", "destinationPort": "bogus"},
+    ]
+
+    def _client(self, client):
+        def request(method, url, **kwargs):
+            start = kwargs["params"]["starttime"]
+            return _response(self.EVENTS if start in (0, self.DAY_MS) else [])
+
+        client._session.request = Mock(side_effect=request)
+        return client
+
+    def test_ndjson_partitions_by_day(self, client, tmp_path):
+        """Each non-empty window is appended to the file for its UTC day."""
+        self._client(client)
+
+        summary = client.details.export(
+            str(tmp_path), 0, 2 * self.DAY_MS - 1, window=self.DAY_MS // 2, format="ndjson", did=1
+        )
+
+        assert summary["rows"] == 4 and summary["format"] == "ndjson"
+        assert [p.rsplit("/", 2)[1] for p in summary["files"]] == ["date=1970-01-01", "date=1970-01-02"]
+        with open(summary["files"][0]) as handle:
+            assert [json.loads(line)["uid"] for line in handle] == ["C1", "C2"]
+        windows = [call[1]["params"] for call in client._session.request.call_args_list]
+        assert [(w["starttime"], w["endtime"]) for w in windows][:2] == [
+            (0, self.DAY_MS // 2 - 1),
+            (self.DAY_MS // 2, self.DAY_MS - 1),
+        ]
+
+    def test_parquet_stable_schema(self, client, tmp_path):
+        """Parquet output has typed, flattened columns; mistyped values become null."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        self._client(client)
+
+        summary = client.details.export(str(tmp_path), 0, self.DAY_MS - 1, window=self.DAY_MS, did=1)
+
+        table = pq.read_table(summary["files"][0])
+        assert summary["format"] == "parquet"
+        assert str(table.schema.field("timems").type) == "int64"
+        assert table.column("destinationHostname").to_pylist() == ["example.com", None]
+        assert table.column("destinationPort").to_pylist() == [443, None]
+        assert table.column("sourceDid").to_pylist() == [1, None]